@@ -30,12 +30,6 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-"""
-BaseImage: Provides a class to perform basic image loading an manipulation with pygame.
-"""
-# noinspection PyUnresolvedReferences
-import pygameMenu.baseimage
-
 """
 Controls: Default controls of menu object and key definition.
 """
@@ -48,24 +42,12 @@ Events: Menu events definition and locals.
 # noinspection PyUnresolvedReferences
 import pygameMenu.events
 
-"""
-Fonts: Menu fonts.
-"""
-# noinspection PyUnresolvedReferences
-import pygameMenu.font
-
 """
 Locals: Local constants.
 """
 # noinspection PyUnresolvedReferences
 import pygameMenu.locals
 
-"""
-Sound: Sound class.
-"""
-# noinspection PyUnresolvedReferences
-import pygameMenu.sound
-
 """
 Version: Library version.
 """
@@ -73,10 +55,58 @@ Version: Library version.
 import pygameMenu.version
 
 """
-Menu: Menu class.
+Lazy modules: imported on first access, as the Menu class.
+    - BaseImage: Provides a class to perform basic image loading an manipulation with pygame.
+    - Fonts: Menu fonts.
+    - Sound: Sound class.
+    - Widgets: Widgets elements that can be added to the menu.
 """
-# noinspection PyUnresolvedReferences
-from pygameMenu.menu import Menu
+import sys as _sys
+
+_LAZY_MODULES = ('baseimage', 'font', 'sound', 'widgets')
+
+# Public names, the lazy ones are imported by "from pygameMenu import *"
+__all__ = ['Menu', 'controls', 'events', 'locals', 'version'] + list(_LAZY_MODULES)
+
+if _sys.version_info >= (3, 7):
+    import importlib as _importlib
+
+
+    def __getattr__(name):
+        """
+        Import the lazy modules and the Menu class on first access.
+
+        :param name: Attribute name
+        :type name: str
+        :return: Module or class
+        """
+        if name in _LAZY_MODULES:
+            return _importlib.import_module('pygameMenu.' + name)
+        if name == 'Menu':
+            from pygameMenu.menu import Menu as _Menu
+            globals()['Menu'] = _Menu
+            return _Menu
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+
+    def __dir__():
+        """
+        List the attributes of the module, including the lazy ones.
+
+        :return: Attribute names
+        :rtype: list
+        """
+        return sorted(set(globals()) | set(__all__))
+
+else:  # Module __getattr__ is not supported, import everything
+    # noinspection PyUnresolvedReferences
+    import pygameMenu.baseimage
+    # noinspection PyUnresolvedReferences
+    import pygameMenu.font
+    # noinspection PyUnresolvedReferences
+    import pygameMenu.sound
+    # noinspection PyUnresolvedReferences
+    from pygameMenu.menu import Menu
 
 """
 Metadata: Information about the project.
@@ -0,0 +1,74 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+ASYNC MAINLOOP
+Mainloop of the Menu as an asyncio coroutine (Python 3.5+).
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import asyncio
+
+import pygame
+
+
+async def mainloop_async(menu, surface, bgfun=None, fps_limit=30):
+    """
+    Update and draw the Menu once per frame until it is disabled, sleeping
+    the rest of each frame. See :py:meth:`pygameMenu.menu.Menu.mainloop_async`.
+
+    :param menu: Menu object
+    :type menu: pygameMenu.menu.Menu
+    :param surface: Pygame surface to draw the Menu
+    :type surface: pygame.surface.SurfaceType
+    :param bgfun: Background function called on each loop iteration before drawing the Menu
+    :type bgfun: callable
+    :param fps_limit: Limit frame per second of the loop, if 0 there's no limit
+    :type fps_limit: int, float
+    :return: None
+    """
+    if not menu.is_enabled():
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except AttributeError:  # Python<3.7
+        loop = asyncio.get_event_loop()
+    menu._background_function = bgfun
+    try:
+        while True:
+            frame_start = loop.time()
+            menu._mainloop_step(surface, pygame.event.get())
+            if not menu.is_enabled():
+                return
+
+            # Let the other tasks run during the rest of the frame
+            delay = 0
+            if fps_limit > 0:
+                delay = max(0.0, 1.0 / fps_limit - (loop.time() - frame_start))
+            await asyncio.sleep(delay)
+    finally:
+        menu._background_function = None
@@ -31,6 +31,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import os.path as _path
+import weakref as _weakref
 import pygame
 
 # https://www.pygame.org/docs/ref/image.html
@@ -46,18 +47,95 @@ IMAGE_GRAY_LINES = __fontdir.format(__actualpath, 'gray_lines.png')
 IMAGE_METAL = __fontdir.format(__actualpath, 'metal.png')
 IMAGE_PYGAME_MENU = __fontdir.format(__actualpath, 'pygame_menu.png')
 
+# Surfaces shared by the images, by (path, transformations...). The surfaces
+# are kept while an image references them
+_cache = _weakref.WeakValueDictionary()
+
+
+def get_image_cache_info():
+    """
+    Return the number of surfaces shared by the images.
+
+    :return: Dict with the key 'entries'
+    :rtype: dict
+    """
+    return {'entries': len(_cache)}
+
+
+def _transform(surface, step):
+    """
+    Apply a transformation of a key to a surface.
+
+    :param surface: Source surface
+    :type surface: pygame.surface.SurfaceType
+    :param step: Transformation (name, arguments...)
+    :type step: tuple
+    :return: New surface
+    :rtype: pygame.surface.SurfaceType
+    """
+    name = step[0]
+    if name == 'flip':
+        return pygame.transform.flip(surface, step[1], step[2])
+    elif name == 'rotate':
+        return pygame.transform.rotate(surface, step[1])
+    elif name == 'scale2x':
+        return pygame.transform.scale2x(surface)
+    w, h = surface.get_size()
+    size = (int(w * step[1]), int(h * step[2]))
+    if step[3]:
+        return pygame.transform.smoothscale(surface, size)
+    return pygame.transform.scale(surface, size)
+
+
+def _get_shared_surface(key):
+    """
+    Return the shared surface of a key. If the surface is not in the cache,
+    the transformations are applied to the longest cached prefix of the key,
+    or to the loaded file.
+
+    :param key: Image path followed by the transformations
+    :type key: tuple
+    :return: Shared surface
+    :rtype: pygame.surface.SurfaceType
+    """
+    surface = _cache.get(key)
+    if surface is not None:
+        return surface
+    n = len(key) - 1
+    while n > 0:
+        surface = _cache.get(key[:n])
+        if surface is not None:
+            break
+        n -= 1
+    if surface is None:
+        surface = pygame.image.load(key[0])  # type: pygame.SurfaceType
+        n = 1
+    for step in key[n:]:
+        surface = _transform(surface, step)
+    _cache[key] = surface
+    return surface
+
 
 class BaseImage(object):
     """
     Object that loads an image, stores as a surface, transform it and
     let write the image to an surface.
 
+    The images with the same file and transformations share the same
+    surface, which is loaded and transformed once. The surface is copied
+    the first time it is requested to be modified, see
+    :py:meth:`BaseImage.get_surface`. Callers that only read the surface
+    (blit, size) should use ``get_surface(shared=True)`` to keep sharing it.
+
     :param image_path: Path of the image to be loaded
     :type image_path: basestring
+    :param keep_original: Keep the original surface used by :py:meth:`BaseImage.restore`
+    :type keep_original: bool
     """
 
-    def __init__(self, image_path):
+    def __init__(self, image_path, keep_original=True):
         assert isinstance(image_path, str)
+        assert isinstance(keep_original, bool)
         _, file_extension = _path.splitext(image_path)
         file_extension = file_extension.lower()
 
@@ -70,9 +148,31 @@ class BaseImage(object):
         self._filename = _path.splitext(_path.basename(image_path))[0]
         self._extension = file_extension
 
-        # Load the image and store as a surface
-        self._surface = pygame.image.load(image_path)  # type: pygame.SurfaceType
-        self._original_surface = self._surface.copy()
+        # Key of the shared surface, None if the surface belongs to the image.
+        # The shared surface is requested when it is needed
+        self._key = (image_path,)  # type: (tuple,None)
+        self._surface = None  # type: (pygame.SurfaceType,None)
+        self._original_key = None  # type: (tuple,None)
+        self._original_surface = None  # type: (pygame.SurfaceType,None)
+        if keep_original:
+            self.checkpoint()
+
+    def _add_transform(self, *step):
+        """
+        Apply a transformation to the image. If the image surface is shared,
+        the surface of the new key is used instead.
+
+        :param step: Transformation (name, arguments...)
+        :type step: tuple
+        :return: None
+        """
+        if self._key is None:
+            self._surface = _transform(self._surface, step)
+            return
+        key = self._key + (step,)
+        if self._surface is not None:
+            self._surface = _get_shared_surface(key)
+        self._key = key
 
     def get_size(self):
         """
@@ -81,15 +181,27 @@ class BaseImage(object):
         :return: (width,height)
         :rtype: tuple
         """
-        return self._surface.get_width(), self._surface.get_height()
+        return self.get_surface(shared=True).get_size()
 
-    def get_surface(self):
+    def get_surface(self, shared=False):
         """
         Return the surface object.
 
+        The surface shared by the images with the same file and transformations
+        is copied the first time, so it can be modified. With ``shared=True``
+        the shared surface is returned without copying, it must not be modified.
+
+        :param shared: Return the shared surface
+        :type shared: bool
         :return: Image surface
         :rtype: pygame.surface.SurfaceType
         """
+        assert isinstance(shared, bool)
+        if self._surface is None:
+            self._surface = _get_shared_surface(self._key)
+        if self._key is not None and not shared:
+            self._surface = self._surface.copy()
+            self._key = None
         return self._surface
 
     def get_namefile(self):
@@ -116,8 +228,12 @@ class BaseImage(object):
         :rtype: bool
         """
         assert isinstance(image, BaseImage)
-        im1 = pygame.image.tostring(self._surface, 'RGBA')
-        im2 = pygame.image.tostring(image._surface, 'RGBA')
+        surface1 = self.get_surface(shared=True)
+        surface2 = image.get_surface(shared=True)
+        if surface1 is surface2:
+            return True
+        im1 = pygame.image.tostring(surface1, 'RGBA')
+        im2 = pygame.image.tostring(surface2, 'RGBA')
         return im1 == im2
 
     def restore(self):
@@ -126,15 +242,36 @@ class BaseImage(object):
 
         :return: None
         """
-        self._surface = self._original_surface.copy()
+        assert self._original_key is not None or self._original_surface is not None, \
+            'the original surface was not kept, use keep_original or checkpoint()'
+        self._key = self._original_key
+        if self._key is None:
+            self._surface = self._original_surface.copy()
+        else:
+            self._surface = None  # The shared surface is requested when it is needed
 
     def checkpoint(self):
         """
-        Updates the original surface to the current surface.
+        Updates the original surface to the current surface. A shared surface
+        is kept by its key, it is not loaded until it is needed.
+
+        :return: None
+        """
+        self._original_key = self._key
+        if self._key is None:
+            self._original_surface = self._surface.copy()
+        else:
+            self._original_surface = None
+
+    def drop_original(self):
+        """
+        Release the original surface if :py:meth:`BaseImage.restore` is not
+        needed anymore.
 
         :return: None
         """
-        self._original_surface = self._surface.copy()
+        self._original_key = None
+        self._original_surface = None
 
     def flip(self, x, y):
         """
@@ -150,7 +287,7 @@ class BaseImage(object):
         assert isinstance(x, bool)
         assert isinstance(y, bool)
         assert not (x and y), 'at least one axis should be True'
-        self._surface = pygame.transform.flip(self._surface, x, y)
+        self._add_transform('flip', x, y)
 
     def scale(self, width, height, smooth=False):
         """
@@ -168,11 +305,7 @@ class BaseImage(object):
         assert isinstance(height, (int, float))
         assert isinstance(smooth, bool)
         assert width > 0 and height > 0, 'width and height must be greater than zero'
-        w, h = self.get_size()
-        if not smooth:
-            self._surface = pygame.transform.scale(self._surface, (int(w * width), int(h * height)))
-        else:
-            self._surface = pygame.transform.smoothscale(self._surface, (int(w * width), int(h * height)))
+        self._add_transform('scale', width, height, smooth)
 
     def scale2x(self):
         """
@@ -185,7 +318,7 @@ class BaseImage(object):
 
         :return: None
         """
-        self._surface = pygame.transform.scale2x(self._surface)
+        self._add_transform('scale2x')
 
     def resize(self, width, height, smooth=False):
         """
@@ -215,7 +348,7 @@ class BaseImage(object):
         :return: Pygame rect object
         :rtype: pygame.rect.RectType
         """
-        return self._surface.get_rect()
+        return self.get_surface(shared=True).get_rect()
 
     def rotate(self, angle):
         """
@@ -232,4 +365,4 @@ class BaseImage(object):
         :return: None
         """
         assert isinstance(angle, (int, float))
-        self._surface = pygame.transform.rotate(self._surface, angle)
+        self._add_transform('rotate', angle)
@@ -32,6 +32,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os.path as path
 import pygame.font as _font
+import pygameMenu.trace as _trace
 
 # Get actual folder
 __actualpath = str(path.abspath(path.dirname(__file__))).replace('\\', '/')
@@ -48,6 +49,13 @@ FONT_NEVIS = __fontdir.format(__actualpath, 'nevis')
 FONT_OPEN_SANS = __fontdir.format(__actualpath, 'open_sans')
 FONT_PT_SERIF = __fontdir.format(__actualpath, 'pt_serif')
 
+# Loaded fonts, shared by (path, size), and resolved system font names
+_cache = {}
+_paths = {}
+
+# Metrics of the fonts, shared by the widgets using the same font object
+_metrics = {}
+
 
 def get_font(name, size):
     """
@@ -72,10 +80,22 @@ def get_font(name, size):
         if size <= 0:
             raise ValueError('Font size cannot be lower or equal than zero')
 
+        # Fonts are shared, the widgets must not change their style
+        name = _paths.get(name, name)
+        font = _cache.get((name, size))  # type: (_font.FontType,None)
+        if font is not None:
+            return font
+
         # Font is not a file, then use a system font
         if not path.isfile(name):
             font_name = name
+            if _trace.tracer is not None:
+                _trace.tracer.begin('font.match_font', 'font', {'name': font_name})
             name = _font.match_font(font_name)
+            if _trace.tracer is not None:
+                _trace.tracer.end()
+            if name is not None:
+                _paths[font_name] = name
 
             if name is None:  # Show system available fonts
                 from difflib import SequenceMatcher
@@ -117,13 +137,191 @@ def get_font(name, size):
                                                         sys_message_2))
 
         # Try to load the font
-        font = None  # type: (_font.FontType,None)
+        if _trace.tracer is not None:
+            _trace.tracer.begin('font.get_font', 'font', {'name': name, 'size': size})
         try:
             font = _font.Font(name, size)
         except IOError:
             pass
+        if _trace.tracer is not None:
+            _trace.tracer.end()
 
         # If font was not loaded throw an exception
         if font is None:
             raise IOError('Font file "{0}" cannot be loaded'.format(font))
+        _cache[(name, size)] = font
         return font
+
+
+def clear_font_cache(name=None):
+    """
+    Remove the loaded fonts from the cache, the widgets keep using the fonts
+    they already have. If the name is given, only the fonts of this name or
+    file are removed, otherwise the cache and the resolved system font names
+    are cleared.
+
+    :param name: Font name or path, None removes all fonts
+    :type name: basestring, NoneType
+    :return: None
+    """
+    if name is None:
+        _cache.clear()
+        _metrics.clear()
+        _paths.clear()
+        return
+    name = _paths.pop(name, name)
+    for key in list(_cache.keys()):
+        if key[0] == name:
+            _metrics.pop(_cache.pop(key), None)
+
+
+def get_font_metrics(font):
+    """
+    Return the metrics of a font, shared by all the widgets using it.
+
+    :param font: Font object
+    :type font: pygame.font.FontType
+    :return: Font metrics
+    :rtype: FontMetrics
+    """
+    metrics = _metrics.get(font)
+    if metrics is None:
+        metrics = FontMetrics(font)
+        _metrics[font] = metrics
+    return metrics
+
+
+def _common_prefix_length(text1, text2):
+    """
+    Return the length of the common prefix of two strings.
+
+    :param text1: First string
+    :type text1: basestring
+    :param text2: Second string
+    :type text2: basestring
+    :return: Length of the prefix
+    :rtype: int
+    """
+    length = min(len(text1), len(text2))
+    if text1[:length] == text2[:length]:  # Typing at the end
+        return length
+    low, high = 0, length - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text1[:middle] == text2[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class FontMetrics(object):
+    """
+    Advances of the characters of a font, measured once.
+
+    :param font: Font object
+    :type font: pygame.font.FontType
+    """
+
+    def __init__(self, font):
+        self._advances = {'': 0}  # type: dict
+        self._font = font
+
+    def get_advance(self, char):
+        """
+        Return the width of a character in pixels.
+
+        :param char: Character
+        :type char: basestring
+        :return: Width
+        :rtype: int
+        """
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._font.size(char)[0]
+            self._advances[char] = advance
+        return advance
+
+    def measure(self, text):
+        """
+        Measure the characters of a text not measured before.
+
+        :param text: Text
+        :type text: basestring
+        :return: None
+        """
+        advances = self._advances
+        for char in set(text).difference(advances):
+            advances[char] = self._font.size(char)[0]
+
+
+class TextWidths(object):
+    """
+    Widths of the prefixes of a text, the cumulative sums of the advances of
+    its characters. They are computed the first time they are requested and
+    kept until the text changes before their end.
+
+    If the font kerns the text (its width differs from the sum of the
+    advances), the widths are measured by the font instead.
+
+    :param font: Font object
+    :type font: pygame.font.FontType
+    """
+
+    def __init__(self, font):
+        self._font = font
+        self._kerning = False  # type: (bool,None)
+        self._metrics = get_font_metrics(font)
+        self._text = ''
+        self._widths = [0]  # type: list
+
+    def set_text(self, text):
+        """
+        Set the text, the widths of the prefix in common with the previous
+        text are kept.
+
+        :param text: Text
+        :type text: basestring
+        :return: None
+        """
+        if text == self._text:
+            return
+        length = _common_prefix_length(text, self._text)
+        del self._widths[length + 1:]
+        self._widths.extend([None] * (len(text) - length))
+        self._kerning = None  # Checked on the next request
+        self._text = text
+
+    def get_width(self, index):
+        """
+        Return the width of the text before the given index.
+
+        :param index: Index of the text, from 0 to its length
+        :type index: int
+        :return: Width
+        :rtype: int
+        """
+        widths = self._widths
+        width = widths[index]
+        if width is not None:
+            return width
+        text = self._text
+        if self._kerning is None:
+            self._metrics.measure(text)
+            advances = sum(self._metrics.get_advance(char) for char in text)
+            self._kerning = advances != self._font.size(text)[0]
+        if self._kerning:
+            width = self._font.size(text[:index])[0]
+            widths[index] = width
+            return width
+
+        # Sum the advances from the last known width
+        start = index - 1
+        while widths[start] is None:
+            start -= 1
+        width = widths[start]
+        get_advance = self._metrics.get_advance
+        for i in range(start, index):
+            width += get_advance(text[i])
+            widths[i + 1] = width
+        return width
@@ -0,0 +1,244 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+GLYPH ATLAS
+Text renderer composing the strings from cached glyphs.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import OrderedDict as _OrderedDict
+
+import pygame
+from pygameMenu.utils import make_surface
+
+# Fonts rendered with the glyph atlas
+_FONTS = set()
+
+# Atlases by (font name, size, color, antialias), the least recently used
+# ones are discarded
+_ATLASES = _OrderedDict()
+_MAX_ATLASES = 32
+
+
+class GlyphAtlas(object):
+    """
+    Renders strings by blitting glyphs cached in an atlas surface, instead of
+    rasterizing the whole string with the font. The glyphs of the string are
+    packed in rows (shelves) of the atlas the first time they are rendered.
+
+    The last string rendered is kept, so a string that shares a prefix with it
+    (e.g. a character typed at the end of a text input) only blits the prefix
+    from the previous surface plus the new glyphs.
+
+    If the width of the string differs from the sum of the advances of its
+    glyphs (kerning, ligatures), the whole string is rendered by the font.
+
+    :param font: Font object
+    :type font: pygame.font.FontType
+    :param color: Text color
+    :type color: tuple
+    :param antialias: Antialias the text, only antialiased text uses the atlas
+    :type antialias: bool
+    :param width: Width of the atlas surface (px)
+    :type width: int
+    :param max_glyphs: Maximum number of glyphs, the atlas is cleared when a string needs more
+    :type max_glyphs: int
+    """
+
+    def __init__(self, font, color, antialias=True, width=512, max_glyphs=256):
+        assert isinstance(color, tuple)
+        assert isinstance(antialias, bool)
+        assert isinstance(width, int)
+        assert isinstance(max_glyphs, int)
+        assert max_glyphs > 0, 'maximum number of glyphs must be greater than zero'
+        self._antialias = antialias
+        self._color = color
+        self._font = font
+        self._glyphs = {}  # Char: (rect in the atlas, advance)
+        self._last_offsets = [0]  # Position of each glyph of the last string
+        self._last_surface = None  # type: (pygame.Surface,None)
+        self._last_text = ''
+        self._max_glyphs = max_glyphs
+        self._shelf_height = 0
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._surface = None  # type: (pygame.Surface,None)
+        self._width = max(width, 4 * font.get_height())  # Fits the widest glyphs
+        self.clear()
+
+    def clear(self):
+        """
+        Remove all the glyphs and shrink the atlas surface. The last string
+        rendered is kept.
+
+        :return: None
+        """
+        self._glyphs = {}
+        self._shelf_height = 0
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._surface = make_surface(self._width, max(1, self._font.get_height()))
+
+    def _get_glyph(self, char):
+        """
+        Return the rect of a glyph in the atlas and its advance, the glyph is
+        rendered and added to the atlas if needed.
+
+        :param char: Character
+        :type char: basestring
+        :return: Rect in the atlas surface, advance (px)
+        :rtype: tuple
+        """
+        glyph = self._glyphs.get(char)
+        if glyph is not None:
+            return glyph
+        surface = self._font.render(char, self._antialias, self._color)
+        width, height = surface.get_size()
+
+        # Start a new shelf if the glyph does not fit in the current one
+        if self._shelf_x + width > self._width:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_height
+            self._shelf_height = 0
+        if self._shelf_y + height > self._surface.get_height():
+            atlas = make_surface(self._width, max(2 * self._surface.get_height(), self._shelf_y + height))
+            atlas.blit(self._surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._surface = atlas
+
+        # The atlas is transparent, the max of both copies the glyph pixels
+        self._surface.blit(surface, (self._shelf_x, self._shelf_y), special_flags=pygame.BLEND_RGBA_MAX)
+        glyph = (pygame.Rect(self._shelf_x, self._shelf_y, width, height), self._font.size(char)[0])
+        self._glyphs[char] = glyph
+        self._shelf_x += width
+        self._shelf_height = max(self._shelf_height, height)
+        return glyph
+
+    def get_glyph_count(self):
+        """
+        :return: Number of glyphs in the atlas
+        :rtype: int
+        """
+        return len(self._glyphs)
+
+    def render(self, text):
+        """
+        Render a string.
+
+        :param text: Text to render
+        :type text: basestring
+        :return: Text surface
+        :rtype: pygame.surface.SurfaceType
+        """
+        if not self._antialias or len(text) == 0:
+            return self._font.render(text, self._antialias, self._color)
+
+        # The atlas is cleared if the new glyphs do not fit, the strings with
+        # more glyphs than the limit are rendered by the font
+        chars = set(text)
+        if len(chars) > self._max_glyphs:
+            return self._font.render(text, self._antialias, self._color)
+        if len(self._glyphs) + len(chars.difference(self._glyphs)) > self._max_glyphs:
+            self.clear()
+
+        width, height = self._font.size(text)
+        glyphs = [self._get_glyph(char) for char in text]
+        if sum(glyph[1] for glyph in glyphs) != width:  # Kerning
+            return self._font.render(text, self._antialias, self._color)
+
+        # Length of the prefix shared with the last string
+        prefix = 0
+        last = self._last_text
+        while prefix < len(text) and prefix < len(last) and text[prefix] == last[prefix]:
+            prefix += 1
+
+        surface = make_surface(width, height)
+        offsets = self._last_offsets[0:prefix + 1]
+        x = offsets[-1]
+        if x > 0:
+            surface.blit(self._last_surface, (0, 0), pygame.Rect(0, 0, x, height),
+                         special_flags=pygame.BLEND_RGBA_MAX)
+        for glyph in glyphs[prefix:]:
+            surface.blit(self._surface, (x, 0), glyph[0], special_flags=pygame.BLEND_RGBA_MAX)
+            x += glyph[1]
+            offsets.append(x)
+
+        self._last_offsets = offsets
+        self._last_surface = surface
+        self._last_text = text
+        return surface
+
+
+def enable_glyph_atlas(font_name, enabled=True):
+    """
+    Render the texts of the widgets using the given font with glyph atlases.
+    Useful for texts that change often, like text inputs or timers.
+
+    :param font_name: Font name or path, as given to the widgets
+    :type font_name: basestring
+    :param enabled: Enable or disable the glyph atlas for the font
+    :type enabled: bool
+    :return: None
+    """
+    assert isinstance(font_name, str)
+    assert isinstance(enabled, bool)
+    if enabled:
+        _FONTS.add(font_name)
+    else:
+        _FONTS.discard(font_name)
+        for key in list(_ATLASES.keys()):
+            if key[0] == font_name:
+                del _ATLASES[key]
+
+
+def get_glyph_atlas(font, font_name, size, color, antialias):
+    """
+    Return the glyph atlas of a font and color, or None if the font does not
+    use glyph atlases.
+
+    :param font: Font object
+    :type font: pygame.font.FontType
+    :param font_name: Font name or path
+    :type font_name: basestring
+    :param size: Font size
+    :type size: int
+    :param color: Text color
+    :type color: tuple
+    :param antialias: Antialias the text
+    :type antialias: bool
+    :return: Glyph atlas
+    :rtype: GlyphAtlas, NoneType
+    """
+    if font_name not in _FONTS:
+        return None
+    key = (font_name, size, color, antialias)
+    atlas = _ATLASES.pop(key, None)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, antialias)
+        while len(_ATLASES) >= _MAX_ATLASES:
+            _ATLASES.popitem(last=False)
+    _ATLASES[key] = atlas  # Most recently used
+    return atlas
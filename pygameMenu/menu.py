@@ -30,27 +30,33 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
+import math
 import sys
 import types
 import textwrap
+from bisect import bisect_left, bisect_right
 from uuid import uuid4
 
 import pygame
 import pygameMenu.controls as _controls
 import pygameMenu.events as _events
 import pygameMenu.locals as _locals
+import pygameMenu.stats as _stats
+import pygameMenu.trace as _trace
 import pygameMenu.utils as _utils
 import pygameMenu.widgets as _widgets
 
+from pygameMenu.scheduler import Scheduler
 from pygameMenu.scrollarea import ScrollArea
 from pygameMenu.sound import Sound
+from pygameMenu.stats import MenuStats
 
 # Joy events
 _JOY_EVENT_LEFT = 1
 _JOY_EVENT_RIGHT = 2
 _JOY_EVENT_UP = 4
 _JOY_EVENT_DOWN = 8
-_JOY_EVENT_REPEAT = pygame.NUMEVENTS - 1
+_JOY_REPEAT_KEY = 'joy_repeat'  # Key of the joystick repeat deadline
 
 
 class Menu(object):
@@ -73,6 +79,10 @@ class Menu(object):
     :type column_max_width: tuple, NoneType
     :param columns: Number of columns, by default it's 1
     :type columns: int
+    :param dirty_rects: If True, draw returns the list of screen rects that changed and mainloop only updates them
+    :type dirty_rects: bool
+    :param draw_overscan: Margin around the viewable area (px), widgets outside the area plus this margin are not drawn
+    :type draw_overscan: int, float
     :param enabled: Menu is enabled by default or not
     :type enabled: bool
     :param joystick_enabled: Enable/disable joystick on the Menu
@@ -81,6 +91,8 @@ class Menu(object):
     :type menu_background_color: tuple, list
     :param mouse_enabled: Enable/disable mouse click inside the Menu
     :type mouse_enabled: bool
+    :param mouse_motion_selection: Select the widgets hovered by the mouse
+    :type mouse_motion_selection: bool
     :param menu_id: ID of the Menu
     :type menu_id: basestring
     :param menu_opacity: Opacity of background (0=transparent, 100=opaque)
@@ -93,6 +105,8 @@ class Menu(object):
     :type mouse_visible: bool
     :param onclose: Function applied when closing the Menu
     :type onclose: callable, NoneType
+    :param retained_widgets: If True, the widgets surface is kept between frames and only the widgets that changed are redrawn
+    :type retained_widgets: bool
     :param rows: Number of rows of each column, None if there's only 1 column
     :type rows: int, NoneType
     :param scrollbar_color: Scrollbars color
@@ -113,6 +127,8 @@ class Menu(object):
     :type scrollbar_thick: int, float
     :param selection_color: Color of the selecter widget
     :type selection_color: tuple
+    :param stats: Measure the time of the phases of the frames and count the renders, see :py:meth:`Menu.get_stats`
+    :type stats: bool
     :param title_background_color: Title background color
     :type title_background_color: tuple, list
     :param title_font: Optional title font, if None use the Menu default font
@@ -159,6 +175,9 @@ class Menu(object):
     :type widget_shadow_position: basestring
     """
 
+    # Joysticks initialized by the menus, shared by all of them
+    _joysticks = []  # type: list
+
     def __init__(self,
                  menu_height,
                  menu_width,
@@ -168,6 +187,8 @@ class Menu(object):
                  column_force_fit_text=False,
                  column_max_width=None,
                  columns=1,
+                 dirty_rects=False,
+                 draw_overscan=0,
                  enabled=True,
                  joystick_enabled=True,
                  menu_opacity=100,
@@ -176,8 +197,10 @@ class Menu(object):
                  menu_position_x=50,
                  menu_position_y=50,
                  mouse_enabled=True,
+                 mouse_motion_selection=False,
                  mouse_visible=True,
                  onclose=None,
+                 retained_widgets=False,
                  rows=None,
                  scrollbar_color=(235, 235, 235),
                  scrollbar_shadow=False,
@@ -188,6 +211,7 @@ class Menu(object):
                  scrollbar_slider_pad=0,
                  scrollbar_thick=20,
                  selection_color=(255, 255, 255),
+                 stats=False,
                  title_background_color=None,
                  title_font=None,
                  title_font_color=None,
@@ -218,12 +242,17 @@ class Menu(object):
         assert isinstance(column_force_fit_text, bool)
         assert isinstance(column_max_width, (tuple, type(None), (int, float), list))
         assert isinstance(columns, int)
+        assert isinstance(dirty_rects, bool)
+        assert isinstance(draw_overscan, (int, float))
         assert isinstance(enabled, bool)
         assert isinstance(joystick_enabled, bool)
         assert isinstance(menu_opacity, (int, float))
         assert isinstance(menu_id, str)
         assert isinstance(mouse_enabled, bool)
+        assert isinstance(mouse_motion_selection, bool)
         assert isinstance(mouse_visible, bool)
+        assert isinstance(retained_widgets, bool)
+        assert isinstance(stats, bool)
         assert isinstance(rows, (int, type(None)))
         assert isinstance(scrollbar_shadow, bool)
         assert isinstance(scrollbar_shadow_offset, (int, float))
@@ -296,6 +325,7 @@ class Menu(object):
         assert widget_font_size > 0 and title_font_size > 0, \
             'widget font size and title font size must be greater than zero'
         assert widget_offset_x >= 0 and widget_offset_y >= 0, 'widget offset must be greater or equal than zero'
+        assert draw_overscan >= 0, 'draw overscan must be greater or equal than zero'
 
         # Other asserts
         assert 0 <= menu_opacity <= 100, \
@@ -325,8 +355,19 @@ class Menu(object):
         self._id = menu_id
         self._index = -1  # Selected index, if -1 the widget does not have been selected yet
         self._joy_event = 0  # type: int
+        self._event_handlers = {  # Handlers of the events not used by the widgets, by type
+            pygame.JOYAXISMOTION: self._update_joy_axis,
+            pygame.JOYHATMOTION: self._update_joy_hat,
+            pygame.KEYDOWN: self._update_keydown,
+            pygame.MOUSEBUTTONDOWN: self._update_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._update_mouse_button_up,
+            pygame.MOUSEMOTION: self._update_mouse_motion,
+            pygame.QUIT: self._update_quit,
+        }
         self._onclose = onclose  # Function that calls after closing Menu
+        self._scheduler = Scheduler()  # Shared clock, only the one of the top Menu is used
         self._sounds = Sound()  # type: Sound
+        self._stats = MenuStats() if stats else None  # type: (MenuStats,None)
         self._submenus = []  # type: list
         self._width = float(menu_width)
 
@@ -359,6 +400,10 @@ class Menu(object):
         if abs(widget_offset_y) < 1:
             widget_offset_y *= self._height
         self._widgets = []  # type: list
+        self._widgets_id = {}  # type: dict
+        self._widgets_tree_id = None  # type: (dict,None)
+        self._widgets_tree_id_versions = []  # Menus of the tree and their versions when it was built
+        self._widgets_version = 0  # Incremented each time the widgets or the submenus change
         self._widget_default_alignment = widget_alignment
         self._widget_default_font_color = widget_font_color
         self._widget_default_font_name = font
@@ -373,27 +418,57 @@ class Menu(object):
         self._widget_offset_x = widget_offset_x
         self._widget_offset_y = widget_offset_y
 
+        # Dirty rects and retained widgets, the draw state of each widget is stored to
+        # compute the areas that changed between frames. The frame state belongs to
+        # top, as the last drawn Menu may be different from the current one
+        self._dirty_rects = dirty_rects
+        self._last_frame_rect = None  # type: (pygame.Rect,None)
+        self._last_frame_state = None  # type: (tuple,None)
+        self._retained_widgets = retained_widgets
+        self._widgets_draw_state = {}  # type: dict
+        self._widgets_draw_surface = None  # type: (pygame.Surface,None)
+
+        # Only the widgets within the viewable area (plus the overscan) are drawn,
+        # these are found using the area of each widget stored by column
+        self._draw_overscan = draw_overscan
+        self._widgets_area_index = []  # type: list
+
+        # Virtual list, the widgets are a pool of buttons recycled for the rows near
+        # the viewable area. The selected row is the first row of the pool plus the
+        # selected index
+        self._virtual_extra_rows = 0  # type: int
+        self._virtual_first = 0  # type: int
+        self._virtual_id = ''  # type: str
+        self._virtual_onreturn = None  # type: (callable,None)
+        self._virtual_row = None  # type: (callable,None)
+        self._virtual_row_args = []  # type: list
+        self._virtual_row_height = 0  # type: float
+        self._virtual_rows = 0  # type: int
+
         # Configure the selection widget effect
         self._widget_default_selection.set_color(selection_color)
 
         # Columns and rows
+        self._column_content_widths = []  # type: list
+        self._column_extents = []  # Lower rightmost position of the widgets of each column
         self._column_max_width = column_max_width
         self._column_pos_x = []
         self._column_widths = None  # type: (list,None)
+        self._column_ysum = []  # type: list
         self._columns = columns
         self._force_fit_text = column_force_fit_text
         self._rows = rows
+        self._widget_sizes = []  # type: list
+        self._widgets_index = {}  # Widget => index, updated by the layout
 
         # Init joystick
         self._joystick = joystick_enabled
         if self._joystick:
-            if not pygame.joystick.get_init():
-                pygame.joystick.init()
-            for i in range(pygame.joystick.get_count()):
-                pygame.joystick.Joystick(i).init()
+            self._init_joysticks()
 
         # Init mouse
         self._mouse = mouse_enabled and mouse_visible
+        self._mouse_motion_selection = mouse_motion_selection
         self._mouse_visible = mouse_visible
         self._mouse_visible_default = mouse_visible
 
@@ -472,6 +547,7 @@ class Menu(object):
         onchange = None
         if isinstance(action, Menu):
             self._current._submenus.append(action)
+            self._current._widgets_version += 1
             widget = _widgets.Button(title, button_id, onchange, self._current._open, action)
         # If element is a PyMenuAction
         elif action == _events.BACK:  # Back to Menu
@@ -678,6 +754,10 @@ class Menu(object):
         Values of the selector are like:
             values = [('Item1', a, b, c...), ('Item2', a, b, c..)]
 
+        Long lists can be given as a tuple (length, getter), the element at
+        an index is then requested only when it is displayed or selected:
+            values = (len(modes), lambda index: (str(modes[index]), modes[index]))
+
         And functions onchange and onreturn does
             onchange(a, b, c..., \*\*kwargs)
             onreturn(a, b, c..., \*\*kwargs)
@@ -693,8 +773,8 @@ class Menu(object):
 
         :param title: Title of the selector
         :type title: basestring
-        :param items: Elements of the selector [('Item1', var1..), ('Item2'...)]
-        :type items: list
+        :param items: Elements of the selector [('Item1', var1..), ('Item2'...)], or tuple (length, getter)
+        :type items: list, tuple
         :param default: Index of default value to display
         :type default: int
         :param onchange: Function when changing the selector
@@ -807,6 +887,78 @@ class Menu(object):
         self._current._append_widget(widget)
         return widget
 
+    def add_text_area(self,
+                      title,
+                      default='',
+                      enable_copy_paste=True,
+                      enable_selection=True,
+                      lines=4,
+                      maxchar=0,
+                      onchange=None,
+                      onreturn=None,
+                      textarea_id='',
+                      width=300,
+                      **kwargs):
+        """
+        Add a multi-line text input to the current Menu. The text is wrapped on
+        the given width, and the area scrolls to show the line of the cursor.
+        Return inserts a line break, Ctrl+Return calls the onreturn function.
+
+        And functions onchange and onreturn does
+            onchange(current_text, \*\*kwargs)
+            onreturn(current_text, \*\*kwargs)
+
+        kwargs (Optional):
+            - align             Widget alignment (str)
+            - font_color        Widget font color (tuple)
+            - font_name         Widget font (str)
+            - font_size         Font size of the widget (int)
+            - margin            Tuple of (x,y) margin (int, float)
+            - selection_color   Widget selection color
+            - selection_effect  Widget selector effect :py:class:`pygameMenu.widgets.Selection`
+
+        :param title: Title of the text area
+        :type title: basestring
+        :param default: Default text to display
+        :type default: basestring
+        :param enable_copy_paste: Enable text copy, paste and cut
+        :type enable_copy_paste: bool
+        :param enable_selection: Enable text selection on input
+        :type enable_selection: bool
+        :param lines: Number of lines displayed
+        :type lines: int
+        :param maxchar: Maximum length of string, if 0 there's no limit
+        :type maxchar: int
+        :param onchange: Function when changing the text
+        :type onchange: callable, NoneType
+        :param onreturn: Function when pressing Ctrl+Return
+        :type onreturn: callable, NoneType
+        :param textarea_id: ID of the text area
+        :type textarea_id: basestring
+        :param width: Width of the text (px)
+        :type width: int, float
+        :param kwargs: Additional keyword-parameters
+        :type kwargs: any
+        :return: Widget object
+        :rtype: :py:class:`pygameMenu.widgets.TextArea`
+        """
+        assert isinstance(default, str)
+
+        widget = _widgets.TextArea(label=title,
+                                   textarea_id=textarea_id,
+                                   enable_copy_paste=enable_copy_paste,
+                                   enable_selection=enable_selection,
+                                   lines=lines,
+                                   maxchar=maxchar,
+                                   onchange=onchange,
+                                   onreturn=onreturn,
+                                   width=width,
+                                   **kwargs)
+        self._current._configure_widget(widget=widget, **kwargs)
+        widget.set_value(default)
+        self._current._append_widget(widget)
+        return widget
+
     def add_vertical_margin(self, margin):
         """
         Adds a vertical margin to the current Menu.
@@ -821,6 +973,193 @@ class Menu(object):
         self._current._append_widget(widget)
         return widget
 
+    def set_virtual_list(self,
+                         rows,
+                         row,
+                         row_height=None,
+                         list_id='',
+                         onreturn=None,
+                         **kwargs):
+        """
+        Make the current Menu a virtual list of rows. Instead of creating a
+        widget for each row, a small pool of buttons is recycled for the rows
+        near the viewable area, so the memory and build time do not depend
+        on the number of rows.
+
+        The content of a row is requested to the ``row`` function only when
+        the row comes near the viewable area. It returns the title of the row,
+        or a tuple with the title and the arguments of the onreturn function:
+
+            row(index) -> 'Title'
+            row(index) -> ('Title', a, b, c...)
+
+        And function onreturn does
+            onreturn(index, a, b, c...)
+
+        The index of the selected row is returned by :py:meth:`Menu.get_input_data`
+        using the ``list_id`` key, and the first button of the pool takes that ID.
+        If the Menu is scrolled far from the selected row, the selection moves
+        to the nearest row of the pool.
+
+        kwargs (Optional):
+            - align             Widget alignment (str)
+            - font_color        Widget font color (tuple)
+            - font_name         Widget font (str)
+            - font_size         Font size of the widget (int)
+            - margin            Tuple of (x,y) margin (int, float)
+            - selection_color   Widget selection color
+            - selection_effect  Widget selector effect :py:class:`pygameMenu.widgets.Selection`
+
+        :param rows: Number of rows
+        :type rows: int
+        :param row: Function that returns the content of the row at the given index
+        :type row: callable
+        :param row_height: Height of each row (px), if None it is estimated from the first row
+        :type row_height: int, float, NoneType
+        :param list_id: ID of the list
+        :type list_id: basestring
+        :param onreturn: Function when pressing return button on a row
+        :type onreturn: callable, NoneType
+        :param kwargs: Additional keyword-parameters
+        :type kwargs: any
+        :return: None
+        """
+        assert isinstance(rows, int)
+        assert isinstance(row_height, (int, float, type(None)))
+        assert isinstance(list_id, str)
+        assert rows > 0, 'number of rows must be greater than zero'
+        assert callable(row), 'row must be callable (a function)'
+        if onreturn:
+            assert callable(onreturn), 'onreturn must be callable or None'
+        if row_height is not None:
+            assert row_height > 0, 'row height must be greater than zero'
+        self._current._set_virtual_list(rows, row, row_height, list_id, onreturn, **kwargs)
+
+    def _set_virtual_list(self, rows, row, row_height, list_id, onreturn, **kwargs):
+        """
+        Make this Menu a virtual list of rows, see :py:meth:`Menu.set_virtual_list`.
+
+        :param rows: Number of rows
+        :type rows: int
+        :param row: Function that returns the content of the row at the given index
+        :type row: callable
+        :param row_height: Height of each row (px), if None it is estimated from the first row
+        :type row_height: int, float, NoneType
+        :param list_id: ID of the list
+        :type list_id: basestring
+        :param onreturn: Function when pressing return button on a row
+        :type onreturn: callable, NoneType
+        :param kwargs: Additional keyword-parameters
+        :type kwargs: any
+        :return: None
+        """
+        assert len(self._widgets) == 0, 'virtual list cannot be set on a Menu with widgets'
+        assert self._columns == 1, 'virtual list cannot be set on a Menu with columns'
+        if len(list_id) == 0:
+            list_id = str(uuid4())
+        self._check_id_duplicated(list_id)
+        self._index = -1
+        self._virtual_first = 0
+        self._virtual_id = list_id
+        self._virtual_onreturn = onreturn
+        self._virtual_row = row
+        self._virtual_rows = rows
+
+        # The first button takes the ID of the list and estimates the row height
+        widget = _widgets.Button('', list_id, None, self._virtual_apply)
+        self._configure_widget(widget=widget, **kwargs)
+        self._append_widget(widget)
+        if row_height is None:
+            widget.set_title(self._get_virtual_row(0)[0])
+            row_height = widget.get_rect().height + widget.get_margin()[1]
+        self._virtual_row_height = float(row_height)
+
+        # The pool covers the viewable area plus some extra rows on each side
+        view_height = self._height - self._menubar.get_rect().height
+        self._virtual_extra_rows = 2 + int(math.ceil(self._draw_overscan / self._virtual_row_height))
+        pool = min(rows, int(math.ceil(view_height / self._virtual_row_height)) + 1 + 2 * self._virtual_extra_rows)
+        for _ in range(pool - 1):
+            widget = _widgets.Button('', '', None, self._virtual_apply)
+            self._configure_widget(widget=widget, **kwargs)
+            self._append_widget(widget)
+        self._set_virtual_window(0)
+
+    def _get_virtual_row(self, index):
+        """
+        Return the content of a row of the virtual list.
+
+        :param index: Row index
+        :type index: int
+        :return: Tuple (title, args...)
+        :rtype: tuple
+        """
+        content = self._virtual_row(index)
+        if not isinstance(content, tuple):
+            content = (content,)
+        assert len(content) > 0 and isinstance(content[0], str), \
+            'row must return a title or a tuple (title, args...)'
+        return content
+
+    def _set_virtual_window(self, first):
+        """
+        Move the pool of buttons of the virtual list to the rows starting at
+        the given one. If the selected row is out of the new rows, the nearest
+        one is selected.
+
+        :param first: First row of the pool
+        :type first: int
+        :return: None
+        """
+        first = max(0, min(first, self._virtual_rows - len(self._widgets)))
+        selected = self._virtual_first + self._index
+        self._virtual_first = first
+        self._virtual_row_args = []
+        for index in range(len(self._widgets)):
+            content = self._get_virtual_row(first + index)
+            self._widgets[index].set_title(content[0])
+            self._virtual_row_args.append(content[1:])
+
+        # Update the selection
+        index = max(0, min(selected - first, len(self._widgets) - 1))
+        if index != self._index:
+            if self._index >= 0:
+                self._widgets[self._index].set_selected(False)
+            self._index = index
+            self._widgets[index].set_selected()
+
+        # The position of the buttons within the surface does not change, only the
+        # origin of the surface within the virtual world
+        if self._widgets_surface is not None:
+            self._scroll.set_world(self._widgets_surface, self._scroll.get_world_size(),
+                                   (0, first * self._virtual_row_height))
+        self._widgets_surface = None
+
+    def _check_virtual_window(self):
+        """
+        Move the pool of buttons of the virtual list if the viewable area is out of its rows.
+
+        :return: None
+        """
+        if self._virtual_row is None or self._widgets_surface is None:
+            return
+        view = self._scroll.get_world_view_rect()
+        top = self._widget_offset_y
+        bottom = top + len(self._widgets) * self._virtual_row_height
+        if (view.top >= top or self._virtual_first == 0) and \
+                (view.bottom <= bottom or self._virtual_first + len(self._widgets) == self._virtual_rows):
+            return
+        first_visible = self._virtual_first + int((view.top - top) // self._virtual_row_height)
+        self._set_virtual_window(first_visible - self._virtual_extra_rows)
+
+    def _virtual_apply(self):
+        """
+        Call the onreturn function of the virtual list with the selected row.
+
+        :return: Function returned value
+        """
+        if self._virtual_onreturn is not None:
+            return self._virtual_onreturn(self._virtual_first + self._index, *self._virtual_row_args[self._index])
+
     def _configure_widget(self, widget, **kwargs):
         """
         Update the given widget with the parameters defined at
@@ -913,6 +1252,8 @@ class Menu(object):
             assert len(self._widgets) + 1 <= max_elements, \
                 'total widgets cannot be greater than columns*rows ({0} elements)'.format(max_elements)
         self._widgets.append(widget)
+        self._widgets_id.setdefault(widget.get_id(), widget)
+        self._widgets_version += 1
         if self._index < 0 and widget.is_selectable:
             widget.set_selected()
             self._index = len(self._widgets) - 1
@@ -984,7 +1325,12 @@ class Menu(object):
 
     def _update_widget_position(self):
         """
-        Update the position dict for each widget.
+        Update the position of each widget.
+
+        The Y position of a widget is the sum of the heights of the previous rows
+        of its column. These sums are stored for each column, so the size change of
+        a single widget only moves the following rows of its column, see
+        :py:meth:`Menu._update_widget_size`.
 
         :return: None
         """
@@ -994,74 +1340,223 @@ class Menu(object):
         # Update title position
         self._menubar.set_position(self._pos_x, self._pos_y)
 
-        # Store widget rects
-        widget_rects = {}
-        for widget in self._widgets:  # type: _widgets.Widget
-            widget_rects[widget.get_id()] = widget.get_rect()
-
         # Update appended widgets
+        self._column_content_widths = []
+        self._column_ysum = []
+        self._widget_sizes = []
+        self._widgets_index = {}
         for index in range(len(self._widgets)):
             widget = self._widgets[index]  # type: _widgets.Widget
-            rect = widget_rects[widget.get_id()]  # type: pygame.Rect
-            selection = widget.get_selection_effect()
+            rect = widget.get_rect()  # type: pygame.Rect
+            self._widgets_index[widget] = index
 
             # Get column and row position
             col = int(index // self._rows)
             row = int(index % self._rows)
 
-            # Calculate X position
-            column_width = self._column_widths[col]
-            _, sel_left, sel_bottom, sel_right = selection.get_margin()
-            selection_margin = 0
-            align = widget.get_alignment()
-            if align == _locals.ALIGN_CENTER:
-                dx = -float(rect.width) / 2
-            elif align == _locals.ALIGN_LEFT:
-                selection_margin = sel_left
-                dx = -column_width / 2 + selection_margin
-            elif align == _locals.ALIGN_RIGHT:
-                selection_margin = sel_right
-                dx = column_width / 2 - rect.width - selection_margin
+            # Compute the total height from the current row position to the top of the column,
+            # the rows of a virtual list have a fixed height
+            if row == 0:
+                self._column_content_widths.append(0)
+                self._column_ysum.append([0])
+            elif self._virtual_row is not None:
+                self._column_ysum[col].append(row * self._virtual_row_height)
             else:
-                dx = 0
-            x_coord = self._column_pos_x[col] + dx + widget.get_margin()[0]
-            x_coord = max(selection_margin, x_coord)
-            x_coord += self._widget_offset_x
-
-            # Calculate Y position
-            ysum = 0  # Compute the total height from the current row position to the top of the column
-            for r in range(row):
-                rwidget = self._widgets[int(self._rows * col + r)]  # type: _widgets.Widget
-                ysum += widget_rects[rwidget.get_id()].height + rwidget.get_margin()[1]
-            y_coord = self._widget_offset_y + ysum + sel_bottom
+                ysum = self._column_ysum[col][-1] + self._widget_sizes[index - 1][1] + \
+                       self._widgets[index - 1].get_margin()[1]
+                self._column_ysum[col].append(ysum)
+            self._widget_sizes.append(rect.size)
+            self._column_content_widths[col] = max(self._column_content_widths[col],
+                                                   rect.width + widget.get_selection_effect().get_width())
 
             # Update the position of the widget
-            widget.set_position(x_coord, y_coord)
+            widget.set_position(self._get_widget_position_x(index, rect.width), self._get_widget_position_y(index))
+        self._column_extents = [self._get_column_extent(col) for col in range(len(self._column_ysum))]
 
-    def _get_widget_max_position(self):
+    def _get_column_extent(self, col):
         """
-        :return: Returns the lower rightmost position of each widgets in Menu.
+        Return the lower rightmost position of the widgets of a column.
+
+        :param col: Column index
+        :type col: int
+        :return: (x, y) position (px)
         :rtype: tuple
         """
         max_x = -1e6
         max_y = -1e6
-        for widget in self._widgets:  # type: _widgets.Widget
+        rows = int(self._rows)
+        for widget in self._widgets[col * rows:(col + 1) * rows]:  # type: _widgets.Widget
             _, _, x, y = widget.get_position()  # Use only bottom right position
             max_x = max(max_x, x)
             max_y = max(max_y, y)
         return max_x, max_y
 
-    def _build_widget_surface(self):
+    def _update_column_content_width(self, index, old_width):
         """
-        Create the surface used to draw widgets according the
-        required width and height.
+        Update the width of the content of the column of a widget after the
+        width of the widget has changed.
+
+        :param index: Widget index
+        :type index: int
+        :param old_width: Previous width of the widget (px)
+        :type old_width: int
+        :return: True if the width of the content of the column has changed
+        :rtype: bool
+        """
+        col = int(index // self._rows)
+        if self._column_max_width[col] is not None:  # The width of the column is fixed
+            return False
+        selection_width = self._widgets[index].get_selection_effect().get_width()
+        width = self._widget_sizes[index][0] + selection_width
+        content = self._column_content_widths[col]
+        if width > content:
+            self._column_content_widths[col] = width
+            return True
+        if old_width + selection_width < content or width == content:
+            return False
+
+        # The widget was the widest of the column
+        rows = int(self._rows)
+        for i in range(col * rows, min((col + 1) * rows, len(self._widgets))):
+            width = max(width, self._widget_sizes[i][0] + self._widgets[i].get_selection_effect().get_width())
+        self._column_content_widths[col] = width
+        return width != content
+
+    def _get_widget_position_x(self, index, width):
+        """
+        Return the X position of the widget at the given index.
+
+        :param index: Widget index
+        :type index: int
+        :param width: Widget width (px)
+        :type width: int, float
+        :return: X position (px)
+        :rtype: float
+        """
+        widget = self._widgets[index]  # type: _widgets.Widget
+        selection = widget.get_selection_effect()
+        col = int(index // self._rows)
+
+        column_width = self._column_widths[col]
+        _, sel_left, _, sel_right = selection.get_margin()
+        selection_margin = 0
+        align = widget.get_alignment()
+        if align == _locals.ALIGN_CENTER:
+            dx = -float(width) / 2
+        elif align == _locals.ALIGN_LEFT:
+            selection_margin = sel_left
+            dx = -column_width / 2 + selection_margin
+        elif align == _locals.ALIGN_RIGHT:
+            selection_margin = sel_right
+            dx = column_width / 2 - width - selection_margin
+        else:
+            dx = 0
+        x_coord = self._column_pos_x[col] + dx + widget.get_margin()[0]
+        x_coord = max(selection_margin, x_coord)
+        return x_coord + self._widget_offset_x
+
+    def _get_widget_position_y(self, index):
+        """
+        Return the Y position of the widget at the given index, using the sum
+        of the heights of the previous rows of its column.
+
+        :param index: Widget index
+        :type index: int
+        :return: Y position (px)
+        :rtype: float
+        """
+        sel_bottom = self._widgets[index].get_selection_effect().get_margin()[2]
+        ysum = self._column_ysum[int(index // self._rows)][int(index % self._rows)]
+        return self._widget_offset_y + ysum + sel_bottom
 
+    def _update_widget_size(self, widget):
+        """
+        Update the position of the widgets after the size of the given one has
+        changed. Only the widget and the following rows of its column are moved,
+        the widgets surface is rebuilt only if its size must change.
+
+        :param widget: Widget object
+        :type widget: :py:class:`pygameMenu.widgets.core.widget.Widget`
         :return: None
         """
-        self._update_widget_position()
+        if self._widgets_surface is None:
+            return
+        if self._stats is not None:
+            self._stats.begin(_stats.STATS_PHASE_LAYOUT)
+            self._stats.count(_stats.STATS_LAYOUT_UPDATES)
+        index = self._widgets_index[widget]
+        col = int(index // self._rows)
+        row = int(index % self._rows)
+        rect = widget.get_rect()
+
+        # Update the widget and the sums of heights of the following rows
+        dy = 0
+        if self._virtual_row is None:
+            dy = rect.height - self._widget_sizes[index][1]
+        old_width = self._widget_sizes[index][0]
+        self._widget_sizes[index] = rect.size
+        widget.set_position(self._get_widget_position_x(index, rect.width), self._get_widget_position_y(index))
+        ysum = self._column_ysum[col]
+        if dy != 0:
+            for r in range(row + 1, len(ysum)):
+                ysum[r] += dy
+                rwidget = self._widgets[index + r - row]  # type: _widgets.Widget
+                rwidget.set_position(rwidget.get_position()[0], self._get_widget_position_y(index + r - row))
+
+        # If the widest widget of the column changed, the width and position of
+        # all the columns must be computed again
+        columns_changed = rect.width != old_width and self._update_column_content_width(index, old_width)
+        if columns_changed:
+            self._update_column_width()
+            for i in range(len(self._widgets)):
+                rwidget = self._widgets[i]  # type: _widgets.Widget
+                rwidget.set_position(self._get_widget_position_x(i, self._widget_sizes[i][0]),
+                                     rwidget.get_position()[1])
+            self._column_extents = [self._get_column_extent(c) for c in range(len(self._column_ysum))]
+        else:
+            self._column_extents[col] = self._get_column_extent(col)
+
+        # The surface is too small or too large for the widgets
+        width, height = self._get_widget_surface_size()
+        world_width, world_height = self._scroll.get_world_size()
+        if int(width) != int(world_width) or int(height) != int(world_height):
+            self._widgets_surface = None
+        elif columns_changed:
+            self._update_widgets_area_index()
+        else:
+            # Update the areas of the moved widgets
+            column = self._widgets_area_index[col]
+            for r in range(row, len(ysum) if dy != 0 else row + 1):
+                column[2][r] = self._get_widget_draw_area(column[1][r])
+            self._update_widgets_area_column(column)
+        if self._stats is not None:
+            self._stats.end()
+
+    def _get_widget_max_position(self):
+        """
+        :return: Returns the lower rightmost position of each widgets in Menu.
+        :rtype: tuple
+        """
+        max_x = -1e6
+        max_y = -1e6
+        for x, y in self._column_extents:
+            max_x = max(max_x, x)
+            max_y = max(max_y, y)
+        return max_x, max_y
 
+    def _get_widget_surface_size(self):
+        """
+        Return the size of the world required by the widgets, for a virtual
+        list this is the size of the virtual world. The visibility of the
+        mouse is also updated, as it is needed if scrollbars are displayed.
+
+        :return: Width and height (px)
+        :rtype: tuple
+        """
         menubar_height = self._menubar.get_rect().height
         max_x, max_y = self._get_widget_max_position()
+        if self._virtual_row is not None:
+            max_y = self._widget_offset_y + self._virtual_rows * self._virtual_row_height
 
         if max_x > self._width and max_y > self._height - menubar_height:
             width, height = max_x + 20, max_y + 20
@@ -1081,10 +1576,135 @@ class Menu(object):
         else:
             width, height = self._width, self._height - menubar_height
             self._mouse_visible = self._mouse_visible_default
+        return width, height
+
+    def _build_widget_surface(self):
+        """
+        Create the surface used to draw widgets according the
+        required width and height.
+
+        :return: None
+        """
+        if self._stats is not None:
+            self._stats.begin(_stats.STATS_PHASE_LAYOUT)
+            self._stats.count(_stats.STATS_LAYOUTS)
+            self._stats.count(_stats.STATS_SURFACES)
+        if _trace.tracer is not None:
+            _trace.tracer.begin('Menu._build_widget_surface', 'layout', {'menu': self._id})
+        self._update_widget_position()
 
-        self._widgets_surface = _utils.make_surface(width, height)
-        self._scroll.set_world(self._widgets_surface)
+        menubar_height = self._menubar.get_rect().height
+        width, height = self._get_widget_surface_size()
+
+        if self._virtual_row is not None:
+            # Only the rows of the pool are drawn, the surface is placed within the virtual world
+            surface_height = min(height, self._widget_offset_y + (len(self._widgets) + 1) * self._virtual_row_height)
+            self._widgets_surface = _utils.make_surface(width, surface_height)
+            self._scroll.set_world(self._widgets_surface, (width, height),
+                                   (0, self._virtual_first * self._virtual_row_height))
+        else:
+            self._widgets_surface = _utils.make_surface(width, height)
+            self._scroll.set_world(self._widgets_surface)
+        self._widgets_surface.fill((255, 255, 255, 0))
         self._scroll.set_position(self._pos_x, self._pos_y + menubar_height + 5)
+        self._update_widgets_area_index()
+        if _trace.tracer is not None:
+            _trace.tracer.end()
+        if self._stats is not None:
+            self._stats.end()
+
+    def _update_widgets_area_index(self):
+        """
+        Store the draw area of each widget grouped by column. Within a column the
+        widgets are stacked vertically, so the minimum top of the following
+        widgets and the maximum bottom of the previous ones are sorted, and
+        can be bisected to find the widgets within a given area.
+
+        :return: None
+        """
+        self._widgets_area_index = []
+        for index in range(len(self._widgets)):
+            widget = self._widgets[index]  # type: _widgets.Widget
+            if int(index // self._rows) == len(self._widgets_area_index):
+                # Column: (bounding rect, widgets, areas, min tops, max bottoms)
+                self._widgets_area_index.append((pygame.Rect(0, 0, 0, 0), [], [], [], []))
+            column = self._widgets_area_index[-1]
+            column[1].append(widget)
+            column[2].append(self._get_widget_draw_area(widget))
+        for column in self._widgets_area_index:
+            self._update_widgets_area_column(column)
+
+    @staticmethod
+    def _update_widgets_area_column(column):
+        """
+        Update the bounding rect, the minimum tops and the maximum bottoms of a
+        column of the widgets area index from the areas of its widgets.
+
+        :param column: Column of the index
+        :type column: tuple
+        :return: None
+        """
+        bounds, _, areas, tops, bottoms = column
+        bounds.update(areas[0].unionall(areas[1:]))
+        del tops[:]
+        del bottoms[:]
+        for area in areas:
+            bottoms.append(max(area.bottom, bottoms[-1]) if len(bottoms) > 0 else area.bottom)
+        for area in reversed(areas):
+            tops.append(min(area.top, tops[-1]) if len(tops) > 0 else area.top)
+        tops.reverse()
+
+    def _get_widgets_in_area(self, rect):
+        """
+        Return the widgets whose draw area (computed on the last layout update)
+        intersects the given rect, in the same order as the Menu widgets.
+
+        :param rect: Rect in the world surface reference
+        :type rect: pygame.rect.RectType
+        :return: Widgets list
+        :rtype: list[:py:class:`pygameMenu.widgets.core.widget.Widget`]
+        """
+        widgets = []
+        for bounds, column_widgets, areas, tops, bottoms in self._widgets_area_index:
+            if not bounds.colliderect(rect):
+                continue
+            for i in range(bisect_right(bottoms, rect.top), bisect_left(tops, rect.bottom)):
+                if areas[i].colliderect(rect):
+                    widgets.append(column_widgets[i])
+        return widgets
+
+    def _get_widget_index_at(self, position):
+        """
+        Return the index of the widget whose rect contains the given position.
+        Only the widgets whose draw area contains the position are checked.
+
+        :param position: Position in the world surface reference
+        :type position: tuple
+        :return: Widget index, -1 if there's no widget at the position
+        :rtype: int
+        """
+        if self._widgets_surface is None:  # The index is updated with the surface
+            self._build_widget_surface()
+        x, y = position
+        index = -1
+        for col in range(len(self._widgets_area_index)):
+            bounds, column_widgets, _, tops, bottoms = self._widgets_area_index[col]
+            if not bounds.collidepoint(x, y):
+                continue
+            for i in range(bisect_right(bottoms, y), bisect_left(tops, y + 1)):
+                if column_widgets[i].get_rect().collidepoint(x, y):
+                    index = int(col * self._rows) + i
+        return index
+
+    def _get_visible_widgets(self):
+        """
+        Return the widgets within the viewable area of the scroll plus the overscan margin.
+
+        :return: Widgets list
+        :rtype: list[:py:class:`pygameMenu.widgets.core.widget.Widget`]
+        """
+        overscan = int(self._draw_overscan)
+        return self._get_widgets_in_area(self._scroll.get_world_view_rect().inflate(2 * overscan, 2 * overscan))
 
     def _check_id_duplicated(self, widget_id):
         """
@@ -1094,9 +1714,8 @@ class Menu(object):
         :type widget_id: basestring
         :return: None
         """
-        for widget in self._widgets:  # type: _widgets.Widget
-            if widget.get_id() == widget_id:
-                raise ValueError('The widget ID="{0}" is duplicated'.format(widget_id))
+        if widget_id in self._widgets_id:
+            raise ValueError('The widget ID="{0}" is duplicated'.format(widget_id))
 
     def _close(self):
         """
@@ -1127,7 +1746,7 @@ class Menu(object):
                         self._exit()
 
             elif isinstance(onclose, (types.FunctionType, types.MethodType)):
-                onclose()
+                _utils.schedule_coroutine(onclose())
         return close
 
     def _get_depth(self):
@@ -1233,33 +1852,218 @@ class Menu(object):
         """
         Draw the current Menu into the given surface.
 
+        If ``dirty_rects`` is enabled on the current Menu, the areas of the surface
+        that changed since the last frame are returned. These can be passed to
+        ``pygame.display.update(rects)`` instead of flipping the whole display.
+        Note that the background must be static for this to be valid.
+
         :param surface: Pygame surface to draw the Menu
         :type surface: pygame.surface.SurfaceType
-        :return: None
+        :return: List of changed rects if dirty rects are enabled, else None
+        :rtype: list[pygame.rect.RectType], NoneType
         """
         if not self.is_enabled():
             raise RuntimeError('Menu is not enabled, it cannot be drawn')
 
+        current = self._current
+        stats = current._stats
+        if stats is not None:
+            stats.begin(_stats.STATS_PHASE_COMPOSITING)
+        tracer = _trace.tracer
+        if tracer is not None:
+            tracer.begin('Menu.draw', 'menu', {'menu': current._id})
+
         # The surface may has been erased because the number
         # of widgets has changed and thus size shall be calculated.
-        if not self._current._widgets_surface:
-            self._current._build_widget_surface()
+        current._check_virtual_window()
+        if not current._widgets_surface:
+            current._build_widget_surface()
+
+        # Only the widgets within the viewable area are drawn, then compute
+        # which of them changed since the last frame
+        visible = current._get_visible_widgets()
+        changed = None
+        if current._retained_widgets or current._dirty_rects:
+            changed = current._update_widgets_draw_state(visible)
+
+        # If only some areas changed, the rest of the last frame is kept on the
+        # surface, so only the union of the areas is drawn again
+        rects = None
+        clip = None
+        if current._dirty_rects:
+            rects, partial = current._get_dirty_rects(changed)
+            if partial:
+                clip = pygame.Rect(0, 0, 0, 0)
+                if len(rects) > 0:
+                    clip = rects[0].unionall(rects[1:]).clip(surface.get_clip())
+
+        if clip is None or clip.width > 0:
+            last_clip = surface.get_clip()
+            if clip is not None:
+                surface.set_clip(clip)
+
+            # Fill the surface with background function (setted from mainloop)
+            if self._top._background_function is not None:
+                if stats is not None:
+                    stats.end()  # Not measured
+                self._top._background_function()
+                if stats is not None:
+                    stats.begin(_stats.STATS_PHASE_COMPOSITING)
+
+            # Draw widgets, if not retained nor partial all of them are drawn again
+            if stats is not None:
+                stats.begin(_stats.STATS_PHASE_RENDER)
+            if current._retained_widgets or clip is not None:
+                current._draw_widgets(visible, changed)
+            else:
+                current._draw_widgets(visible, None)
+            if stats is not None:
+                stats.end()
+                stats.begin(_stats.STATS_PHASE_SCROLL)
+            current._scroll.draw(surface)
+            if stats is not None:
+                stats.end()
+
+            current._menubar.draw(surface)
+            surface.set_clip(last_clip)
+
+        if tracer is not None:
+            tracer.end()
+            tracer.end_frame()
+        if stats is not None:
+            stats.end()
+            stats.end_frame()
+        return rects
+
+    def _draw_widgets(self, widgets, areas):
+        """
+        Draw the widgets on the widgets surface. If a list of areas is given,
+        only these areas are erased and the widgets that intersect them are
+        drawn again (clipped to each area), the rest of the surface is kept
+        from the previous frame.
+
+        :param widgets: Widgets to draw if the whole surface is drawn
+        :type widgets: list[:py:class:`pygameMenu.widgets.core.widget.Widget`]
+        :param areas: List of areas of the widgets surface to draw, if None the viewable area is drawn
+        :type areas: list[pygame.rect.RectType], NoneType
+        :return: None
+        """
+        surface = self._widgets_surface  # type: pygame.Surface
+        if areas is None:
+            overscan = int(self._draw_overscan)
+            surface.fill((255, 255, 255, 0), self._scroll.get_world_view_rect().inflate(2 * overscan, 2 * overscan))
+            for widget in widgets:  # type: _widgets.Widget
+                self._draw_widget(surface, widget)
+            return
+
+        # Areas may overlap, each one is erased again before drawing on it. All the
+        # widgets within the area are drawn, even the ones out of the viewable area,
+        # else their pixels would be lost when scrolling
+        for area in areas:  # type: pygame.Rect
+            surface.set_clip(area)
+            surface.fill((255, 255, 255, 0), area)
+            for widget in self._get_widgets_in_area(area):  # type: _widgets.Widget
+                self._draw_widget(surface, widget)
+        surface.set_clip(None)
 
-        # Fill the surface with background function (setted from mainloop)
-        if self._top._background_function is not None:
-            self._top._background_function()
+    @staticmethod
+    def _draw_widget(surface, widget):
+        """
+        Draw a widget and its selection effect.
 
-        # Fill the scrolling surface
-        self._current._widgets_surface.fill((255, 255, 255, 0))
+        :param surface: Widgets surface
+        :type surface: pygame.surface.SurfaceType
+        :param widget: Widget object
+        :type widget: :py:class:`pygameMenu.widgets.core.widget.Widget`
+        :return: None
+        """
+        if _trace.tracer is not None:
+            _trace.tracer.begin(type(widget).__name__ + '.draw', 'widget', {'id': widget.get_id()})
+        widget.draw(surface)
+        if widget.selected:
+            widget.draw_selected_rect(surface)
+        if _trace.tracer is not None:
+            _trace.tracer.end()
 
-        # Draw widgets
-        for widget in self._current._widgets:  # type: _widgets.Widget
-            widget.draw(self._current._widgets_surface)
-            if widget.selected:
-                widget.draw_selected_rect(self._current._widgets_surface)
+    def _get_widget_draw_area(self, widget):
+        """
+        Return the area of the widgets surface covered by the widget when drawn,
+        including its selection effect.
 
-        self._current._scroll.draw(surface)
-        self._current._menubar.draw(surface)
+        :param widget: Widget object
+        :type widget: :py:class:`pygameMenu.widgets.core.widget.Widget`
+        :return: Rect in the world surface reference
+        :rtype: pygame.rect.RectType
+        """
+        rect = widget.get_rect()
+        selection = widget.get_selection_effect()
+        if widget.is_selectable and selection is not None:
+            rect = selection.inflate(rect)
+        return rect.inflate(4, 4)  # Some widgets draw a few pixels outside their rect
+
+    def _update_widgets_draw_state(self, widgets):
+        """
+        Compare the draw state of the given widgets against the last frame they
+        were drawn and store the new one. The state of the widgets not given is
+        kept, as their last drawing is still on the widgets surface.
+
+        :param widgets: Widgets to check
+        :type widgets: list[:py:class:`pygameMenu.widgets.core.widget.Widget`]
+        :return: List of the areas of the widgets surface that changed, None if the whole surface must be drawn
+        :rtype: list[pygame.rect.RectType], NoneType
+        """
+        # The widgets surface has been rebuilt, so everything must be drawn
+        if self._widgets_draw_surface is not self._widgets_surface:
+            self._widgets_draw_surface = self._widgets_surface
+            self._widgets_draw_state = {}
+            for widget in widgets:  # type: _widgets.Widget
+                self._widgets_draw_state[widget] = (widget._get_draw_state(), self._get_widget_draw_area(widget))
+            return None
+
+        # Check each widget, both the old and the new area of a changed widget must be drawn
+        changed = []
+        for widget in widgets:  # type: _widgets.Widget
+            state = widget._get_draw_state()
+            last = self._widgets_draw_state.get(widget)
+            if last is not None and last[0] == state:
+                continue
+            area = self._get_widget_draw_area(widget)
+            self._widgets_draw_state[widget] = (state, area)
+            changed.append(area)
+            if last is not None and last[1] != area:
+                changed.append(last[1])
+        return changed
+
+    def _get_dirty_rects(self, changed):
+        """
+        Return the areas of the screen that changed since the last frame.
+
+        :param changed: Areas of the widgets surface that changed, None if the whole surface changed
+        :type changed: list[pygame.rect.RectType], NoneType
+        :return: List of changed rects in the screen reference, and False if the whole Menu changed
+        :rtype: tuple
+        """
+        top = self._top
+        menu_rect = self.get_rect(current=False)
+        frame_state = (self, menu_rect.topleft, tuple(self._scroll.get_offsets()), self._menubar._get_draw_state())
+
+        # The Menu, its position or the scroll changed, so everything must be updated
+        if changed is None or frame_state != top._last_frame_state:
+            rects = [menu_rect]
+            if top._last_frame_rect is not None and top._last_frame_rect != menu_rect:
+                rects.append(top._last_frame_rect)
+            top._last_frame_state = frame_state
+            top._last_frame_rect = menu_rect
+            return rects, False
+
+        # Convert to screen reference and clip to the viewable area
+        view_rect = self._scroll.get_view_rect()
+        rects = []
+        for area in changed:  # type: pygame.Rect
+            rect = self._scroll.to_real_position(area).clip(view_rect)
+            if rect.width > 0 and rect.height > 0:
+                rects.append(rect)
+        return rects, True
 
     def enable(self):
         """
@@ -1327,6 +2131,216 @@ class Menu(object):
         if self._joy_event & _JOY_EVENT_RIGHT:
             self._right()
 
+    @staticmethod
+    def _filter_events(events):
+        """
+        Merge the consecutive mouse motions into one event (the last one, with
+        the sum of the movements). The other events are kept.
+
+        :param events: Pygame events as a list
+        :type events: list
+        :return: Filtered events
+        :rtype: list
+        """
+        filtered = []
+        for event in events:  # type: pygame.event.EventType
+            if event.type == pygame.MOUSEMOTION and len(filtered) > 0 and filtered[-1].type == pygame.MOUSEMOTION:
+                prev = filtered[-1]
+                motion = dict(event.dict)
+                if 'rel' in motion and 'rel' in prev.dict:
+                    motion['rel'] = (prev.rel[0] + event.rel[0], prev.rel[1] + event.rel[1])
+                filtered[-1] = pygame.event.Event(pygame.MOUSEMOTION, motion)
+                continue
+            filtered.append(event)
+        return filtered
+
+    def _update_quit(self, event):
+        """
+        Handle the quit event.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        self._current._exit()
+        return True
+
+    def _update_keydown(self, event):
+        """
+        Handle a key event.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        if event.key == pygame.K_F4 and (event.mod == pygame.KMOD_LALT or event.mod == pygame.KMOD_RALT):
+            return self._update_quit(event)
+
+        # Check key event is valid
+        if not _utils.check_key_pressed_valid(event):
+            return False
+
+        if event.key == _controls.KEY_MOVE_DOWN:
+            self._current._select(self._current._index - 1)
+            self._current._sounds.play_key_add()
+        elif event.key == _controls.KEY_MOVE_UP:
+            self._current._select(self._current._index + 1)
+            self._current._sounds.play_key_add()
+        elif event.key == _controls.KEY_LEFT and self._current._columns > 1:
+            self._current._left()
+            self._current._sounds.play_key_add()
+        elif event.key == _controls.KEY_RIGHT and self._current._columns > 1:
+            self._current._right()
+            self._current._sounds.play_key_add()
+        elif event.key == _controls.KEY_BACK and self._top._prev is not None:
+            self._current._sounds.play_close_menu()
+            self.reset(1)  # public, do not use _current
+        elif event.key == _controls.KEY_CLOSE_MENU:
+            self._current._sounds.play_close_menu()
+            return self._current._close()
+        return False
+
+    @staticmethod
+    def _init_joysticks():
+        """
+        Initialize the joysticks, only if the number of connected joysticks
+        changed since the last call.
+
+        :return: None
+        """
+        if not pygame.joystick.get_init():
+            pygame.joystick.init()
+        count = pygame.joystick.get_count()
+        if count == len(Menu._joysticks):
+            return
+        joysticks = []
+        for i in range(count):
+            joystick = pygame.joystick.Joystick(i)
+            joystick.init()
+            joysticks.append(joystick)
+        Menu._joysticks[:] = joysticks
+
+    def _update_joy_hat(self, event):
+        """
+        Handle a joystick hat event.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        if not self._current._joystick:
+            return False
+        if event.value == _controls.JOY_UP:
+            self._current._select(self._current._index - 1)
+        elif event.value == _controls.JOY_DOWN:
+            self._current._select(self._current._index + 1)
+        elif event.value == _controls.JOY_LEFT and self._columns > 1:
+            self._current._select(self._current._index - 1)
+        elif event.value == _controls.JOY_RIGHT and self._columns > 1:
+            self._current._select(self._current._index + 1)
+        return False
+
+    def _update_joy_axis(self, event):
+        """
+        Handle a joystick axis event.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        if not self._current._joystick:
+            return False
+        prev = self._current._joy_event
+        self._current._joy_event = 0
+        if event.axis == _controls.JOY_AXIS_Y and event.value < -_controls.JOY_DEADZONE:
+            self._current._joy_event |= _JOY_EVENT_UP
+        if event.axis == _controls.JOY_AXIS_Y and event.value > _controls.JOY_DEADZONE:
+            self._current._joy_event |= _JOY_EVENT_DOWN
+        if event.axis == _controls.JOY_AXIS_X and event.value < -_controls.JOY_DEADZONE and self._columns > 1:
+            self._current._joy_event |= _JOY_EVENT_LEFT
+        if event.axis == _controls.JOY_AXIS_X and event.value > _controls.JOY_DEADZONE and self._columns > 1:
+            self._current._joy_event |= _JOY_EVENT_RIGHT
+        scheduler = self._top._scheduler
+        if self._current._joy_event:
+            self._current._handle_joy_event()
+            if self._current._joy_event == prev:
+                scheduler.schedule(_JOY_REPEAT_KEY, _controls.JOY_REPEAT, self._repeat_joy_event)
+            else:
+                scheduler.schedule(_JOY_REPEAT_KEY, _controls.JOY_DELAY, self._repeat_joy_event)
+        else:
+            scheduler.cancel(_JOY_REPEAT_KEY)
+        return False
+
+    def _repeat_joy_event(self):
+        """
+        Repeat the joystick event while the axis is held.
+
+        :return: None
+        """
+        if self._current._joy_event:
+            self._current._handle_joy_event()
+            self._top._scheduler.schedule(_JOY_REPEAT_KEY, _controls.JOY_REPEAT, self._repeat_joy_event)
+
+    def _update_mouse_button_down(self, event):
+        """
+        Handle a mouse button down event, selects the clicked widget.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        # Don't considere the mouse wheel (button 4 & 5)
+        if self._current._mouse and event.button in (1, 2, 3):
+            index = self._current._get_widget_index_at(self._current._scroll.to_world_position(event.pos))
+            if index >= 0:
+                self._current._select(index)
+        return False
+
+    def _update_mouse_motion(self, event):
+        """
+        Handle a mouse motion event, selects the hovered widget if enabled.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        if self._current._mouse and self._current._mouse_motion_selection:
+            index = self._current._get_widget_index_at(self._current._scroll.to_world_position(event.pos))
+            if index >= 0 and self._current._widgets[index].is_selectable:
+                self._current._select(index)
+        return False
+
+    def _update_mouse_button_up(self, event):
+        """
+        Handle a mouse button up event, applies the selected widget if clicked.
+
+        :param event: Pygame event
+        :type event: pygame.event.EventType
+        :return: True if the Menu has been updated
+        :rtype: bool
+        """
+        if not self._current._mouse:
+            return False
+        self._current._sounds.play_click_mouse()
+        widget = self._current._widgets[self._current._index]
+        # Don't considere the mouse wheel (button 4 & 5)
+        if event.button in (1, 2, 3) and \
+                self._current._scroll.to_real_position(widget.get_rect()).collidepoint(*event.pos):
+            new_event = pygame.event.Event(event.type, **event.dict)
+            new_event.dict['origin'] = self._current._scroll.to_real_position((0, 0))
+            new_event.pos = self._current._scroll.to_world_position(event.pos)
+            widget.update((new_event,))  # This widget can change the current Menu to a submenu
+            if widget.surface_needs_update():
+                widget.get_menu()._update_widget_size(widget)
+            return True
+        return False
+
     def update(self, events):
         """
         Update the status of the Menu using external events.
@@ -1338,6 +2352,16 @@ class Menu(object):
         :rtype: bool
         """
         assert isinstance(events, list)
+        stats = self._current._stats
+        if stats is not None:
+            stats.begin(_stats.STATS_PHASE_EVENTS)
+        tracer = _trace.tracer
+        if tracer is not None:
+            tracer.begin('Menu.update', 'menu', {'menu': self._current._id, 'events': len(events)})
+        events = self._filter_events(events)
+
+        # Start the frame, the reached deadlines of the widgets are fired
+        self._top._scheduler.tick()
 
         # If any widget status changes, set the status as True
         updated = False
@@ -1345,9 +2369,6 @@ class Menu(object):
         # Update mouse
         pygame.mouse.set_visible(self._current._mouse_visible)
 
-        # Surface needs an update
-        menu_surface_needs_update = False
-
         # Update scroll bars
         if self._current._scroll.update(events):
             updated = True
@@ -1365,115 +2386,32 @@ class Menu(object):
         else:
 
             for event in events:  # type: pygame.event.EventType
-
-                # noinspection PyUnresolvedReferences
-                if event.type == pygame.locals.QUIT or (
-                        event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and (
-                        event.mod == pygame.KMOD_LALT or event.mod == pygame.KMOD_RALT)):
-                    self._current._exit()
+                handler = self._event_handlers.get(event.type)
+                if handler is not None and handler(event):
                     updated = True
 
-                elif event.type == pygame.locals.KEYDOWN:
-
-                    # Check key event is valid
-                    if not _utils.check_key_pressed_valid(event):
-                        continue
-
-                    if event.key == _controls.KEY_MOVE_DOWN:
-                        self._current._select(self._current._index - 1)
-                        self._current._sounds.play_key_add()
-                    elif event.key == _controls.KEY_MOVE_UP:
-                        self._current._select(self._current._index + 1)
-                        self._current._sounds.play_key_add()
-                    elif event.key == _controls.KEY_LEFT and self._current._columns > 1:
-                        self._current._left()
-                        self._current._sounds.play_key_add()
-                    elif event.key == _controls.KEY_RIGHT and self._current._columns > 1:
-                        self._current._right()
-                        self._current._sounds.play_key_add()
-                    elif event.key == _controls.KEY_BACK and self._top._prev is not None:
-                        self._current._sounds.play_close_menu()
-                        self.reset(1)  # public, do not use _current
-                    elif event.key == _controls.KEY_CLOSE_MENU:
-                        self._current._sounds.play_close_menu()
-                        if self._current._close():
-                            updated = True
-
-                elif self._current._joystick and event.type == pygame.JOYHATMOTION:
-                    if event.value == _controls.JOY_UP:
-                        self._current._select(self._current._index - 1)
-                    elif event.value == _controls.JOY_DOWN:
-                        self._current._select(self._current._index + 1)
-                    elif event.value == _controls.JOY_LEFT and self._columns > 1:
-                        self._current._select(self._current._index - 1)
-                    elif event.value == _controls.JOY_RIGHT and self._columns > 1:
-                        self._current._select(self._current._index + 1)
-
-                elif self._current._joystick and event.type == pygame.JOYAXISMOTION:
-                    prev = self._current._joy_event
-                    self._current._joy_event = 0
-                    if event.axis == _controls.JOY_AXIS_Y and event.value < -_controls.JOY_DEADZONE:
-                        self._current._joy_event |= _JOY_EVENT_UP
-                    if event.axis == _controls.JOY_AXIS_Y and event.value > _controls.JOY_DEADZONE:
-                        self._current._joy_event |= _JOY_EVENT_DOWN
-                    if event.axis == _controls.JOY_AXIS_X and event.value < -_controls.JOY_DEADZONE and self._columns > 1:
-                        self._current._joy_event |= _JOY_EVENT_LEFT
-                    if event.axis == _controls.JOY_AXIS_X and event.value > _controls.JOY_DEADZONE and self._columns > 1:
-                        self._current._joy_event |= _JOY_EVENT_RIGHT
-                    if self._current._joy_event:
-                        self._current._handle_joy_event()
-                        if self._current._joy_event == prev:
-                            pygame.time.set_timer(_JOY_EVENT_REPEAT, _controls.JOY_REPEAT)
-                        else:
-                            pygame.time.set_timer(_JOY_EVENT_REPEAT, _controls.JOY_DELAY)
-                    else:
-                        pygame.time.set_timer(_JOY_EVENT_REPEAT, 0)
-
-                elif event.type == _JOY_EVENT_REPEAT:
-                    if self._current._joy_event:
-                        self._current._handle_joy_event()
-                        pygame.time.set_timer(_JOY_EVENT_REPEAT, _controls.JOY_REPEAT)
-                    else:
-                        pygame.time.set_timer(_JOY_EVENT_REPEAT, 0)
-
-                elif self._current._mouse and event.type == pygame.MOUSEBUTTONDOWN:
-                    for index in range(len(self._current._widgets)):
-                        widget = self._current._widgets[index]
-                        # Don't considere the mouse wheel (button 4 & 5)
-                        if event.button in (1, 2, 3) and \
-                                self._current._scroll.to_real_position(widget.get_rect()).collidepoint(*event.pos):
-                            self._current._select(index)
-
-                elif self._current._mouse and event.type == pygame.MOUSEBUTTONUP:
-                    self._current._sounds.play_click_mouse()
-                    widget = self._current._widgets[self._current._index]
-                    # Don't considere the mouse wheel (button 4 & 5)
-                    if event.button in (1, 2, 3) and \
-                            self._current._scroll.to_real_position(widget.get_rect()).collidepoint(*event.pos):
-                        new_event = pygame.event.Event(event.type, **event.dict)
-                        new_event.dict['origin'] = self._current._scroll.to_real_position((0, 0))
-                        new_event.pos = self._current._scroll.to_world_position(event.pos)
-                        widget.update((new_event,))  # This widget can change the current Menu to a submenu
-                        menu_surface_needs_update = menu_surface_needs_update or widget.surface_needs_update()
-                        updated = True  # It is updated
+                    # The clicked widget may have changed the current Menu
+                    if event.type == pygame.MOUSEBUTTONUP:
                         break
 
-        # Check if the position has changed
+        # Check if the size of the selected widget has changed, then the position
+        # of the widgets must be updated
         if len(self._current._widgets) > 0:
-            menu_surface_needs_update = menu_surface_needs_update or self._current._widgets[
-                self._current._index].surface_needs_update()
-
-        # This forces the rendering of all widgets
-        if menu_surface_needs_update:
-            self._current._widgets_surface = None
+            widget = self._current._widgets[self._current._index]
+            if widget.surface_needs_update():
+                self._current._update_widget_size(widget)
 
         # A widget has closed the Menu
         if not self.is_enabled():
             updated = True
 
+        if tracer is not None:
+            tracer.end()
+        if stats is not None:
+            stats.end()
         return updated
 
-    def mainloop(self, surface, bgfun=None, disable_loop=False, fps_limit=30):
+    def mainloop(self, surface, bgfun=None, disable_loop=False, fps_limit=30, idle=False):
         """
         Main loop of Menu. In this function, the Menu handle exceptions and draw.
         The Menu pauses the application and checks :py:mod:`pygame` events itself.
@@ -1495,6 +2433,8 @@ class Menu(object):
         :type disable_loop: bool
         :param fps_limit: Limit frame per second of the loop, if 0 there's no limit
         :type fps_limit: int, float
+        :param idle: If True, the loop waits for the events while nothing changes instead of drawing the Menu at fps_limit, and pauses while the window is minimized or unfocused. The background function must draw the same image on each call
+        :type idle: bool
         :return: None
         """
         assert isinstance(surface, pygame.Surface)
@@ -1503,6 +2443,7 @@ class Menu(object):
         assert isinstance(disable_loop, bool)
         assert isinstance(fps_limit, (int, float))
         assert fps_limit >= 0, 'fps limit cannot be negative'
+        assert isinstance(idle, bool)
 
         # NOTE: For Menu accesor, use only _current, as the Menu pointer can change through the execution
         if not self.is_enabled():
@@ -1510,23 +2451,170 @@ class Menu(object):
 
         self._background_function = bgfun
 
+        # The first frame is always drawn, the loop waits only once a frame
+        # has been presented
+        presented = False
         while True:
             self._current._clock.tick(fps_limit)
 
             # If loop, gather events by Menu and draw the background function, if this method
             # returns true then the mainloop will break
-            self.update(pygame.event.get())
-
-            # As event can change the status of the Menu, this has to be checked twice
-            if self.is_enabled():
-                self.draw(surface=surface)
-
-            pygame.display.flip()
+            events = pygame.event.get()
+            if idle and presented and len(events) == 0:
+                events = self._current._wait_events()
+            self._mainloop_step(surface, events)
+            presented = True
 
             if not self.is_enabled() or disable_loop:
                 self._background_function = None
                 return
 
+    def mainloop_async(self, surface, bgfun=None, fps_limit=30):
+        """
+        Coroutine version of :py:meth:`Menu.mainloop`, it updates and draws the
+        Menu once per frame and sleeps the rest of the frame, so the asyncio
+        loop can run other tasks (Python 3.5+).
+
+        .. code-block:: python
+
+            menu = pygameMenu.Menu(...)
+
+            await menu.mainloop_async(surface)
+
+        The coroutines returned by the callbacks of the widgets are scheduled
+        on the loop.
+
+        :param surface: Pygame surface to draw the Menu
+        :type surface: pygame.surface.SurfaceType
+        :param bgfun: Background function called on each loop iteration before drawing the Menu
+        :type bgfun: callable
+        :param fps_limit: Limit frame per second of the loop, if 0 there's no limit
+        :type fps_limit: int, float
+        :return: Coroutine that returns when the Menu is disabled
+        :rtype: coroutine
+        """
+        assert isinstance(surface, pygame.Surface)
+        if bgfun:
+            assert callable(bgfun), 'background function must be callable (a function)'
+        assert isinstance(fps_limit, (int, float))
+        assert fps_limit >= 0, 'fps limit cannot be negative'
+
+        # The syntax of coroutines is not supported by Python 2
+        from pygameMenu.async_mainloop import mainloop_async
+        return mainloop_async(self, surface, bgfun, fps_limit)
+
+    def _mainloop_step(self, surface, events):
+        """
+        Update the Menu with the given events, then draw it and update the display.
+
+        :param surface: Pygame surface to draw the Menu
+        :type surface: pygame.surface.SurfaceType
+        :param events: Pygame events as a list
+        :type events: list
+        :return: None
+        """
+        self.update(events)
+
+        # As event can change the status of the Menu, this has to be checked twice
+        rects = None
+        if self.is_enabled():
+            rects = self.draw(surface=surface)
+
+        # If the Menu returned the changed areas, update only those
+        if rects is not None:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+
+    def _wait_events(self):
+        """
+        Wait until an event is received or the selected widget must be updated.
+        If the window is minimized or unfocused, wait for an event.
+
+        :return: Pygame events as a list
+        :rtype: list
+        """
+        delay = None
+        if pygame.display.get_active() and pygame.key.get_focused():
+            delay = self._top._scheduler.get_delay()
+            if len(self._widgets) > 0 and self._index >= 0:
+                widget_delay = self._widgets[self._index].get_update_delay()
+                if widget_delay is not None:
+                    delay = widget_delay if delay is None else min(delay, widget_delay)
+        if delay is None:
+            event = pygame.event.wait()
+        elif delay <= 0:
+            return []
+        else:
+            try:
+                event = pygame.event.wait(int(math.ceil(delay)))
+            except TypeError:  # pygame<2 cannot wait with a timeout
+                pygame.time.wait(int(math.ceil(delay)))
+                return pygame.event.get()
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:  # Not timed out
+            events.insert(0, event)
+        return events
+
+    def get_stats(self, current=True):
+        """
+        Return the statistics of the Menu, it must be created with ``stats=True``.
+
+        The timings (ms) of the last frames are given for each phase: ``events``
+        (update of the Menu and the widgets), ``layout`` (position of the widgets),
+        ``render`` (render and draw of the widgets), ``scroll`` (blit of the widgets
+        through the scroll area) and ``compositing`` (rest of the draw). The
+        counters are given since the last reset.
+
+        .. code-block:: python
+
+            {
+                'counters': {'layouts': 1, 'layout_updates': 0, 'surfaces': 1,
+                             'widgets_rendered': 12, 'widgets_skipped': 240},
+                'frames': 60,
+                'timings': {'events': {'last': 0.1, 'max': 0.4, 'mean': 0.12}, ...}
+            }
+
+        :param current: If True, returns the value from the current active Menu, otherwise from the base Menu
+        :type current: bool
+        :return: Statistics
+        :rtype: dict
+        """
+        assert isinstance(current, bool)
+        menu = self._current if current else self
+        assert menu._stats is not None, 'stats are not enabled on the Menu'
+        return menu._stats.get()
+
+    def reset_stats(self, current=True):
+        """
+        Reset the timings and the counters of the Menu.
+
+        :param current: If True, resets the current active Menu, otherwise the base Menu
+        :type current: bool
+        :return: None
+        """
+        assert isinstance(current, bool)
+        menu = self._current if current else self
+        assert menu._stats is not None, 'stats are not enabled on the Menu'
+        menu._stats.reset()
+
+    def get_scheduler(self):
+        """
+        Return the scheduler shared by the Menu, its submenus and their widgets.
+        It gives the time of the current frame and fires the deadlines of the
+        animations (cursor blink, key and joystick repeat).
+
+        .. code-block:: python
+
+            clock = pygameMenu.scheduler.FakeClock()
+            menu.get_scheduler().set_clock(clock)
+            clock.advance(500)  # The deadlines are fired by the next update
+
+        :return: Scheduler
+        :rtype: :py:class:`pygameMenu.scheduler.Scheduler`
+        """
+        return self._top._scheduler
+
     def get_input_data(self, recursive=False, current=True):
         """
         Return input data from a Menu. The results are given as a dict object.
@@ -1567,6 +2655,8 @@ class Menu(object):
                 data[widget.get_id()] = widget.get_value()
             except ValueError:  # Widget does not return data
                 pass
+        if self._virtual_row is not None:
+            data[self._virtual_id] = self._virtual_first + self._index
         if recursive:
             depth += 1
             for menu in self._submenus:  # type: Menu
@@ -1660,11 +2750,43 @@ class Menu(object):
         assert isinstance(current, bool)
         self.full_reset(current=current)  # public, do not use _current
         if current:
+            self._current._cancel_deadlines()
             del self._current._widgets[:]
             del self._current._submenus[:]
+            self._current._widgets_id.clear()
+            self._current._widgets_version += 1
+            self._current._virtual_id = ''
+            self._current._virtual_row = None
+            self._current._widgets_surface = None
         else:
+            self._cancel_deadlines()
             del self._widgets[:]
             del self._submenus[:]
+            self._widgets_id.clear()
+            self._widgets_version += 1
+            self._virtual_id = ''
+            self._virtual_row = None
+            self._widgets_surface = None
+
+    def _cancel_deadlines(self, visited=None):
+        """
+        Cancel the deadlines of the widgets of the Menu and its submenus, so
+        the scheduler does not keep the removed widgets.
+
+        :param visited: Menus already visited
+        :type visited: set, NoneType
+        :return: None
+        """
+        if visited is None:
+            visited = set()
+        if self in visited:
+            return
+        visited.add(self)
+        scheduler = self.get_scheduler()
+        for widget in self._widgets:
+            scheduler.cancel_owner(widget)
+        for menu in self._submenus:
+            menu._cancel_deadlines(visited)
 
     def _open(self, menu):
         """
@@ -1732,6 +2854,15 @@ class Menu(object):
             else:
                 dwidget = 1
 
+        # Rows of a virtual list out of the pool move the pool first
+        if current._virtual_row is not None:
+            row = (current._virtual_first + new_index) % current._virtual_rows
+            if row < current._virtual_first:
+                current._set_virtual_window(row - current._virtual_extra_rows)
+            elif row >= current._virtual_first + len(current._widgets):
+                current._set_virtual_window(row - len(current._widgets) + 1 + current._virtual_extra_rows)
+            new_index = row - current._virtual_first
+
         # Limit the index to the length
         new_index %= len(current._widgets)
         if new_index == current._index:  # Index has not changed
@@ -1756,7 +2887,7 @@ class Menu(object):
 
         # Scroll to rect
         rect = new_widget.get_rect()
-        if current._index == 0:  # Scroll to the top of the Menu
+        if current._index == 0 and current._virtual_first == 0:  # Scroll to the top of the Menu
             rect = pygame.Rect(rect.x, 0, rect.width, rect.height)
         current._scroll.scroll_to_rect(rect)
 
@@ -1817,15 +2948,37 @@ class Menu(object):
         :return: Widget object
         :rtype: :py:class:`pygameMenu.widgets.core.widget.Widget`
         """
-        for widget in self._widgets:  # type: _widgets.Widget
-            if widget.get_id() == widget_id:
-                return widget
-        if recursive:
-            for menu in self._submenus:  # type: Menu
-                widget = menu.get_widget(widget_id, recursive)
-                if widget:
-                    return widget
-        return None
+        if not recursive:
+            return self._widgets_id.get(widget_id)
+        if self._widgets_tree_id is None or \
+                any(menu._widgets_version != version for menu, version in self._widgets_tree_id_versions):
+            self._update_widgets_tree_id()
+        return self._widgets_tree_id.get(widget_id)
+
+    def _update_widgets_tree_id(self):
+        """
+        Build the index of the widget IDs of the Menu and all sub-menus.
+        If an ID is found in several menus, the Menu and then the sub-menus
+        (depth-first, in order of addition) take precedence. The index is
+        outdated when the version of any of these menus changes.
+
+        :return: None
+        """
+        tree = {}
+        versions = []
+        visited = set()
+        menus = [self]
+        while len(menus) > 0:
+            menu = menus.pop()  # type: Menu
+            if menu in visited:  # A sub-menu can link to a previous Menu
+                continue
+            visited.add(menu)
+            versions.append((menu, menu._widgets_version))
+            for widget_id, widget in menu._widgets_id.items():
+                tree.setdefault(widget_id, widget)
+            menus.extend(reversed(menu._submenus))
+        self._widgets_tree_id = tree
+        self._widgets_tree_id_versions = versions
 
     def get_index(self, current=True):
         """
@@ -0,0 +1,186 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+SCHEDULER
+Shared clock and deadlines of the Menu and its widgets.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+import pygame
+
+
+class FakeClock(object):
+    """
+    Clock whose time only changes when it is advanced, to run the Menu
+    deterministically (tests, replays).
+
+    :param time: Initial time (ms)
+    :type time: int, float
+    """
+
+    def __init__(self, time=0):
+        assert isinstance(time, (int, float))
+        self.time = time
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, ms):
+        """
+        Advance the time.
+
+        :param ms: Time to add (ms)
+        :type ms: int, float
+        :return: None
+        """
+        assert isinstance(ms, (int, float))
+        assert ms >= 0, 'time cannot go back'
+        self.time += ms
+
+
+class Scheduler(object):
+    """
+    Clock shared by a Menu and its widgets. The time is read once per frame
+    by :py:meth:`tick`, so all the animations use the same timestamp, and the
+    deadlines registered by the widgets (cursor blink, key repeat, ...) are
+    fired when they are reached.
+
+    :param clock: Function that returns the time (ms), pygame ticks by default
+    :type clock: callable, NoneType
+    """
+
+    def __init__(self, clock=None):
+        self._clock = None  # type: callable
+        self._deadlines = {}  # Key => [time, callback]
+        self._time = 0  # type: (int,float)
+        self.set_clock(clock)
+
+    def set_clock(self, clock=None):
+        """
+        Set the function that returns the time, the frame time is read again.
+
+        :param clock: Function that returns the time (ms), pygame ticks if None
+        :type clock: callable, NoneType
+        :return: None
+        """
+        if clock is None:
+            clock = pygame.time.get_ticks
+        assert callable(clock), 'clock must be callable'
+        self._clock = clock
+        self._time = clock()
+
+    def get_time(self):
+        """
+        Return the time of the current frame.
+
+        :return: Time (ms)
+        :rtype: int, float
+        """
+        return self._time
+
+    def tick(self):
+        """
+        Start a new frame, read the time and fire the reached deadlines in
+        order. The deadlines scheduled by the callbacks are fired in the next
+        frames.
+
+        :return: Number of fired deadlines
+        :rtype: int
+        """
+        self._time = self._clock()
+        due = [(deadline[0], key) for key, deadline in self._deadlines.items() if deadline[0] <= self._time]
+        due.sort(key=lambda d: d[0])
+        fired = 0
+        for time, key in due:
+            deadline = self._deadlines.get(key)
+            if deadline is None or deadline[0] != time:  # Cancelled or scheduled again by a callback
+                continue
+            del self._deadlines[key]
+            deadline[1]()
+            fired += 1
+        return fired
+
+    def schedule(self, key, delay, callback):
+        """
+        Register a deadline, the previous one with the same key is replaced.
+
+        :param key: Key of the deadline
+        :type key: object
+        :param delay: Time from the current frame (ms)
+        :type delay: int, float
+        :param callback: Function called without arguments when the deadline is reached
+        :type callback: callable
+        :return: None
+        """
+        assert isinstance(delay, (int, float))
+        assert callable(callback), 'callback must be callable'
+        self._deadlines[key] = [self._time + max(0, delay), callback]
+
+    def cancel(self, key):
+        """
+        Remove a deadline if it is registered.
+
+        :param key: Key of the deadline
+        :type key: object
+        :return: None
+        """
+        self._deadlines.pop(key, None)
+
+    def cancel_owner(self, owner):
+        """
+        Remove the deadlines whose key is a tuple starting with the given
+        owner, for example all the deadlines of a widget.
+
+        :param owner: Owner of the deadlines
+        :type owner: object
+        :return: None
+        """
+        for key in list(self._deadlines.keys()):
+            if isinstance(key, tuple) and len(key) > 0 and key[0] is owner:
+                del self._deadlines[key]
+
+    def is_scheduled(self, key):
+        """
+        Return True if a deadline is registered with the given key.
+
+        :param key: Key of the deadline
+        :type key: object
+        :return: Deadline registered
+        :rtype: bool
+        """
+        return key in self._deadlines
+
+    def get_delay(self):
+        """
+        Return the time from the current clock time to the next deadline.
+
+        :return: Delay in ms, None if there is no deadline
+        :rtype: int, float, NoneType
+        """
+        if len(self._deadlines) == 0:
+            return None
+        return max(0, min(deadline[0] for deadline in self._deadlines.values()) - self._clock())
@@ -102,6 +102,8 @@ class ScrollArea(object):
 
         self._rect = pygame.Rect(0.0, 0.0, area_width, area_height)
         self._world = world
+        self._world_origin = (0, 0)
+        self._world_size = None  # type: (tuple,None)
         self._scrollbars = []
         self._scrollbar_positions = tuple(set(scrollbars))  # Ensure unique
         self._scrollbar_thick = scrollbar_thick
@@ -208,7 +210,7 @@ class ScrollArea(object):
         """
         if not self._world:
             return 0
-        return max(0, self._world.get_width() - self._view_rect.width)
+        return max(0, self.get_world_size()[0] - self._view_rect.width)
 
     def get_hidden_height(self):
         """
@@ -219,7 +221,7 @@ class ScrollArea(object):
         """
         if not self._world:
             return 0
-        return max(0, self._world.get_height() - self._view_rect.height)
+        return max(0, self.get_world_size()[1] - self._view_rect.height)
 
     def get_offsets(self):
         """
@@ -231,10 +233,10 @@ class ScrollArea(object):
         for sbar in self._scrollbars:  # type: ScrollBar
             if sbar.get_orientation() == _locals.ORIENTATION_HORIZONTAL:
                 if self.get_hidden_width():
-                    offsets[0] = sbar.get_value()
+                    offsets[0] = sbar.get_value() - self._world_origin[0]
             else:
                 if self.get_hidden_height():
-                    offsets[1] = sbar.get_value()
+                    offsets[1] = sbar.get_value() - self._world_origin[1]
         return offsets
 
     def get_rect(self):
@@ -257,15 +259,17 @@ class ScrollArea(object):
         :return: None
         """
         rect = pygame.Rect(self._rect)
+        if self._world:
+            world_width, world_height = self.get_world_size()
 
         # No scrollbar: area is enought large to display world
-        if not self._world or (self._world.get_width() <= self._rect.width
-                               and self._world.get_height() <= self._rect.height):
+        if not self._world or (world_width <= self._rect.width
+                               and world_height <= self._rect.height):
             return rect
 
         # All scrollbars: the world is too large
-        if self._world.get_height() > self._rect.height \
-                and self._world.get_width() > self._rect.width:
+        if world_height > self._rect.height \
+                and world_width > self._rect.width:
             if _locals.POSITION_WEST in self._scrollbar_positions:
                 rect.left += self._scrollbar_thick
                 rect.width -= self._scrollbar_thick
@@ -290,26 +294,26 @@ class ScrollArea(object):
         if _locals.POSITION_EAST in self._scrollbar_positions:
             bars_total_width += self._scrollbar_thick
 
-        if self._world.get_height() > self._rect.height:
+        if world_height > self._rect.height:
             if _locals.POSITION_WEST in self._scrollbar_positions:
                 rect.left += self._scrollbar_thick
                 rect.width -= self._scrollbar_thick
             if _locals.POSITION_EAST in self._scrollbar_positions:
                 rect.width -= self._scrollbar_thick
-            if self._world.get_width() > self._rect.width - bars_total_width:
+            if world_width > self._rect.width - bars_total_width:
                 if _locals.POSITION_NORTH in self._scrollbar_positions:
                     rect.top += self._scrollbar_thick
                     rect.height -= self._scrollbar_thick
                 if _locals.POSITION_SOUTH in self._scrollbar_positions:
                     rect.height -= self._scrollbar_thick
 
-        if self._world.get_width() > self._rect.width:
+        if world_width > self._rect.width:
             if _locals.POSITION_NORTH in self._scrollbar_positions:
                 rect.top += self._scrollbar_thick
                 rect.height -= self._scrollbar_thick
             if _locals.POSITION_SOUTH in self._scrollbar_positions:
                 rect.height -= self._scrollbar_thick
-            if self._world.get_height() > self._rect.height - bars_total_height:
+            if world_height > self._rect.height - bars_total_height:
                 if _locals.POSITION_WEST in self._scrollbar_positions:
                     rect.left += self._scrollbar_thick
                     rect.width -= self._scrollbar_thick
@@ -318,6 +322,31 @@ class ScrollArea(object):
 
         return rect
 
+    def get_world_size(self):
+        """
+        Return the size of the world. If the world surface is only a part of a
+        larger virtual world, the size of the virtual world is returned.
+
+        :return: Width and height in px
+        :rtype: tuple
+        """
+        if self._world_size is not None:
+            return self._world_size
+        if not self._world:
+            return 0, 0
+        return self._world.get_size()
+
+    def get_world_view_rect(self):
+        """
+        Return the part of the world displayed by the viewable area, in the
+        world surface reference.
+
+        :return: Rect in the world surface reference
+        :rtype: pygame.rect.RectType
+        """
+        offsets = self.get_offsets()
+        return pygame.Rect(offsets[0], offsets[1], self._view_rect.width, self._view_rect.height)
+
     def get_scrollbar_thickness(self, orientation):
         """
         Return the scroll thickness of the area. If it's hidden return zero.
@@ -409,15 +438,28 @@ class ScrollArea(object):
         self._rect.y = posy
         self._apply_size_changes()
 
-    def set_world(self, surface):
+    def set_world(self, surface, size=None, origin=(0, 0)):
         """
         Update the scrolled surface.
 
+        The surface may be only a part of a larger virtual world, then the
+        size of the virtual world and the position of the surface within it
+        (origin) must be given. The positions in the world surface reference
+        are always relative to the surface.
+
         :param surface: New world surface
         :type surface: pygame.SurfaceType
+        :param size: Size of the virtual world (width, height), if None the size of the surface is used
+        :type size: tuple, NoneType
+        :param origin: Position of the surface within the virtual world (x, y)
+        :type origin: tuple
         :return: None
         """
+        assert isinstance(size, (tuple, type(None)))
+        assert isinstance(origin, tuple) and len(origin) == 2
         self._world = surface
+        self._world_size = size
+        self._world_origin = origin
         self._apply_size_changes()
 
     def to_real_position(self, virtual):
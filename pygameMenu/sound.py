@@ -37,6 +37,7 @@ import time as _time
 from pygame import error as _pygame_error
 from pygame import mixer as _mixer
 from pygame import vernum as _pygame_version
+import pygameMenu.trace as _trace
 
 try:  # pygame<2.0.0 compatibility
     from pygame import AUDIO_ALLOW_CHANNELS_CHANGE as _AUDIO_ALLOW_CHANNELS_CHANGE
@@ -116,45 +117,17 @@ class Sound(object):
         assert channels > 0, 'channels must be greater than zero'
         assert buffer > 0, 'buffer size must be greater than zero'
 
-        # Initialize sounds if not initialized
-        if (_mixer.get_init() is None and SOUND_INITIALIZED[0] is False) or force_init:
-
-            # Set sound as initialized globally
-            SOUND_INITIALIZED[0] = True
-
-            # Check pygame version
-            version_major, _, version_minor = _pygame_version
-
-            # noinspection PyBroadException
-            try:
-                # <= 1.9.4
-                if version_major == 1 and version_minor <= 4:
-                    _mixer.init(frequency=frequency,
-                                size=size,
-                                channels=channels,
-                                buffer=buffer)
-
-                # <2.0.0 & >= 1.9.5
-                elif version_major == 1 and version_minor > 4:  # lgtm [py/redundant-comparison]
-                    _mixer.init(frequency=frequency,
-                                size=size,
-                                channels=channels,
-                                buffer=buffer,
-                                devicename=devicename)
-
-                # >= 2.0.0
-                elif version_major > 1:
-                    _mixer.init(frequency=frequency,
-                                size=size,
-                                channels=channels,
-                                buffer=buffer,
-                                devicename=devicename,
-                                allowedchanges=allowedchanges)
-
-            except Exception as e:
-                print('sound error: ' + str(e))
-            except _pygame_error as e:
-                print('sound engine could not be initialized, pygame error: ' + str(e))
+        # The mixer is initialized when the first sound is loaded or played
+        self._mixer_settings = {
+            'allowedchanges': allowedchanges,
+            'buffer': buffer,
+            'channels': channels,
+            'devicename': devicename,
+            'frequency': frequency,
+            'size': size
+        }
+        if force_init:
+            self._init_mixer(force_init=True)
 
         # Channel where a sound is played
         self._channel = None  # type: (_mixer.ChannelType,None)
@@ -182,6 +155,54 @@ class Sound(object):
         # Other (dev)
         self._verbose = True
 
+    def _init_mixer(self, force_init=False):
+        """
+        Initialize the mixer if not initialized.
+
+        :param force_init: Force mixer init with new parameters
+        :type force_init: bool
+        :return: None
+        """
+        settings = self._mixer_settings
+        if (_mixer.get_init() is None and SOUND_INITIALIZED[0] is False) or force_init:
+
+            # Set sound as initialized globally
+            SOUND_INITIALIZED[0] = True
+
+            # Check pygame version
+            version_major, _, version_minor = _pygame_version
+
+            # noinspection PyBroadException
+            try:
+                # <= 1.9.4
+                if version_major == 1 and version_minor <= 4:
+                    _mixer.init(frequency=settings['frequency'],
+                                size=settings['size'],
+                                channels=settings['channels'],
+                                buffer=settings['buffer'])
+
+                # <2.0.0 & >= 1.9.5
+                elif version_major == 1 and version_minor > 4:  # lgtm [py/redundant-comparison]
+                    _mixer.init(frequency=settings['frequency'],
+                                size=settings['size'],
+                                channels=settings['channels'],
+                                buffer=settings['buffer'],
+                                devicename=settings['devicename'])
+
+                # >= 2.0.0
+                elif version_major > 1:
+                    _mixer.init(frequency=settings['frequency'],
+                                size=settings['size'],
+                                channels=settings['channels'],
+                                buffer=settings['buffer'],
+                                devicename=settings['devicename'],
+                                allowedchanges=settings['allowedchanges'])
+
+            except Exception as e:
+                print('sound error: ' + str(e))
+            except _pygame_error as e:
+                print('sound engine could not be initialized, pygame error: ' + str(e))
+
     def get_channel(self):
         """
         Return the channel of the sound engine.
@@ -189,6 +210,7 @@ class Sound(object):
         :return: Channel
         :rtype: :py:class:`pygame.mixer.Channel`
         """
+        self._init_mixer()
         channel = _mixer.find_channel()
         if self._uniquechannel:  # If the channel is unique
             if self._channel is None:  # If the channel has not been set
@@ -240,6 +262,7 @@ class Sound(object):
             raise IOError('sound file "{0}" does not exist'.format(sound_file))
 
         # Load the sound
+        self._init_mixer()
         try:
             sound_data = _mixer.Sound(file=sound_file)
         except _pygame_error:
@@ -308,6 +331,8 @@ class Sound(object):
 
         # If the previous sound is the same and has not ended (max 20% overlap)
         if sound['type'] != self._last_play or time - self._last_time >= 0.2 * sound['length'] or self._uniquechannel:
+            if _trace.tracer is not None:
+                _trace.tracer.begin('Sound.play', 'sound', {'type': sound['type']})
             try:
                 if self._uniquechannel:  # Stop the current channel if it's unique
                     channel.stop()
@@ -318,6 +343,8 @@ class Sound(object):
                              )
             except _pygame_error:  # Ignore errors
                 pass
+            if _trace.tracer is not None:
+                _trace.tracer.end()
 
         # Store last execution
         self._last_play = sound['type']
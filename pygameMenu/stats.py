@@ -0,0 +1,157 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+STATS
+Frame statistics of the Menu.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import deque as _deque
+from timeit import default_timer as _timer
+
+# Phases of a frame
+STATS_PHASE_COMPOSITING = 'compositing'  # Draw of the Menu except the widgets and the scroll area
+STATS_PHASE_EVENTS = 'events'  # Update of the Menu and the widgets with the events
+STATS_PHASE_LAYOUT = 'layout'  # Position of the widgets and build of the widgets surface
+STATS_PHASE_RENDER = 'render'  # Render and draw of the widgets on the widgets surface
+STATS_PHASE_SCROLL = 'scroll'  # Blit of the widgets surface through the scroll area
+
+# Counters
+STATS_LAYOUTS = 'layouts'  # Layouts of all the widgets
+STATS_LAYOUT_UPDATES = 'layout_updates'  # Layout updates after the size of a widget changed
+STATS_SURFACES = 'surfaces'  # Widgets surfaces allocated
+STATS_WIDGETS_RENDERED = 'widgets_rendered'  # Widgets rendered because their render hash changed
+STATS_WIDGETS_SKIPPED = 'widgets_skipped'  # Widgets render skipped because their render hash did not change
+
+_PHASES = (STATS_PHASE_COMPOSITING, STATS_PHASE_EVENTS, STATS_PHASE_LAYOUT, STATS_PHASE_RENDER, STATS_PHASE_SCROLL)
+_COUNTERS = (STATS_LAYOUTS, STATS_LAYOUT_UPDATES, STATS_SURFACES, STATS_WIDGETS_RENDERED, STATS_WIDGETS_SKIPPED)
+
+
+class MenuStats(object):
+    """
+    Timings of the phases of the last frames and counters of a Menu.
+
+    Phases can be nested (e.g. a layout triggered by the events), the time
+    of a phase does not include the time of the phases started within it.
+
+    :param frames: Number of frames used to compute the rolling timings
+    :type frames: int
+    """
+
+    def __init__(self, frames=60):
+        assert isinstance(frames, int)
+        assert frames > 0, 'number of frames must be greater than zero'
+        self._counters = {}  # type: dict
+        self._frame = {}  # type: dict
+        self._frames = _deque(maxlen=frames)
+        self._stack = []  # type: list
+        self._start = 0.0  # type: float
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the timings and the counters.
+
+        :return: None
+        """
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+        self._frame = dict.fromkeys(_PHASES, 0.0)
+        self._frames.clear()
+        del self._stack[:]
+
+    def begin(self, phase):
+        """
+        Start measuring a phase, the current phase (if any) is paused until
+        the end of the new one.
+
+        :param phase: Phase name
+        :type phase: basestring
+        :return: None
+        """
+        now = _timer()
+        if len(self._stack) > 0:
+            self._frame[self._stack[-1]] += now - self._start
+        self._stack.append(phase)
+        self._start = now
+
+    def end(self):
+        """
+        Stop measuring the last phase started, and resume the previous one.
+
+        :return: None
+        """
+        now = _timer()
+        self._frame[self._stack.pop()] += now - self._start
+        self._start = now
+
+    def end_frame(self):
+        """
+        Store the timings of the current frame and start a new one.
+
+        :return: None
+        """
+        self._frames.append(self._frame)
+        self._frame = dict.fromkeys(_PHASES, 0.0)
+
+    def count(self, counter, value=1):
+        """
+        Increase a counter.
+
+        :param counter: Counter name
+        :type counter: basestring
+        :param value: Value added to the counter
+        :type value: int
+        :return: None
+        """
+        self._counters[counter] += value
+
+    def get(self):
+        """
+        Return the statistics as a dict:
+
+        - ``frames``: number of frames of the rolling timings
+        - ``timings``: ``{phase: {'last': ms, 'mean': ms, 'max': ms}}``
+        - ``counters``: ``{counter: value}`` since the last reset
+
+        :return: Statistics
+        :rtype: dict
+        """
+        timings = {}
+        for phase in _PHASES:
+            values = [frame[phase] * 1000.0 for frame in self._frames]
+            if len(values) == 0:
+                values = [0.0]
+            timings[phase] = {
+                'last': values[-1],
+                'max': max(values),
+                'mean': sum(values) / len(values)
+            }
+        return {
+            'counters': dict(self._counters),
+            'frames': len(self._frames),
+            'timings': timings
+        }
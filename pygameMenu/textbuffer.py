@@ -0,0 +1,263 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEXT BUFFER
+Editable text storage and edition history of the text inputs.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import deque as _deque
+
+
+class GapBuffer(object):
+    """
+    Editable text stored as a list of characters with a gap at the last
+    edition position, so consecutive insertions and deletions only move the
+    characters between two edition positions.
+
+    :param text: Initial text
+    :type text: basestring
+    :param gap: Initial size of the gap
+    :type gap: int
+    """
+
+    def __init__(self, text='', gap=64):
+        assert isinstance(gap, int)
+        assert gap > 0, 'gap size must be greater than zero'
+        self._buffer = []  # type: list
+        self._gap_end = 0
+        self._gap_size = gap
+        self._gap_start = 0
+        self._text = None  # Text cache, None if the buffer changed
+        self._version = 0  # Incremented on each change
+        self.set_text(text)
+
+    def __len__(self):
+        return len(self._buffer) - (self._gap_end - self._gap_start)
+
+    def _move_gap(self, position):
+        """
+        Move the gap to the given position of the text.
+
+        :param position: Position
+        :type position: int
+        :return: None
+        """
+        buffer = self._buffer
+        if position < self._gap_start:
+            count = self._gap_start - position
+            buffer[self._gap_end - count:self._gap_end] = buffer[position:self._gap_start]
+            self._gap_start = position
+            self._gap_end -= count
+        elif position > self._gap_start:
+            count = position - self._gap_start
+            buffer[self._gap_start:self._gap_start + count] = buffer[self._gap_end:self._gap_end + count]
+            self._gap_start += count
+            self._gap_end += count
+
+    def insert(self, position, text):
+        """
+        Insert a text.
+
+        :param position: Position of the text, from 0 to its length
+        :type position: int
+        :param text: Inserted text
+        :type text: basestring
+        :return: None
+        """
+        assert 0 <= position <= len(self), 'position out of the text'
+        if text == '':
+            return
+        self._move_gap(position)
+        if len(text) > self._gap_end - self._gap_start:  # Grow the gap
+            gap = len(text) + max(self._gap_size, len(self))
+            self._buffer[self._gap_end:self._gap_end] = [''] * gap
+            self._gap_end += gap
+        self._buffer[self._gap_start:self._gap_start + len(text)] = text
+        self._gap_start += len(text)
+        self._text = None
+        self._version += 1
+
+    def delete(self, position, count):
+        """
+        Delete characters.
+
+        :param position: Position of the first deleted character
+        :type position: int
+        :param count: Number of deleted characters
+        :type count: int
+        :return: Deleted text
+        :rtype: basestring
+        """
+        count = max(0, min(count, len(self) - position))
+        if count == 0:
+            return ''
+        self._move_gap(position)
+        removed = ''.join(self._buffer[self._gap_end:self._gap_end + count])
+        self._gap_end += count
+        self._text = None
+        self._version += 1
+        return removed
+
+    def get_text(self, start=0, end=None):
+        """
+        Return the text, or a part of it.
+
+        :param start: Position of the first character
+        :type start: int
+        :param end: Position after the last character, None until the end
+        :type end: int, NoneType
+        :return: Text
+        :rtype: basestring
+        """
+        length = len(self)
+        end = length if end is None else max(start, min(end, length))
+        if self._text is not None:
+            return self._text[start:end]
+        buffer = self._buffer
+        gap = self._gap_end - self._gap_start
+        if end <= self._gap_start:
+            text = ''.join(buffer[start:end])
+        elif start >= self._gap_start:
+            text = ''.join(buffer[start + gap:end + gap])
+        else:
+            text = ''.join(buffer[start:self._gap_start]) + ''.join(buffer[self._gap_end:end + gap])
+        if start == 0 and end == length:
+            self._text = text
+        return text
+
+    def set_text(self, text):
+        """
+        Replace the text.
+
+        :param text: New text
+        :type text: basestring
+        :return: None
+        """
+        self._buffer = list(text) + [''] * self._gap_size
+        self._gap_start = len(text)
+        self._gap_end = len(self._buffer)
+        self._text = text
+        self._version += 1
+
+    def get_version(self):
+        """
+        Return the number of changes of the text, to check if it has changed.
+
+        :return: Version
+        :rtype: int
+        """
+        return self._version
+
+
+class EditHistory(object):
+    """
+    Bounded history of the editions of a text, each edition stores only the
+    removed and the inserted texts. Consecutive mergeable editions (typed
+    characters, backspaces or deletes) are stored as a single edition.
+
+    Each edition also stores a state (cursor, scroll, ...) of the editor,
+    which is swapped with the current one on undo and redo.
+
+    :param size: Maximum number of editions, if 0 the history is disabled
+    :type size: int
+    """
+
+    def __init__(self, size):
+        assert isinstance(size, int)
+        assert size >= 0, 'history size cannot be negative'
+        self._mergeable = False
+        self._redo = []  # type: list
+        self._undo = _deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._undo)
+
+    def push(self, position, removed, inserted, state, merge=False):
+        """
+        Add an edition, the undone editions are discarded.
+
+        :param position: Position of the edition
+        :type position: int
+        :param removed: Removed text
+        :type removed: basestring
+        :param inserted: Inserted text
+        :type inserted: basestring
+        :param state: State of the editor before the edition
+        :type state: object
+        :param merge: Merge with the previous edition if consecutive
+        :type merge: bool
+        :return: None
+        """
+        del self._redo[:]
+        if self._undo.maxlen == 0:
+            return
+        if merge and self._mergeable:
+            last = self._undo[-1]
+            if removed == '' and last[1] == '' and position == last[0] + len(last[2]):  # Typing
+                last[2] += inserted
+                return
+            if inserted == '' and last[2] == '':
+                if position + len(removed) == last[0]:  # Backspace
+                    last[0] = position
+                    last[1] = removed + last[1]
+                    return
+                if position == last[0]:  # Delete
+                    last[1] += removed
+                    return
+        self._undo.append([position, removed, inserted, state])
+        self._mergeable = merge
+
+    def undo(self):
+        """
+        Return the last edition to be undone, as a list [position, removed,
+        inserted, state] whose state can be swapped.
+
+        :return: Edition, None if there is nothing to undo
+        :rtype: list, NoneType
+        """
+        self._mergeable = False
+        if len(self._undo) == 0:
+            return None
+        edition = self._undo.pop()
+        self._redo.append(edition)
+        return edition
+
+    def redo(self):
+        """
+        Return the last undone edition to be done again, as a list [position,
+        removed, inserted, state] whose state can be swapped.
+
+        :return: Edition, None if there is nothing to redo
+        :rtype: list, NoneType
+        """
+        self._mergeable = False
+        if len(self._redo) == 0:
+            return None
+        edition = self._redo.pop()
+        self._undo.append(edition)
+        return edition
@@ -0,0 +1,145 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEXT CACHE
+Cache of the text surfaces rendered by the widgets.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import OrderedDict as _OrderedDict
+
+
+class TextCache(object):
+    """
+    Least recently used cache of rendered text surfaces, bounded by the
+    total size in bytes of the surfaces. The surfaces are shared, they must
+    not be modified.
+
+    :param max_bytes: Maximum size of the cached surfaces in bytes, if 0 the cache is disabled
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self._bytes = 0
+        self._hits = 0
+        self._max_bytes = 0
+        self._misses = 0
+        self._surfaces = _OrderedDict()
+        self.set_max_bytes(max_bytes)
+
+    def get(self, key):
+        """
+        Return the surface stored with the given key.
+
+        :param key: Key of the surface (font, size, text, color, ...)
+        :type key: tuple
+        :return: Surface, None if not cached
+        :rtype: pygame.surface.SurfaceType, NoneType
+        """
+        surface = self._surfaces.pop(key, None)
+        if surface is None:
+            self._misses += 1
+            return None
+        self._surfaces[key] = surface  # Most recently used
+        self._hits += 1
+        return surface
+
+    def put(self, key, surface):
+        """
+        Store a surface, the least recently used ones are discarded to keep
+        the size of the cache under the limit.
+
+        :param key: Key of the surface (font, size, text, color, ...)
+        :type key: tuple
+        :param surface: Rendered surface
+        :type surface: pygame.surface.SurfaceType
+        :return: None
+        """
+        size = surface.get_pitch() * surface.get_height()
+        if size > self._max_bytes:
+            return
+        old = self._surfaces.pop(key, None)
+        if old is not None:
+            self._bytes -= old.get_pitch() * old.get_height()
+        self._surfaces[key] = surface
+        self._bytes += size
+        self._evict()
+
+    def _evict(self):
+        """
+        Discard the least recently used surfaces until the size is under the limit.
+
+        :return: None
+        """
+        while self._bytes > self._max_bytes:
+            _, surface = self._surfaces.popitem(last=False)
+            self._bytes -= surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        """
+        Discard all the surfaces and reset the hit ratio.
+
+        :return: None
+        """
+        self._surfaces.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def set_max_bytes(self, max_bytes):
+        """
+        Set the maximum size of the cached surfaces.
+
+        :param max_bytes: Maximum size in bytes, if 0 the cache is disabled
+        :type max_bytes: int
+        :return: None
+        """
+        assert isinstance(max_bytes, int)
+        assert max_bytes >= 0, 'maximum size cannot be negative'
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def get_info(self):
+        """
+        Return the size and the efficiency of the cache.
+
+        :return: Dict, keys: bytes, entries, hit_ratio, hits, max_bytes, misses
+        :rtype: dict
+        """
+        total = self._hits + self._misses
+        return {
+            'bytes': self._bytes,
+            'entries': len(self._surfaces),
+            'hit_ratio': float(self._hits) / total if total > 0 else 0.0,
+            'hits': self._hits,
+            'max_bytes': self._max_bytes,
+            'misses': self._misses
+        }
+
+
+# Cache shared by all the widgets
+TEXT_CACHE = TextCache()
@@ -0,0 +1,224 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TRACE
+Timeline of the Menu frames in the Chrome Trace Event format.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from collections import deque as _deque
+from timeit import default_timer as _timer
+import json as _json
+import os as _os
+import threading as _threading
+
+# Active tracer, None if not tracing
+tracer = None  # type: (Tracer,None)
+
+
+class Tracer(object):
+    """
+    Records the spans (begin/end) of the Menu operations as complete events
+    of the Chrome Trace Event format, which can be opened in a trace viewer
+    (e.g. ``chrome://tracing`` or Perfetto).
+
+    The events are stored in a ring buffer. In slow-frame mode, the events of
+    a frame (until :py:meth:`Tracer.end_frame`, called by ``Menu.draw``) are
+    kept only if the frame took more than the threshold.
+
+    :param path: File written by :py:func:`stop_trace`, if None the events are only kept in the buffer
+    :type path: basestring, NoneType
+    :param buffer_size: Maximum number of events kept, the older ones are discarded
+    :type buffer_size: int
+    :param slow_frame_ms: If greater than zero, keep only the frames that took more than this time (ms)
+    :type slow_frame_ms: int, float
+    """
+
+    def __init__(self, path=None, buffer_size=100000, slow_frame_ms=0):
+        assert isinstance(path, (str, type(None)))
+        assert isinstance(buffer_size, int)
+        assert isinstance(slow_frame_ms, (int, float))
+        assert buffer_size > 0, 'buffer size must be greater than zero'
+        assert slow_frame_ms >= 0, 'slow frame threshold cannot be negative'
+        self._events = _deque(maxlen=buffer_size)
+        self._frame = []  # type: list
+        self._frame_start = None  # type: (float,None)
+        self._origin = _timer()
+        self._path = path
+        self._pid = _os.getpid()
+        self._slow_frame_ms = slow_frame_ms
+        self._stack = []  # type: list
+
+    def begin(self, name, category, args=None):
+        """
+        Start a span.
+
+        :param name: Name of the span
+        :type name: basestring
+        :param category: Category of the span
+        :type category: basestring
+        :param args: Additional data shown with the span
+        :type args: dict, NoneType
+        :return: None
+        """
+        start = _timer()
+        if self._frame_start is None:
+            self._frame_start = start
+        self._stack.append((name, category, args, start))
+
+    def end(self):
+        """
+        End the last span started.
+
+        :return: None
+        """
+        name, category, args, start = self._stack.pop()
+        self._add_event(name, category, args, start, _timer())
+
+    def end_frame(self):
+        """
+        End the current frame. In slow-frame mode the events of the frame are
+        discarded if the frame was fast enough.
+
+        :return: None
+        """
+        if self._frame_start is None:  # Nothing happened
+            return
+        end = _timer()
+        if self._slow_frame_ms == 0 or (end - self._frame_start) * 1000.0 >= self._slow_frame_ms:
+            self._events.extend(self._frame)
+            self._events.append(self._create_event('frame', 'frame', None, self._frame_start, end))
+        del self._frame[:]
+        self._frame_start = None
+
+    def _add_event(self, name, category, args, start, end):
+        """
+        Store a complete event.
+
+        :param name: Name of the span
+        :type name: basestring
+        :param category: Category of the span
+        :type category: basestring
+        :param args: Additional data shown with the span
+        :type args: dict, NoneType
+        :param start: Start time (s)
+        :type start: float
+        :param end: End time (s)
+        :type end: float
+        :return: None
+        """
+        event = self._create_event(name, category, args, start, end)
+        if self._slow_frame_ms > 0:
+            self._frame.append(event)
+        else:
+            self._events.append(event)
+
+    def _create_event(self, name, category, args, start, end):
+        """
+        Create a complete event of the Chrome Trace Event format.
+
+        :param name: Name of the span
+        :type name: basestring
+        :param category: Category of the span
+        :type category: basestring
+        :param args: Additional data shown with the span
+        :type args: dict, NoneType
+        :param start: Start time (s)
+        :type start: float
+        :param end: End time (s)
+        :type end: float
+        :return: Event
+        :rtype: dict
+        """
+        event = {
+            'cat': category,
+            'dur': (end - start) * 1e6,
+            'name': name,
+            'ph': 'X',
+            'pid': self._pid,
+            'tid': _threading.current_thread().ident,
+            'ts': (start - self._origin) * 1e6
+        }
+        if args is not None:
+            event['args'] = args
+        return event
+
+    def get_events(self):
+        """
+        Return the events recorded.
+
+        :return: Events list
+        :rtype: list[dict]
+        """
+        return list(self._events)
+
+    def write(self, path=None):
+        """
+        Write the events recorded to a JSON file.
+
+        :param path: File path, if None use the path of the tracer
+        :type path: basestring, NoneType
+        :return: None
+        """
+        if path is None:
+            path = self._path
+        assert path is not None, 'path of the trace file is not defined'
+        with open(path, 'w') as f:
+            _json.dump({'traceEvents': self.get_events(), 'displayTimeUnit': 'ms'}, f)
+
+
+def start_trace(path=None, buffer_size=100000, slow_frame_ms=0):
+    """
+    Start recording the operations of all the menus. See :py:class:`Tracer`.
+
+    :param path: File written by :py:func:`stop_trace`, if None the events are only kept in the buffer
+    :type path: basestring, NoneType
+    :param buffer_size: Maximum number of events kept, the older ones are discarded
+    :type buffer_size: int
+    :param slow_frame_ms: If greater than zero, keep only the frames that took more than this time (ms)
+    :type slow_frame_ms: int, float
+    :return: Tracer
+    :rtype: Tracer
+    """
+    global tracer
+    tracer = Tracer(path, buffer_size, slow_frame_ms)
+    return tracer
+
+
+def stop_trace():
+    """
+    Stop recording, and write the trace file if the tracer has a path.
+
+    :return: Tracer stopped, None if not tracing
+    :rtype: Tracer, NoneType
+    """
+    global tracer
+    stopped = tracer
+    tracer = None
+    if stopped is not None and stopped._path is not None:
+        stopped.write()
+    return stopped
@@ -30,6 +30,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
+import inspect
+
 import pygame
 import pygameMenu.locals as _locals
 
@@ -143,3 +145,41 @@ def make_surface(width, height, alpha=False):
     if alpha:
         surface = pygame.Surface.convert_alpha(surface)
     return surface
+
+
+# Tasks of the scheduled coroutines, the loop keeps only weak references to them
+_tasks = set()
+
+
+def schedule_coroutine(obj):
+    """
+    If the object returned by a callback is a coroutine (the callback is
+    defined with ``async def``), schedule it on the running asyncio loop,
+    or run it until complete if there's no running loop (Python 3.5+).
+
+    :param obj: Object returned by a callback
+    :type obj: any
+    :return: The object, the task scheduled, or the result of the coroutine
+    :rtype: any
+    """
+    if not (hasattr(inspect, 'iscoroutine') and inspect.iscoroutine(obj)):
+        return obj
+    import asyncio  # Python 3 only
+    try:
+        loop = asyncio.get_running_loop()
+    except AttributeError:  # Python<3.7
+        loop = asyncio.get_event_loop()
+    except RuntimeError:  # There's no running loop
+        loop = None
+    if loop is not None and loop.is_running():
+        task = loop.create_task(obj)
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+        return task
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(obj)
+        finally:
+            loop.close()
+    return loop.run_until_complete(obj)
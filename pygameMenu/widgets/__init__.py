@@ -30,21 +30,80 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-# Core
-from pygameMenu.widgets.core.widget import Widget
-from pygameMenu.widgets.core.selection import Selection
-
-# Selection
-from pygameMenu.widgets.selection.highlight import HighlightSelection
-from pygameMenu.widgets.selection.none import NoneSelection
-
-# Widgets
-from pygameMenu.widgets.widget.button import Button
-from pygameMenu.widgets.widget.colorinput import ColorInput
-from pygameMenu.widgets.widget.image import Image
-from pygameMenu.widgets.widget.label import Label
-from pygameMenu.widgets.widget.menubar import MenuBar
-from pygameMenu.widgets.widget.scrollbar import ScrollBar
-from pygameMenu.widgets.widget.selector import Selector
-from pygameMenu.widgets.widget.textinput import TextInput
-from pygameMenu.widgets.widget.vmargin import VMargin
+import sys as _sys
+
+# Module of the widget classes, imported on first access
+_CLASSES = {
+
+    # Core
+    'Selection': 'pygameMenu.widgets.core.selection',
+    'Widget': 'pygameMenu.widgets.core.widget',
+
+    # Selection
+    'HighlightSelection': 'pygameMenu.widgets.selection.highlight',
+    'NoneSelection': 'pygameMenu.widgets.selection.none',
+
+    # Widgets
+    'Button': 'pygameMenu.widgets.widget.button',
+    'ColorInput': 'pygameMenu.widgets.widget.colorinput',
+    'Image': 'pygameMenu.widgets.widget.image',
+    'Label': 'pygameMenu.widgets.widget.label',
+    'MenuBar': 'pygameMenu.widgets.widget.menubar',
+    'ScrollBar': 'pygameMenu.widgets.widget.scrollbar',
+    'Selector': 'pygameMenu.widgets.widget.selector',
+    'TextArea': 'pygameMenu.widgets.widget.textarea',
+    'TextInput': 'pygameMenu.widgets.widget.textinput',
+    'VMargin': 'pygameMenu.widgets.widget.vmargin',
+}
+
+__all__ = sorted(_CLASSES)
+
+if _sys.version_info >= (3, 7):
+    import importlib as _importlib
+
+
+    def __getattr__(name):
+        """
+        Import the widget classes on first access.
+
+        :param name: Class name
+        :type name: str
+        :return: Class
+        """
+        if name not in _CLASSES:
+            raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+        cls = getattr(_importlib.import_module(_CLASSES[name]), name)
+        globals()[name] = cls
+        return cls
+
+
+    def __dir__():
+        """
+        List the attributes of the module, including the widget classes.
+
+        :return: Attribute names
+        :rtype: list
+        """
+        return sorted(set(globals()) | set(__all__))
+
+else:  # Module __getattr__ is not supported, import everything
+
+    # Core
+    from pygameMenu.widgets.core.widget import Widget
+    from pygameMenu.widgets.core.selection import Selection
+
+    # Selection
+    from pygameMenu.widgets.selection.highlight import HighlightSelection
+    from pygameMenu.widgets.selection.none import NoneSelection
+
+    # Widgets
+    from pygameMenu.widgets.widget.button import Button
+    from pygameMenu.widgets.widget.colorinput import ColorInput
+    from pygameMenu.widgets.widget.image import Image
+    from pygameMenu.widgets.widget.label import Label
+    from pygameMenu.widgets.widget.menubar import MenuBar
+    from pygameMenu.widgets.widget.scrollbar import ScrollBar
+    from pygameMenu.widgets.widget.selector import Selector
+    from pygameMenu.widgets.widget.textarea import TextArea
+    from pygameMenu.widgets.widget.textinput import TextInput
+    from pygameMenu.widgets.widget.vmargin import VMargin
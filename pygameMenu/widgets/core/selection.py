@@ -30,6 +30,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
+import pygame
 from pygameMenu.utils import assert_color
 
 
@@ -94,6 +95,20 @@ class Selection(object):
         t, _, b, _ = self.get_height()
         return t + b
 
+    def inflate(self, rect):
+        """
+        Grow the given rect by the selection margins. The result is the
+        area covered by the selection drawn around a widget with that rect.
+
+        :param rect: Widget rect
+        :type rect: pygame.rect.RectType
+        :return: Inflated rect
+        :rtype: pygame.rect.RectType
+        """
+        t, l, b, r = self.get_margin()
+        return pygame.Rect(int(rect.x - l), int(rect.y - t),
+                           int(rect.width + l + r), int(rect.height + t + b))
+
     def draw(self, surface, widget):
         """
         Draw the selection.
@@ -33,10 +33,14 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import pygame
 import pygameMenu.font as _fonts
 import pygameMenu.locals as _locals
+import pygameMenu.trace as _trace
 
 from pygameMenu.widgets.core.selection import Selection
 from pygameMenu.sound import Sound
-from pygameMenu.utils import make_surface, assert_alignment, assert_color, assert_position
+from pygameMenu.glyphatlas import get_glyph_atlas
+from pygameMenu.stats import STATS_WIDGETS_RENDERED, STATS_WIDGETS_SKIPPED
+from pygameMenu.textcache import TEXT_CACHE
+from pygameMenu.utils import make_surface, assert_alignment, assert_color, assert_position, schedule_coroutine
 from uuid import uuid4
 
 
@@ -153,10 +157,12 @@ class Widget(object):
         :rtype: int
         """
         _hash = self._hash_variables(*args)
-        if _hash != self._last_render_hash:
+        changed = _hash != self._last_render_hash
+        if changed:
             self._last_render_hash = _hash
-            return True
-        return False
+        if self._menu is not None and self._menu._stats is not None:
+            self._menu._stats.count(STATS_WIDGETS_RENDERED if changed else STATS_WIDGETS_SKIPPED)
+        return changed
 
     def get_selection_effect(self):
         """
@@ -183,6 +189,9 @@ class Widget(object):
 
             callback_func( value, \*args, \*widget._args, \*\*widget._kwargs )
 
+        If the callback is a coroutine function, the coroutine is scheduled
+        on the running asyncio loop.
+
         with:
             - ``value`` (if something is returned by ``get_value()``)
             - ``args`` given to this method
@@ -198,7 +207,14 @@ class Widget(object):
                 args.insert(0, self.get_value())
             except ValueError:
                 pass
-            return self._on_return(*args, **self._kwargs)
+            tracer = _trace.tracer  # The callback may stop or start the trace
+            if tracer is None:
+                return schedule_coroutine(self._on_return(*args, **self._kwargs))
+            tracer.begin(getattr(self._on_return, '__name__', 'callback'), 'callback', {'id': self._id})
+            try:
+                return schedule_coroutine(self._on_return(*args, **self._kwargs))
+            finally:
+                tracer.end()
 
     def change(self, *args):
         """
@@ -207,6 +223,9 @@ class Widget(object):
 
             callback_func( value, \*args, \*widget._args, \*\*widget._kwargs )
 
+        If the callback is a coroutine function, the coroutine is scheduled
+        on the running asyncio loop.
+
         with:
             - ``value`` (if something is returned by ``get_value()``)
             - ``args`` given to this method
@@ -222,7 +241,14 @@ class Widget(object):
                 args.insert(0, self.get_value())
             except ValueError:
                 pass
-            return self._on_change(*args, **self._kwargs)
+            tracer = _trace.tracer  # The callback may stop or start the trace
+            if tracer is None:
+                return schedule_coroutine(self._on_change(*args, **self._kwargs))
+            tracer.begin(getattr(self._on_change, '__name__', 'callback'), 'callback', {'id': self._id})
+            try:
+                return schedule_coroutine(self._on_change(*args, **self._kwargs))
+            finally:
+                tracer.end()
 
     def draw(self, surface):
         """
@@ -287,6 +313,18 @@ class Widget(object):
         self._render()
         return self._rect.copy()
 
+    def _get_draw_state(self):
+        """
+        Return the variables that define how the widget looks once drawn. If
+        the state does not change between two frames, the widget does not
+        need to be drawn again. This forces the widget rendering.
+
+        :return: Draw state
+        :rtype: tuple
+        """
+        self._render()
+        return self._surface, self._rect.x, self._rect.y, self._rect.width, self._rect.height, self.selected
+
     def get_value(self):
         """
         Return the value. If exception ``ValueError`` is raised,
@@ -328,7 +366,15 @@ class Widget(object):
         :rtype: pygame.surface.SurfaceType
         """
         assert isinstance(color, tuple)
-        return self._font.render(text, self._font_antialias, color)
+        atlas = get_glyph_atlas(self._font, self._font_name, self._font_size, color, self._font_antialias)
+        if atlas is not None:
+            return atlas.render(text)
+        key = (self._font_name, self._font_size, text, color, self._font_antialias)
+        surface = TEXT_CACHE.get(key)
+        if surface is None:
+            surface = self._font.render(text, self._font_antialias, color)
+            TEXT_CACHE.put(key, surface)
+        return surface
 
     def _check_render_size_changed(self):
         """
@@ -357,14 +403,33 @@ class Widget(object):
         :return: Text surface
         :rtype: pygame.surface.SurfaceType
         """
-        text = self.font_render_string(string, color)
+        # The surfaces are shared by all the widgets, except the ones composed
+        # from glyph atlases as their texts change often
+        key = None
+        atlas = get_glyph_atlas(self._font, self._font_name, self._font_size, color, self._font_antialias)
+        if atlas is None:
+            shadow = None
+            if self._shadow:
+                shadow = (tuple(self._shadow_color), tuple(self._shadow_tuple))
+            key = (self._font_name, self._font_size, string, color, self._font_antialias, shadow, self._max_width)
+            surface = TEXT_CACHE.get(key)
+            if surface is not None:
+                return surface
+            text = self._font.render(string, self._font_antialias, color)
+        else:
+            text = atlas.render(string)
 
-        # Create surface
-        surface = make_surface(text.get_width(), text.get_height(), alpha=True)
+        # Create surface, empty strings may be rendered with zero width
+        surface = make_surface(max(1, text.get_width()), max(1, text.get_height()), alpha=True)
 
         # Draw shadow first
         if self._shadow:
-            text_bg = self._font.render(string, self._font_antialias, self._shadow_color)
+            shadow_atlas = get_glyph_atlas(self._font, self._font_name, self._font_size,
+                                           tuple(self._shadow_color), self._font_antialias)
+            if shadow_atlas is None:
+                text_bg = self._font.render(string, self._font_antialias, self._shadow_color)
+            else:
+                text_bg = shadow_atlas.render(string)
             surface.blit(text_bg, self._shadow_tuple)
 
         surface.blit(text, (0, 0))
@@ -374,6 +439,8 @@ class Widget(object):
         if self._max_width is not None and new_width > self._max_width:
             surface = pygame.transform.smoothscale(surface, (self._max_width, new_height))
 
+        if key is not None:
+            TEXT_CACHE.put(key, surface)
         return surface
 
     def surface_needs_update(self):
@@ -390,6 +457,16 @@ class Widget(object):
             return True
         return False
 
+    def get_update_delay(self):
+        """
+        Return the time before the widget must be updated and drawn again
+        even if no event is received (animations, key repeat, ...).
+
+        :return: Delay in ms, None if the widget only changes with the events
+        :rtype: float, NoneType
+        """
+        return None
+
     def set_font(self, font, font_size, color, selected_color, antialias=True):
         """
         Set the text font.
@@ -72,6 +72,26 @@ class Button(Widget):
     def _apply_font(self):
         pass
 
+    def get_title(self):
+        """
+        Return the title of the button.
+
+        :return: Button title
+        :rtype: basestring
+        """
+        return self._label
+
+    def set_title(self, title):
+        """
+        Update the title of the button.
+
+        :param title: New title
+        :type title: basestring
+        :return: None
+        """
+        assert isinstance(title, str)
+        self._label = title
+
     # noinspection PyMissingOrEmptyDocstring
     def draw(self, surface):
         self._render()
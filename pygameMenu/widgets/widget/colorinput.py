@@ -257,6 +257,11 @@ class ColorInput(TextInput):
         super(ColorInput, self).draw(surface)  # This calls _render()
         self._previsualize_color(surface)
 
+    def _get_draw_state(self):
+        self._previsualize_color(None)
+        return super(ColorInput, self)._get_draw_state() + (self._previsualization_surface,
+                                                            self._previsualization_position)
+
     def _render(self):
         super(ColorInput, self)._render()
 
@@ -394,7 +399,7 @@ class ColorInput(TextInput):
             colors = self._input_string.split(self._separator)
             for c in colors:
                 if len(c) > 0 and (int(c) > 255 or int(c) < 0):
-                    self._input_string = _input
+                    self._update_input_string(_input)
                     self._cursor_position = _curpos
                     break
 
@@ -58,9 +58,12 @@ class Image(Widget):
         assert isinstance(scale_smooth, bool)
         super(Image, self).__init__(widget_id=image_id)
 
-        self._image = BaseImage(image_path)
-        self._image.rotate(angle)
-        self._image.scale(scale[0], scale[1], smooth=scale_smooth)
+        # The surface is shared by the images with the same file and transformations
+        self._image = BaseImage(image_path, keep_original=False)
+        if angle != 0:
+            self._image.rotate(angle)
+        if scale[0] != 1 or scale[1] != 1:
+            self._image.scale(scale[0], scale[1], smooth=scale_smooth)
 
         self.is_selectable = False
 
@@ -75,7 +78,7 @@ class Image(Widget):
     def _render(self):
         if self._surface is not None:
             return
-        self._surface = self._image.get_surface()
+        self._surface = self._image.get_surface(shared=True)
         self._rect.width, self._rect.height = self._surface.get_size()
 
     # noinspection PyMissingOrEmptyDocstring
@@ -104,7 +104,7 @@ class ScrollBar(Widget):
         self._slider_rect = None  # type: (pygame.rect.RectType,None)
         self._slider_pad = slider_pad
         self._slider_color = slider_color
-        self._slider_position = 0  # type: int
+        self._slider_position = 0  # type: float
 
         self._single_step = 20  # type: int
         self._page_step = None  # type: (int,None)
@@ -132,7 +132,7 @@ class ScrollBar(Widget):
 
         # Update slider position according to the current one
         pos = ('x', 'y')
-        setattr(self._slider_rect, pos[self._orientation], self._slider_position)
+        setattr(self._slider_rect, pos[self._orientation], int(round(self._slider_position)))
         self._slider_rect = self._slider_rect.inflate(-2 * self._slider_pad, -2 * self._slider_pad)
 
     # noinspection PyMissingOrEmptyDocstring
@@ -219,21 +219,18 @@ class ScrollBar(Widget):
         if not pixels:
             return False
 
-        axis = self._orientation
-        space_before = self._rect.topleft[axis] - \
-                       self._slider_rect.move(*self._rect.topleft).topleft[axis] + self._slider_pad
-        move = max(round(pixels), space_before)
-        space_after = self._rect.bottomright[axis] - \
-                      self._slider_rect.move(*self._rect.topleft).bottomright[axis] - self._slider_pad
+        # The position is not rounded, so the value can be set precisely even if
+        # the range is much greater than the length of the page control
+        space_before = -self._slider_position
+        move = max(pixels, space_before)
+        space_after = self._page_ctrl_length - self._page_step - self._slider_position
         move = min(move, space_after)
 
         if not move:
             return False
 
-        move_pos = [0, 0]
-        move_pos[axis] = move
-        self._slider_rect.move_ip(*move_pos)
         self._slider_position += move
+        self._apply_size_changes()
         return True
 
     def set_length(self, value):
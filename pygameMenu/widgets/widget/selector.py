@@ -37,14 +37,25 @@ from pygameMenu.utils import check_key_pressed_valid
 from pygameMenu.widgets.core.widget import Widget
 
 
+_LABEL_CACHE_SIZE = 64  # Maximum number of rendered labels kept by each selector
+
+
 class Selector(Widget):
     """
     Selector widget.
 
+    The elements are given as a list, or as a tuple *(length, getter)* where
+    *getter(index)* returns the element at the given index. In this case the
+    elements are requested only when they are displayed or selected.
+
+    Elements can be appended to the list in place. If elements of the list are
+    removed, replaced or moved in place, :py:meth:`Selector.update_elements`
+    must be called with the list.
+
     :param label: Selector label text
     :type label: basestring
-    :param elements: Elements of the selector
-    :type elements: list
+    :param elements: Elements of the selector, or tuple (length, getter)
+    :type elements: list, tuple
     :param selector_id: ID of the selector
     :type selector_id: basestring
     :param default: Index of default element to display
@@ -66,38 +77,126 @@ class Selector(Widget):
                  **kwargs
                  ):
         assert isinstance(label, str)
-        assert isinstance(elements, list)
+        assert isinstance(elements, (list, tuple))
         assert isinstance(selector_id, str)
         assert isinstance(default, int)
 
-        # Check element list
-        for vl in elements:
-            assert len(vl) > 1, \
-                'Length of each element on item list must be greater than 1'
-            assert isinstance(vl[0], str), \
-                'First element of each item on list must be a string (the title of each item)'
-        assert default < len(elements), 'default position should be lower than number of values'
-        assert isinstance(selector_id, str), 'ID must be a string'
-        assert isinstance(default, int), 'default must be an integer'
-
         super(Selector, self).__init__(widget_id=selector_id,
                                        onchange=onchange,
                                        onreturn=onreturn,
                                        kwargs=kwargs)
 
-        self._elements = elements
+        self._elements = None  # type: (list,None)
+        self._elements_getter = None  # type: (callable,None)
+        self._elements_length = 0  # type: int
         self._index = 0  # type: int
         self._label = label
+        self._labels = {}  # Rendered labels, by (index, color)
+        self._labels_version = 0  # Incremented each time the rendered labels are cleared
         self._labelsize = 0.0  # type: float
         self._sformat = '{0}< {1} >'  # type: str
+        self._titles = None  # Index of the first element of each title, built on first search
+        self._titles_length = 0  # Number of elements when the titles were indexed
+        self._set_elements(elements)
+
+        # Apply default item, without calling onchange
+        assert default < self._elements_length, 'default position should be lower than number of values'
+        self._index = default % self._elements_length
+
+    def _set_elements(self, elements, min_length=2):
+        """
+        Set the elements of the selector.
+
+        :param elements: Elements of the selector, or tuple (length, getter)
+        :type elements: list, tuple
+        :param min_length: Minimum length of each element of the list
+        :type min_length: int
+        :return: None
+        """
+        if isinstance(elements, tuple):
+            assert len(elements) == 2, 'elements provider must be a tuple (length, getter)'
+            length, getter = elements
+            assert isinstance(length, int), 'length of the elements must be an integer'
+            assert callable(getter), 'getter of the elements must be callable'
+            self._elements = None
+            self._elements_getter = getter
+            self._elements_length = length
+        else:
+            for element in elements:
+                self._check_element(element, min_length)
+            self._elements = elements
+            self._elements_getter = None
+            self._elements_length = len(elements)
+        assert self._elements_length > 0, 'selector must have at least one element'
+        self._labels = {}
+        self._labels_version += 1
+        self._titles = None
+
+    @staticmethod
+    def _check_element(element, min_length=2):
+        """
+        Check an element of the selector.
+
+        :param element: Element, tuple (title, values...)
+        :type element: tuple, list
+        :param min_length: Minimum length of the element
+        :type min_length: int
+        :return: None
+        """
+        assert len(element) >= min_length, \
+            'Length of each element on item list must be greater than {0}'.format(min_length - 1)
+        assert isinstance(element[0], str), \
+            'First element of each item on list must be a string (the title of each item)'
+
+    def _get_element(self, index):
+        """
+        Return the element at the given index.
+
+        :param index: Index of the element
+        :type index: int
+        :return: Element, tuple (title, values...)
+        :rtype: tuple, list
+        """
+        if self._elements is not None:
+            return self._elements[index]
+        element = self._elements_getter(index)
+        self._check_element(element)
+        return element
+
+    def _get_length(self):
+        """
+        Return the number of elements. The length of a list is read each time,
+        as elements can be appended to it in place.
+
+        :return: Number of elements
+        :rtype: int
+        """
+        if self._elements is not None:
+            return len(self._elements)
+        return self._elements_length
 
-        # Apply default item
-        default %= len(self._elements)
-        for k in range(0, default):
-            self.right()
+    def _get_title_index(self, title):
+        """
+        Return the index of the first element with the given title.
+
+        :param title: Title of the element
+        :type title: basestring
+        :return: Index, None if no element has the title
+        :rtype: int, NoneType
+        """
+        length = self._get_length()
+        if self._titles is None or self._titles_length != length:
+            titles = {}
+            for index in range(length - 1, -1, -1):  # The first element is kept
+                titles[self._get_element(index)[0]] = index
+            self._titles = titles
+            self._titles_length = length
+        return self._titles.get(title)
 
     def _apply_font(self):
         self._labelsize = self._font.size(self._label)[0]
+        self._labels = {}
+        self._labels_version += 1
 
     # noinspection PyMissingOrEmptyDocstring
     def draw(self, surface):
@@ -111,7 +210,7 @@ class Selector(Widget):
         :return: Value and index as a tuple, (value,index)
         :rtype: tuple
         """
-        return self._elements[self._index][0], self._index
+        return self._get_element(self._index)[0], self._index
 
     def left(self):
         """
@@ -119,8 +218,8 @@ class Selector(Widget):
 
         :return: None
         """
-        self._index = (self._index - 1) % len(self._elements)
-        self.change(*self._elements[self._index][1:])
+        self._index = (self._index - 1) % self._get_length()
+        self.change(*self._get_element(self._index)[1:])
 
     def right(self):
         """
@@ -128,18 +227,24 @@ class Selector(Widget):
 
         :return: None
         """
-        self._index = (self._index + 1) % len(self._elements)
-        self.change(*self._elements[self._index][1:])
+        self._index = (self._index + 1) % self._get_length()
+        self.change(*self._get_element(self._index)[1:])
 
     def _render(self):
-        string = self._sformat.format(self._label, self.get_value()[0])
-        if not self._render_hash_changed(string, self.selected):
+        if not self._render_hash_changed(self._index, self._labels_version, self.selected):
             return
         if self.selected:
             color = self._font_selected_color
         else:
             color = self._font_color
-        self._surface = self._render_string(string, color)
+        key = (self._index, color)
+        surface = self._labels.get(key)
+        if surface is None:
+            if len(self._labels) >= _LABEL_CACHE_SIZE:
+                self._labels.clear()
+            surface = self._render_string(self._sformat.format(self._label, self.get_value()[0]), color)
+            self._labels[key] = surface
+        self._surface = surface
         self._rect.width, self._rect.height = self._surface.get_size()
         self._check_render_size_changed()
 
@@ -158,13 +263,12 @@ class Selector(Widget):
         """
         assert isinstance(item, (str, int)), 'item must be an string or an integer'
         if isinstance(item, str):
-            for element in self._elements:
-                if element[0] == item:
-                    self._index = self._elements.index(element)
-                    return
-            raise ValueError("No value '{}' found in selector".format(item))
+            index = self._get_title_index(item)
+            if index is None:
+                raise ValueError("No value '{}' found in selector".format(item))
+            self._index = index
         elif isinstance(item, int):
-            assert 0 <= item < len(self._elements), \
+            assert 0 <= item < self._get_length(), \
                 'item index must be greater than zero and lower than the number of elements on the selector'
             self._index = item
 
@@ -200,7 +304,7 @@ class Selector(Widget):
             elif keydown and event.key == _controls.KEY_APPLY or \
                     joy_button_down and event.button == _controls.JOY_BUTTON_SELECT:
                 self.sound.play_open_menu()
-                self.apply(*self._elements[self._index][1:])
+                self.apply(*self._get_element(self._index)[1:])
                 updated = True
 
             elif self.mouse_enabled and event.type == pygame.MOUSEBUTTONUP:
@@ -224,19 +328,19 @@ class Selector(Widget):
 
     def update_elements(self, elements):
         """
-        Update selector elements.
+        Update selector elements. The selected element is kept if it is found
+        on the new elements.
 
-        :param elements: Elements of the selector
-        :type elements: Object
+        :param elements: Elements of the selector, or tuple (length, getter)
+        :type elements: list, tuple
         :return: None
         """
-        for elem in elements:  # Check value list
-            assert len(elem) >= 1, 'length of each element in value list must be greater than 1'
-            assert isinstance(elem[0], str), 'first element of value list component must be a string'
-        selected_element = self._elements[self._index]
-        self._elements = elements
-        try:
-            self._index = self._elements.index(selected_element)
-        except ValueError:
-            if self._index >= len(self._elements):
-                self._index = len(self._elements) - 1
+        selected_element = tuple(self._get_element(self._index))
+        self._set_elements(elements, min_length=1)
+        if self._index < self._elements_length and tuple(self._get_element(self._index)) == selected_element:
+            return
+        index = self._get_title_index(selected_element[0])
+        if index is not None and tuple(self._get_element(index)) == selected_element:
+            self._index = index
+        elif self._index >= self._elements_length:
+            self._index = self._elements_length - 1
@@ -0,0 +1,605 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEXT AREA
+Multi-line text input, Widget created in top of TextInput that wraps the text
+on a given width and draws the lines within a scrolled viewport.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from bisect import bisect_right
+
+import pygame
+import pygameMenu.controls as _controls
+
+from pygameMenu.utils import check_key_pressed_valid, make_surface
+from pygameMenu.widgets.widget.textinput import TextInput
+
+_PASTE_ESCAPES = dict.fromkeys(c for c in range(32) if c != ord('\n'))  # Line breaks are kept
+
+# Keys handled by the area, the others are handled as in a text input
+_AREA_KEYS = (
+    _controls.KEY_APPLY,
+    pygame.K_DOWN,
+    pygame.K_END,
+    pygame.K_HOME,
+    pygame.K_PAGEDOWN,
+    pygame.K_PAGEUP,
+    pygame.K_UP
+)
+
+
+class TextArea(TextInput):
+    """
+    Multi-line text input widget. The text is wrapped on the width of the
+    area and only the lines within the viewport are rendered. Return inserts
+    a line break, Ctrl+Return applies the widget.
+
+    :param label: Input label text
+    :type label: basestring
+    :param textarea_id: ID of the text area
+    :type textarea_id: basestring
+    :param cursor_color: Color of cursor
+    :type cursor_color: tuple
+    :param enable_copy_paste: Enables copy, paste and cut
+    :type enable_copy_paste: bool
+    :param enable_selection: Enables selection of text
+    :type enable_selection: bool
+    :param history: Maximum number of editions stored
+    :type history: int
+    :param lines: Number of lines displayed by the viewport
+    :type lines: int
+    :param maxchar: Maximum length of input
+    :type maxchar: int
+    :param onchange: Callback when changing the text
+    :type onchange: callable, NoneType
+    :param onreturn: Callback when pressing Ctrl+Return
+    :type onreturn: callable, NoneType
+    :param repeat_keys_initial_ms: Time in ms before keys are repeated when held
+    :type repeat_keys_initial_ms: int, float
+    :param repeat_keys_interval_ms: Interval between key press repetition when held
+    :type repeat_keys_interval_ms: int, float
+    :param repeat_mouse_interval_ms: Interval between mouse events when held
+    :type repeat_mouse_interval_ms: int, float
+    :param selection_color: Selection box color
+    :type selection_color: tuple
+    :param width: Width of the text (px), the lines are wrapped on it
+    :type width: int, float
+    :param kwargs: Optional keyword-arguments for callbacks
+    """
+
+    _paste_escapes = _PASTE_ESCAPES
+
+    def __init__(self,
+                 label='',
+                 textarea_id='',
+                 cursor_color=(0, 0, 0),
+                 enable_copy_paste=True,
+                 enable_selection=True,
+                 history=50,
+                 lines=4,
+                 maxchar=0,
+                 onchange=None,
+                 onreturn=None,
+                 repeat_keys_initial_ms=450,
+                 repeat_keys_interval_ms=80,
+                 repeat_mouse_interval_ms=100,
+                 selection_color=(30, 30, 30),
+                 width=300,
+                 **kwargs
+                 ):
+        assert isinstance(label, str)
+        assert isinstance(textarea_id, str)
+        assert isinstance(lines, int)
+        assert isinstance(width, (int, float))
+
+        if lines < 1:
+            raise ValueError('lines must be greater than zero')
+        if width <= 0:
+            raise ValueError('width must be greater than zero')
+
+        super(TextArea, self).__init__(label=label,
+                                       textinput_id=textarea_id,
+                                       cursor_color=cursor_color,
+                                       enable_copy_paste=enable_copy_paste,
+                                       enable_selection=enable_selection,
+                                       history=history,
+                                       maxchar=maxchar,
+                                       maxwidth=0,  # Disabled, the area scrolls by lines
+                                       onchange=onchange,
+                                       onreturn=onreturn,
+                                       repeat_keys_initial_ms=repeat_keys_initial_ms,
+                                       repeat_keys_interval_ms=repeat_keys_interval_ms,
+                                       repeat_mouse_interval_ms=repeat_mouse_interval_ms,
+                                       selection_color=selection_color,
+                                       **kwargs
+                                       )
+
+        # The keys of the area can be repeated
+        self._ignore_keys = tuple(key for key in self._ignore_keys if key not in _AREA_KEYS)
+
+        # Visual lines, the end of a line is the start of the next one if the line is
+        # wrapped, else the position of the line break
+        self._line_ends = [0]  # type: list
+        self._line_height = 0  # Updated in _apply_font()
+        self._line_starts = [0]  # type: list
+        self._line_surfaces = {}  # Surfaces of the lines within the viewport, by (text, color)
+        self._lines = lines
+        self._selection_render_state = None  # type: (tuple,None)
+        self._text_version = 0  # Incremented each time the lines change
+        self._top_line = 0  # First line of the viewport
+        self._width = width
+
+    def _apply_font(self):
+        super(TextArea, self)._apply_font()
+        self._line_height = self._font.get_linesize()
+        self._cursor_surface = None  # Created again with the new height
+        self._line_starts, self._line_ends = self._wrap_text(0, len(self._buffer))
+        self._text_version += 1
+
+    def _wrap_paragraph(self, text, offset, starts, ends):
+        """
+        Wrap a paragraph (text without line breaks) on the width of the area,
+        at the last space of each line if any.
+
+        :param text: Paragraph
+        :type text: basestring
+        :param offset: Position of the paragraph in the text
+        :type offset: int
+        :param starts: List where the starts of the lines are appended
+        :type starts: list
+        :param ends: List where the ends of the lines are appended
+        :type ends: list
+        :return: None
+        """
+        advance = self._metrics.get_advance
+        width = self._width
+        length = len(text)
+        line_start = 0
+        line_width = 0
+        space = -1
+        i = 0
+        while i < length:
+            char = text[i]
+            char_width = advance(char)
+            if line_width + char_width > width and char != ' ' and i > line_start:
+                end = space + 1 if space >= line_start else i
+                starts.append(offset + line_start)
+                ends.append(offset + end)
+                line_start = end
+                line_width = sum(advance(c) for c in text[end:i])
+                space = -1
+                continue
+            if char == ' ':
+                space = i
+            line_width += char_width
+            i += 1
+        starts.append(offset + line_start)
+        ends.append(offset + length)
+
+    def _wrap_text(self, start, end):
+        """
+        Wrap the paragraphs of a part of the text.
+
+        :param start: Position of the first paragraph
+        :type start: int
+        :param end: Position of the end of the last paragraph
+        :type end: int
+        :return: Starts and ends of the lines
+        :rtype: tuple
+        """
+        starts = []
+        ends = []
+        offset = start
+        for paragraph in self._buffer.get_text(start, end).split('\n'):
+            self._wrap_paragraph(paragraph, offset, starts, ends)
+            offset += len(paragraph) + 1
+        return starts, ends
+
+    def _wrap_edition(self, position, removed, inserted):
+        """
+        Wrap again the paragraphs changed by an edition, the following lines
+        are only moved.
+
+        :param position: Position of the edition
+        :type position: int
+        :param removed: Number of removed characters
+        :type removed: int
+        :param inserted: Number of inserted characters
+        :type inserted: int
+        :return: None
+        """
+        if self._metrics is None:  # The text is wrapped once the font is set
+            return
+        starts, ends = self._line_starts, self._line_ends
+
+        # First and last lines of the changed paragraphs
+        first = max(0, bisect_right(starts, position) - 1)
+        while first > 0 and ends[first - 1] == starts[first]:
+            first -= 1
+        last = max(first, bisect_right(starts, position + removed) - 1)
+        while last + 1 < len(starts) and starts[last + 1] == ends[last]:
+            last += 1
+
+        delta = inserted - removed
+        new_starts, new_ends = self._wrap_text(starts[first], ends[last] + delta)
+        self._line_starts = starts[:first] + new_starts + [s + delta for s in starts[last + 1:]]
+        self._line_ends = ends[:first] + new_ends + [e + delta for e in ends[last + 1:]]
+        self._text_version += 1
+
+    def _edit(self, position, count, text, merge=False):
+        count = max(0, min(count, len(self._buffer) - position))
+        super(TextArea, self)._edit(position, count, text, merge)
+        self._wrap_edition(position, count, len(text))
+
+    def _update_from_history(self, edition, undo):
+        removed, inserted = len(edition[1]), len(edition[2])
+        if undo:
+            removed, inserted = inserted, removed
+        super(TextArea, self)._update_from_history(edition, undo)
+        self._wrap_edition(edition[0], removed, inserted)
+
+    def _get_line(self, position):
+        """
+        Return the line of a position of the text.
+
+        :param position: Position
+        :type position: int
+        :return: Line index
+        :rtype: int
+        """
+        return max(0, bisect_right(self._line_starts, position) - 1)
+
+    def _get_line_text(self, line):
+        """
+        Return the text of a line.
+
+        :param line: Line index
+        :type line: int
+        :return: Text
+        :rtype: basestring
+        """
+        return self._buffer.get_text(self._line_starts[line], self._line_ends[line])
+
+    def _get_line_width(self, line, column):
+        """
+        Return the width of the first characters of a line.
+
+        :param line: Line index
+        :type line: int
+        :param column: Number of characters
+        :type column: int
+        :return: Width in pixels
+        :rtype: int
+        """
+        text = self._get_line_text(line)
+        self._input_widths.set_text(text)
+        return self._input_widths.get_width(max(0, min(column, len(text))))
+
+    def _is_line_wrapped(self, line):
+        """
+        Return True if the line continues on the next one.
+
+        :param line: Line index
+        :type line: int
+        :return: Line is wrapped
+        :rtype: bool
+        """
+        return line + 1 < len(self._line_starts) and self._line_starts[line + 1] == self._line_ends[line]
+
+    def _get_line_position(self, line, x):
+        """
+        Return the position of the text nearest to the given distance from
+        the left of a line.
+
+        :param line: Line index
+        :type line: int
+        :param x: Distance from the left of the text (px)
+        :type x: int, float
+        :return: Position
+        :rtype: int
+        """
+        chars = self._line_ends[line] - self._line_starts[line]
+        if chars > 0 and self._is_line_wrapped(line):
+            chars -= 1  # The end of the line is the start of the next one
+        low, high = 0, chars
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_line_width(line, middle) + self._get_line_width(line, middle + 1) >= 2 * x:
+                high = middle
+            else:
+                low = middle + 1
+        return self._line_starts[line] + low
+
+    def _move_cursor_line(self, lines):
+        """
+        Move the cursor up or down, keeping its horizontal position.
+
+        :param lines: Number of lines, negative moves up
+        :type lines: int
+        :return: False if the cursor cannot move
+        :rtype: bool
+        """
+        line = self._get_line(self._cursor_position)
+        target = max(0, min(line + lines, len(self._line_starts) - 1))
+        if target == line:
+            return False
+        x = self._get_line_width(line, self._cursor_position - self._line_starts[line])
+        self._cursor_position = self._get_line_position(target, x)
+        self._cursor_render = True
+        return True
+
+    def _scroll_to_cursor(self):
+        """
+        Scroll the viewport the least to show the line of the cursor.
+
+        :return: None
+        """
+        line = self._get_line(self._cursor_position)
+        top = self._top_line
+        if line < top:
+            top = line
+        elif line >= top + self._lines:
+            top = line - self._lines + 1
+        self._top_line = max(0, min(top, len(self._line_starts) - self._lines))
+
+    # noinspection PyMissingOrEmptyDocstring
+    def set_value(self, text):
+        assert isinstance(text, str)
+        if 0 < self._maxchar < len(text):
+            text = text[len(text) - self._maxchar:]
+        self._update_input_string(text)
+        self._cursor_position = len(text)
+        self._cursor_render = True
+
+    def _update_renderbox(self, left=0, right=0, addition=False, end=False, start=False, update_maxwidth=True):
+        self._cursor_render = True  # The viewport follows the cursor once rendered
+
+    def _update_renderbox_cursor(self):
+        self._cursor_render = True
+
+    def _render(self):
+        if self._cursor_render:
+            self._scroll_to_cursor()
+
+        if self._render_hash_changed(self._menu.get_id(), self._label, self._text_version, self._top_line,
+                                     self.selected):
+            self._render_lines()
+
+        # Render the cursor
+        self._render_cursor()
+
+        # Render the selection box if text is selected
+        self._render_selection_box()
+
+        # Update the size of the render
+        self._rect.width, self._rect.height = self._surface.get_size()
+
+        # Check if the size changed
+        self._check_render_size_changed()
+
+    def _render_lines(self):
+        """
+        Render the label and the lines within the viewport. The surfaces of
+        the lines still visible since the previous render are reused.
+
+        :return: None
+        """
+        if self.selected:
+            color = self._font_selected_color
+        else:
+            color = self._font_color
+
+        width = int(self._label_size + self._width) + 1
+        height = self._lines * self._line_height
+        surface = self._layers_surface
+        if surface is None or surface.get_size() != (width, height):
+            surface = make_surface(width, height, alpha=True)
+            self._layers_surface = surface
+        else:
+            surface.fill((0, 0, 0, 0))
+        if self._label != '':
+            surface.blit(self._render_string(self._label, color), (0, 0))
+
+        line_surfaces = {}
+        top = self._top_line
+        for line in range(top, min(top + self._lines, len(self._line_starts))):
+            text = self._get_line_text(line)
+            if text == '':
+                continue
+            key = (text, color)
+            line_surface = self._line_surfaces.get(key)
+            if line_surface is None:
+                line_surface = self._render_string(text, color)
+            line_surfaces[key] = line_surface
+            surface.blit(line_surface, (self._label_size, (line - top) * self._line_height))
+        self._line_surfaces = line_surfaces
+        self._layers_version += 1
+        self._surface = surface
+
+    def _render_cursor(self):
+        if not self._cursor_render:
+            return
+        if self._cursor_surface is None:
+            self._cursor_surface = make_surface(self._font_size / 20 + 1, self._line_height - 2)
+            self._cursor_surface.fill(self._cursor_color)
+        line = self._get_line(self._cursor_position)
+        column = self._cursor_position - self._line_starts[line]
+        self._cursor_surface_pos[0] = self._label_size + self._get_line_width(line, column) + self._cursor_offset
+        self._cursor_surface_pos[1] = (line - self._top_line) * self._line_height + 1
+        self._cursor_render = False
+
+    def _render_selection_box(self, force=False):
+        if not self._selection_enabled:
+            return
+        start, end = self._selection_box
+        if end <= start:
+            self._selection_surface = None
+            return
+        state = (start, end, self._top_line, self._text_version, self._rect.x, self._rect.y)
+        if not force and self._selection_surface is not None and state == self._selection_render_state:
+            return
+        self._selection_render_state = state
+
+        # Boxes of the selected text on the lines within the viewport
+        boxes = []
+        top = self._top_line
+        first = max(self._get_line(start), top)
+        last = min(self._get_line(end), top + self._lines - 1)
+        for line in range(first, last + 1):
+            line_start, line_end = self._line_starts[line], self._line_ends[line]
+            x1 = self._get_line_width(line, max(start, line_start) - line_start)
+            x2 = self._get_line_width(line, min(end, line_end) - line_start)
+            if end > line_end and not self._is_line_wrapped(line):
+                x2 += self._metrics.get_advance(' ')  # The line break is selected
+            if x2 > x1:
+                boxes.append((x1, (line - top) * self._line_height, x2 - x1, self._line_height))
+
+        # The selection may be out of the viewport
+        if len(boxes) == 0:
+            self._selection_surface = make_surface(1, 1, alpha=True)
+            self._selection_position[0] = self._rect.x
+            self._selection_position[1] = self._rect.y
+            return
+        x_min = min(box[0] for box in boxes)
+        x_max = max(box[0] + box[2] for box in boxes)
+        y_min = boxes[0][1]
+        y_max = boxes[-1][1] + self._line_height
+        self._selection_surface = make_surface(x_max - x_min, y_max - y_min, alpha=True)
+        for x, y, w, h in boxes:
+            self._selection_surface.fill(self._selection_color, (x - x_min, y - y_min, w, h))
+        self._selection_position[0] = self._rect.x + self._label_size + x_min
+        self._selection_position[1] = self._rect.y + y_min
+
+        # Fill cursor
+        if self._cursor_surface:
+            self._cursor_surface.fill(self._font_selected_color)
+
+    def _remove_selection(self):
+        start, end = self._selection_box
+        if end > start:
+            self._edit(start, end - start, '')
+            self._cursor_position = start
+            self._cursor_render = True
+        self._unselect_text()
+
+    def _select_all(self):
+        if not self._selection_enabled:
+            return
+        self._selection_box[0] = 0
+        self._selection_box[1] = len(self._buffer)
+        self._cursor_position = self._selection_box[1]
+        self._cursor_render = True
+        self._render_selection_box(True)
+        self._selection_active = False
+
+    def _check_mouse_collide_input(self, pos):
+        if not self._rect.collidepoint(*pos):
+            return
+        line = self._top_line + int((pos[1] - self._rect.y) // self._line_height)
+        line = max(0, min(line, len(self._line_starts) - 1))
+        self._cursor_position = self._get_line_position(line, pos[0] - self._rect.x - self._label_size)
+        self._update_selection_mouse()
+        self._cursor_render = True
+        return True  # Prevents double click
+
+    def _update_area_key(self, event):
+        """
+        Handle a keydown event of the keys of the area.
+
+        :param event: Pygame keydown event
+        :type event: pygame.event.EventType
+        :return: True if the area has been updated
+        :rtype: bool
+        """
+        self._cursor_visible = True  # So the user sees where he writes
+        self._key_is_pressed = True
+        self._last_key = event.key
+
+        # Ctrl+Return applies the widget
+        if event.key == _controls.KEY_APPLY and pygame.key.get_mods() & pygame.KMOD_CTRL:
+            if 'test' in event.dict and event.dict['test']:
+                pygame.key.set_mods(pygame.KMOD_NONE)
+            self.sound.play_open_menu()
+            self.apply()
+            self._unselect_text()
+            return True
+
+        self._start_key_repeat(event)
+
+        # Return inserts a line break
+        if event.key == _controls.KEY_APPLY:
+            return self._push_key_input('\n')
+
+        # Home and end move to the limits of the line
+        if event.key == pygame.K_HOME or event.key == pygame.K_END:
+            self.sound.play_key_add()
+            line = self._get_line(self._cursor_position)
+            if event.key == pygame.K_HOME:
+                self._cursor_position = self._line_starts[line]
+            elif self._is_line_wrapped(line):
+                self._cursor_position = self._line_ends[line] - 1
+            else:
+                self._cursor_position = self._line_ends[line]
+            self._unselect_text()
+            self._cursor_render = True
+            return True
+
+        # Up, down, page up and page down move between lines
+        if event.key == pygame.K_UP:
+            lines = -1
+        elif event.key == pygame.K_DOWN:
+            lines = 1
+        elif event.key == pygame.K_PAGEUP:
+            lines = -self._lines
+        else:
+            lines = self._lines
+        if not self._selection_active and self._unselect_text():
+            return True
+        anchor = self._selection_box[1] if self._cursor_position == self._selection_box[0] else self._selection_box[0]
+        if not self._move_cursor_line(lines):
+            return False  # The Menu can select the previous or next widget
+        self.sound.play_key_add()
+        if self._selection_active:
+            self._selection_box[0] = min(anchor, self._cursor_position)
+            self._selection_box[1] = max(anchor, self._cursor_position)
+        return True
+
+    # noinspection PyMissingOrEmptyDocstring
+    def update(self, events):
+        updated = False
+        input_events = []  # Events handled as in a text input, in order
+        for event in events:  # type: pygame.event.EventType
+            if event.type != pygame.KEYDOWN or event.key not in _AREA_KEYS:
+                input_events.append(event)
+                continue
+            if len(input_events) > 0:
+                updated = super(TextArea, self).update(input_events) or updated
+                input_events = []
+            if check_key_pressed_valid(event) and self._update_area_key(event):
+                updated = True
+        return super(TextArea, self).update(input_events) or updated  # Also repeats the mouse
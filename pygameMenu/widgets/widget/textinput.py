@@ -35,39 +35,61 @@ import pygame
 import pygameMenu.controls as _controls
 import pygameMenu.locals as _locals
 
+from pygameMenu.font import TextWidths, get_font_metrics
+from pygameMenu.textbuffer import EditHistory, GapBuffer
 from pygameMenu.utils import check_key_pressed_valid, make_surface
 from pygameMenu.widgets.core.widget import Widget
 
-try:
-    # noinspection PyProtectedMember
-    from pyperclip import copy, paste, PyperclipException
-except ImportError:
+# Translation table removing the line breaks and escape chars of pasted texts
+_PASTE_ESCAPES = dict.fromkeys(range(32))
 
-    # noinspection PyUnusedLocal
-    def copy(text):
-        """
-        Copy method.
+# Clipboard functions, pyperclip is imported on the first copy or paste
+_clipboard = []  # type: list
 
-        :return: None
-        """
-        pass
 
+# noinspection PyUnusedLocal
+def _copy_disabled(text):
+    """
+    Copy method used if pyperclip is not available.
 
-    def paste():
-        """
-        Paste method.
+    :return: None
+    """
+    pass
 
-        :return: Empty string
-        :rtype: basestring
-        """
-        return ''
 
+def _paste_disabled():
+    """
+    Paste method used if pyperclip is not available.
+
+    :return: Empty string
+    :rtype: basestring
+    """
+    return ''
 
-    class PyperclipException(RuntimeError):
-        """
-        Pyperclip exception thrown by pyperclip.
-        """
-        pass
+
+class PyperclipException(RuntimeError):
+    """
+    Pyperclip exception thrown by pyperclip.
+    """
+    pass
+
+
+def _get_clipboard():
+    """
+    Return the copy and paste functions of the clipboard, and the exception
+    they raise. pyperclip is imported on the first call.
+
+    :return: Copy function, paste function and exception class
+    :rtype: list
+    """
+    if not _clipboard:
+        try:
+            # noinspection PyProtectedMember
+            from pyperclip import copy, paste, PyperclipException as _PyperclipException
+            _clipboard.extend([copy, paste, _PyperclipException])
+        except ImportError:
+            _clipboard.extend([_copy_disabled, _paste_disabled, PyperclipException])
+    return _clipboard
 
 
 class TextInput(Widget):
@@ -119,6 +141,8 @@ class TextInput(Widget):
     :param kwargs: Optional keyword-arguments for callbacks
     """
 
+    _paste_escapes = _PASTE_ESCAPES  # Chars removed from the pasted text
+
     def __init__(self,
                  label='',
                  textinput_id='',
@@ -175,7 +199,7 @@ class TextInput(Widget):
                                         onreturn=onreturn,
                                         kwargs=kwargs)
 
-        self._input_string = ''  # Inputted text
+        self._buffer = GapBuffer()  # Inputted text, see _input_string
         self._ignore_keys = (  # Ignore keys on input-gathering events
             _controls.KEY_MOVE_DOWN,
             _controls.KEY_MOVE_UP,
@@ -192,14 +216,14 @@ class TextInput(Widget):
         # Vars to make keydowns repeat after user pressed a key for some time:
         self._block_copy_paste = False  # Blocks event
         self._key_is_pressed = False
-        self._keyrepeat_counters = {}  # {event.key: (counter_int, event.unicode)} (look for "***")
+        self._keyrepeat_counters = {}  # {event.key: event.unicode}, each key has a repeat deadline
         self._keyrepeat_initial_interval_ms = repeat_keys_initial_ms
         self._keyrepeat_interval_ms = repeat_keys_interval_ms
         self._last_key = 0  # type: int
         self._absolute_origin = (0, 0)  # To calculate mouse collide point
 
         # Mouse handling
-        self._keyrepeat_mouse_ms = 0.0  # type: float
+        self._keyrepeat_mouse_ms = 0.0  # Time of the last mouse repeat
         self._keyrepeat_mouse_interval_ms = repeat_mouse_interval_ms
         self._mouse_is_pressed = False  # type: bool
 
@@ -209,22 +233,17 @@ class TextInput(Widget):
         self._renderbox = [0, 0, 0]  # Left/Right/Inner, int
 
         # Things cursor:
-        self._clock = pygame.time.Clock()  # type: pygame.time.Clock
         self._cursor_color = cursor_color
-        self._cursor_ms_counter = 0.0  # type: float
         self._cursor_offset = -1.0  # type: float
         self._cursor_position = 0  # Inside text
         self._cursor_render = True  # If true cursor must be rendered
         self._cursor_surface = None  # type: (pygame.Surface,None)
         self._cursor_surface_pos = [0.0, 0.0]  # Position (x,y) of surface
         self._cursor_switch_ms = 500.0  # type: float
-        self._cursor_visible = False  # Switches every self._cursor_switch_ms ms
+        self._cursor_visible = False  # Switches every self._cursor_switch_ms ms, by a deadline of the scheduler
 
         # History of editions
-        self._history = []  # type: list
-        self._history_cursor = []  # type: list
-        self._history_renderbox = []  # type: list
-        self._history_index = 0  # Index at which the new editions are added
+        self._history = EditHistory(history)
         self._max_history = history
 
         # Text selection
@@ -247,28 +266,36 @@ class TextInput(Widget):
                 assert len(_char) == 1, 'Element "{0}" of valid_chars must be character'.format(_char)
             assert len(valid_chars) > 0, 'valid_chars list must contain at least 1 element'
         self._valid_chars = valid_chars
+        self._valid_chars_set = set(valid_chars) if valid_chars is not None else None
 
         # Other
         self._copy_paste_enabled = enable_copy_paste
         self._input_type = input_type
         self._input_underline = input_underline
         self._input_underline_size = 0.0  # type: float
-        self._keychar_size = {'': 0}  # type: dict
+        self._input_widths = None  # type: (TextWidths,None)
+        self._input_widths_key = None  # Key of the text of the widths, None if they must be updated
+        self._input_widths_length = 0  # Length of the filtered input string of the widths
         self._label = label
         self._label_size = 0.0  # type: float
         self._last_char = ''  # type: str
-        self._last_rendered_string = '__pygameMenu__last_render_string__'  # type: str
-        self._last_rendered_surface = None  # type: (pygame.Surface,None)
         self._last_rendered_surface_underline_width = 0  # type: int
+        self._layers = {'label': (None, None), 'text': (None, None), 'underline': (None, None)}  # Key, surface
+        self._layers_surface = None  # type: (pygame.Surface,None)
+        self._layers_version = 0  # Incremented each time the layers are composed
         self._maxchar = maxchar
         self._maxwidth = maxwidth  # This value will be changed depending on how many chars are printed
         self._maxwidth_base = maxwidth
         self._maxwidth_update = maxwidth_dynamically_update
         self._maxwidthsize = 0.0  # Updated in _apply_font()
+        self._metrics = None  # Updated in _apply_font()
         self._password = password
         self._password_char = password_char
 
     def _apply_font(self):
+        self._metrics = get_font_metrics(self._font)
+        self._input_widths = TextWidths(self._font)
+        self._input_widths_key = None
         self._ellipsis_size = self._font.size(self._ellipsis)[0]
         self._label_size = self._font.size(self._label)[0]
 
@@ -280,11 +307,31 @@ class TextInput(Widget):
 
         # Update password char size
         if self._password:
-            password_size = self.font_render_string(self._password_char).get_size()[0]
+            password_size = self._metrics.get_advance(self._password_char)
             if password_size == 0:
                 raise ValueError(
                     'Password character is not valid, the size of the font is zero, use another character or change the font')
-            self._keychar_size[self._password_char] = password_size
+
+    @property
+    def _input_string(self):
+        """
+        Inputted text.
+
+        :return: Text
+        :rtype: basestring
+        """
+        return self._buffer.get_text()
+
+    @_input_string.setter
+    def _input_string(self, text):
+        """
+        Replace the inputted text, without storing the change into history.
+
+        :param text: Text
+        :type text: basestring
+        :return: None
+        """
+        self._buffer.set_text(text)
 
     def clear(self):
         """
@@ -292,10 +339,10 @@ class TextInput(Widget):
 
         :return: None
         """
-        self._input_string = ''
+        self._update_input_string('')
         self._cursor_position = 0
+        self._cursor_render = True
         self._renderbox = [0, 0, 0]
-        self._delete()
         self.change()
 
     def get_value(self):
@@ -323,7 +370,6 @@ class TextInput(Widget):
     # noinspection PyMissingOrEmptyDocstring
     def draw(self, surface):
         self._render()
-        self._clock.tick()
 
         # Draw selection first
         if self._selection_surface is not None:
@@ -338,21 +384,44 @@ class TextInput(Widget):
             surface.blit(self._cursor_surface, (self._rect.x + self._cursor_surface_pos[0],
                                                 self._rect.y + self._cursor_surface_pos[1]))
 
+    def _get_draw_state(self):
+        state = super(TextInput, self)._get_draw_state()
+        cursor = self.selected and self._cursor_surface is not None and \
+                 (self._cursor_visible or (self._mouse_is_pressed or self._key_is_pressed))
+        return state + (self._layers_version, cursor, self._cursor_surface_pos[0], self._cursor_surface_pos[1],
+                        self._selection_surface, self._selection_position[0], self._selection_position[1])
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_update_delay(self):
+        if not self.selected:
+            return None
+        if self._mouse_is_pressed:
+            return 0  # Mouse repeat, the cursor blink and the key repeat are deadlines of the scheduler
+        return None
+
     def _render(self):
-        string = self._label + self._get_input_string()  # Render string
+        string = self._get_input_string()  # Render string
 
-        if not self._render_hash_changed(self._menu.get_id(), string, self.selected, self._cursor_render,
-                                         self._selection_enabled):
+        if not self._render_hash_changed(self._menu.get_id(), self._label, string, self.selected,
+                                         self._cursor_render, self._selection_enabled):
             return
 
         if self.selected:
             color = self._font_selected_color
         else:
             color = self._font_color
-        updated_surface = self._render_string_surface(string, color)
 
-        # Apply underline if exists
-        self._surface = self._render_underline(string, color, updated_surface)
+        # The max width scales the label and the text together
+        label = self._label
+        if self._max_width is not None:
+            label, string = '', label + string
+
+        # Render the layers whose content changed, then compose them
+        updated = self._render_layer('label', label, color)
+        updated = self._render_layer('text', string, color) or updated
+        updated = self._render_underline(color) or updated
+        if updated or self._surface is not self._layers_surface:
+            self._compose_layers()
 
         # Render the cursor
         self._render_cursor()
@@ -360,9 +429,6 @@ class TextInput(Widget):
         # Render the selection box if text is selected
         self._render_selection_box()
 
-        # Update last rendered
-        self._last_rendered_string = string
-
         # Update the size of the render
         self._rect.width, self._rect.height = self._surface.get_size()
 
@@ -394,12 +460,8 @@ class TextInput(Widget):
                 pos[1] = min(self._selection_box[1], self._renderbox[1])
 
             # Find coordinates of each position
-            string = self._get_input_string_filtered()
-            string_init = string[self._renderbox[0]:pos[0]]
-            string_final = string[self._renderbox[0]:pos[1]]
-
-            x1 = self._cursor_offset + self._font.size(self._label + string_init)[0]
-            x2 = self._cursor_offset + self._font.size(self._label + string_final)[0] - 1
+            x1 = self._cursor_offset + self._get_input_width(pos[0] - self._renderbox[0])
+            x2 = self._cursor_offset + self._get_input_width(pos[1] - self._renderbox[0]) - 1
 
             self._last_selection_render[0] = self._selection_box[0]
             self._last_selection_render[1] = self._selection_box[1]
@@ -423,9 +485,10 @@ class TextInput(Widget):
             x1 += delta
             x2 += delta
 
-            # Create surface and fill
-            self._selection_surface = make_surface(x, y)
-            self._selection_surface.fill(self._selection_color)
+            # Create surface and fill, if the size changed
+            if self._selection_surface is None or self._selection_surface.get_size() != (int(x), int(y)):
+                self._selection_surface = make_surface(x, y)
+                self._selection_surface.fill(self._selection_color)
             self._selection_position[0] = x1 + self._rect.x
             self._selection_position[1] = self._rect.y
 
@@ -433,85 +496,102 @@ class TextInput(Widget):
             if self._cursor_surface:
                 self._cursor_surface.fill(self._font_selected_color)
 
-    def _render_string_surface(self, string, color):
+    def _render_layer(self, layer, string, color):
         """
-        Renders string surface.
+        Render a text layer if its string or color changed.
 
+        :param layer: Layer name, 'label' or 'text'
+        :type layer: basestring
         :param string: String to render
         :type string: basestring
         :param color: Color of the string to render
         :type color: tuple
-        :return: True if surface is updated
+        :return: True if the layer changed
         :rtype: bool
         """
-        new_surface = self._render_string(string, color)
-        updated_surface = self._last_rendered_surface != new_surface
-        if updated_surface:
-            self._surface = new_surface
-            self._last_rendered_surface = self._surface
-        return updated_surface
+        key = (string, color)
+        if self._layers[layer][0] == key:
+            return False
+        self._layers[layer] = (key, self._render_string(string, color) if string != '' else None)
+        return True
 
-    def _render_underline(self, string, color, updated):
+    def _render_underline(self, color):
         """
-        Render underline surface.
+        Render the underline layer if its length or color changed.
 
-        :param string: String to render
-        :type string: basestring
-        :param color: Color of the string to render
+        :param color: Color of the underline
         :type color: tuple
-        :param updated: Render string has been updated or not
-        :type updated: bool
-        :return: New rendered surface
-        :rtype: pygame.surface.SurfaceType
+        :return: True if the layer changed
+        :rtype: bool
         """
         # If underline is not enabled
         if self._input_underline_size == 0:
-            return self._surface
-
-        # Render input underline
-        if string != self._last_rendered_string or updated:
-            menu = self.get_menu()
-
-            # Calculate total available space
-            current_rect = self._surface.get_rect()  # type: pygame.rect.RectType
-            menu_rect = menu.get_rect()
-            posx2 = menu_rect.x + menu_rect.width
-            space_between_label = posx2 - self._label_size - self._rect.x
-            char = math.ceil(space_between_label * 1.0 / self._input_underline_size)  # floor does not work
-
-            # If char limit
-            max_width_current = 0
-            if self._maxchar != 0 or self._maxwidth != 0:
-                max_chars = max(self._maxchar, self._maxwidth_base)
-                basechar = 'O'
-                if self._password:
-                    basechar = self._password_char
-                max_size = self.font_render_string(basechar * max_chars)
-                max_size = max_size.get_size()[0]
-                maxchar_char = math.ceil(max_size * 1.0 / self._input_underline_size)
-                char = min(char, maxchar_char)
-                max_width_current = current_rect.width
-
-            underline_string = self._input_underline * int(char)
-
-            # Render char
-            underline = self.font_render_string(underline_string, color)
-
-            # Create a new surface
-            new_width = max(self._label_size + underline.get_size()[0],
-                            max_width_current,
-                            self._last_rendered_surface_underline_width)
-            new_surface = make_surface(new_width + 1, current_rect.height + 3, alpha=True)
-
-            # Blit current surface
-            new_surface.blit(self._surface, (0, 0))
-            new_surface.blit(underline, (self._label_size - 1, 6))  # Position (x, y)
-            self._last_rendered_surface_with_underline = new_surface
-            self._last_rendered_surface_underline_width = new_width
-        else:
-            new_surface = self._last_rendered_surface_with_underline  # Reuse the rendered surface
+            return False
 
-        return new_surface
+        # Calculate total available space
+        menu_rect = self.get_menu().get_rect()
+        posx2 = menu_rect.x + menu_rect.width
+        space_between_label = posx2 - self._label_size - self._rect.x
+        char = math.ceil(space_between_label * 1.0 / self._input_underline_size)  # floor does not work
+
+        # If char limit
+        if self._maxchar != 0 or self._maxwidth != 0:
+            max_chars = max(self._maxchar, self._maxwidth_base)
+            basechar = 'O'
+            if self._password:
+                basechar = self._password_char
+            max_size = self._font.size(basechar * max_chars)[0]
+            maxchar_char = math.ceil(max_size * 1.0 / self._input_underline_size)
+            char = min(char, maxchar_char)
+
+        key = (int(char), color)
+        if self._layers['underline'][0] == key:
+            return False
+        underline_string = self._input_underline * int(char)
+        self._layers['underline'] = (key, self.font_render_string(underline_string, color))
+        return True
+
+    def _compose_layers(self):
+        """
+        Blit the label, the text and the underline layers on the widget
+        surface. The surface is created again only if its size changed.
+
+        :return: None
+        """
+        label = self._layers['label'][1]  # type: (pygame.Surface,None)
+        text = self._layers['text'][1]  # type: (pygame.Surface,None)
+        underline = self._layers['underline'][1]  # type: (pygame.Surface,None)
+        label_width = label.get_width() if label is not None else 0
+        width = label_width + (text.get_width() if text is not None else 0)
+        height = self._font.get_height()
+        for layer in (label, text):
+            if layer is not None:
+                height = max(height, layer.get_height())
+
+        if underline is not None:
+            max_width_current = width if self._maxchar != 0 or self._maxwidth != 0 else 0
+            width = max(self._label_size + underline.get_width(),
+                        max_width_current,
+                        self._last_rendered_surface_underline_width)
+            self._last_rendered_surface_underline_width = width
+            width += 1
+            height += 3
+        width = max(1, width)
+
+        surface = self._layers_surface
+        if surface is None or surface.get_size() != (width, height):
+            surface = make_surface(width, height, alpha=True)
+            self._layers_surface = surface
+        else:
+            surface.fill((0, 0, 0, 0))
+        if label is not None:
+            surface.blit(label, (0, 0))
+        if text is not None:
+            surface.blit(text, (label_width, 0))
+        if underline is not None:
+            surface.blit(underline, (self._label_size - 1, 6))  # Position (x, y)
+        self._layers_version += 1
+        self._surface = surface
 
     def _render_cursor(self):
         """
@@ -530,16 +610,11 @@ class TextInput(Widget):
             self._cursor_surface = make_surface(self._font_size / 20 + 1, self._rect.height - 2)
             self._cursor_surface.fill(self._cursor_color)
 
-        # Get string
-        string = self._get_input_string_filtered()
-
         # Calculate x position
         if self._maxwidth == 0:  # If no limit is provided
-            cursor_x_pos = self._cursor_offset + \
-                           self._font.size(self._label + string[:self._cursor_position])[0]
+            cursor_x_pos = self._cursor_offset + self._get_input_width(self._cursor_position)
         else:  # Calculate position depending on renderbox
-            string = string[self._renderbox[0]:(self._renderbox[0] + self._renderbox[2])]
-            cursor_x_pos = self._cursor_offset + self._font.size(self._label + string)[0]
+            cursor_x_pos = self._cursor_offset + self._get_input_width(self._renderbox[2])
 
             # Add ellipsis
             delta = self._ellipsis_size
@@ -583,7 +658,7 @@ class TextInput(Widget):
         :return: Boolean
         :rtype: bool
         """
-        return self._renderbox[1] != len(self._input_string) and self._maxwidth != 0
+        return self._renderbox[1] != len(self._buffer) and self._maxwidth != 0
 
     def _ellipsis_left_and_right(self):
         """
@@ -594,20 +669,53 @@ class TextInput(Widget):
         """
         return self._ellipsis_left() and self._ellipsis_right()
 
-    def _get_input_string_filtered(self):
+    def _get_input_string_filtered(self, start=0, end=None):
         """
         Returns input string where all filters have been applied.
 
+        :param start: Position of the first character
+        :type start: int
+        :param end: Position after the last character, None until the end
+        :type end: int, NoneType
         :return: Filtered string
         :rtype: basestring
         """
-        string = self._input_string
-
         # Apply password
         if self._password:
-            string = self._password_char * len(string)
+            end = len(self._buffer) if end is None else min(end, len(self._buffer))
+            return self._password_char * max(0, end - start)
+
+        return self._buffer.get_text(start, end)
+
+    def _get_input_width(self, index):
+        """
+        Return the width of the label and the filtered input string from the
+        left of the renderbox to the given index.
+
+        :param index: Number of characters from the left of the renderbox
+        :type index: int
+        :return: Width in pixels
+        :rtype: int
+        """
+        self._update_input_widths()
+        index = max(0, min(index, self._input_widths_length))
+        return self._input_widths.get_width(len(self._label) + index)
+
+    def _update_input_widths(self):
+        """
+        Set the label and the filtered input string to the widths if the buffer,
+        the renderbox, the label or the password changed since the last call.
 
-        return string
+        :return: None
+        """
+        start, end = (self._renderbox[0], self._renderbox[1]) if self._maxwidth != 0 else (0, None)
+        key = (self._buffer.get_version(), start, end, self._label, self._password, self._password_char)
+        if key == self._input_widths_key:
+            return
+        string = self._get_input_string_filtered(start, end)
+        self._input_widths.set_text(self._label + string)
+        self._input_widths_key = key
+        self._input_widths_length = len(string)
 
     def _get_input_string(self, add_ellipsis=True):
         """
@@ -618,10 +726,8 @@ class TextInput(Widget):
         :return: String
         :rtype: basestring
         """
-        string = self._get_input_string_filtered()
-
-        if self._maxwidth != 0 and len(string) > self._maxwidth:
-            text = string[self._renderbox[0]:self._renderbox[1]]
+        if self._maxwidth != 0 and len(self._buffer) > self._maxwidth:
+            text = self._get_input_string_filtered(self._renderbox[0], self._renderbox[1])
             if add_ellipsis:
                 if self._ellipsis_right():
                     text += self._ellipsis
@@ -629,7 +735,7 @@ class TextInput(Widget):
                     text = self._ellipsis + text
             return text
         else:
-            return string
+            return self._get_input_string_filtered()
 
     def _update_renderbox(self, left=0, right=0, addition=False, end=False, start=False, update_maxwidth=True):
         """
@@ -652,7 +758,7 @@ class TextInput(Widget):
         self._cursor_render = True
         if self._maxwidth == 0:
             return
-        len_string = len(self._input_string)
+        len_string = len(self._buffer)
 
         # Move cursor to end
         if end:
@@ -746,6 +852,28 @@ class TextInput(Widget):
         if update_maxwidth:
             self._update_maxlimit_renderbox()
 
+    def _update_renderbox_cursor(self):
+        """
+        Update the renderbox after the cursor jumped to another position, the
+        renderbox moves the least to show the cursor.
+
+        :return: None
+        """
+        self._cursor_render = True
+        if self._maxwidth == 0:
+            return
+        len_string = len(self._buffer)
+        left = self._renderbox[0]
+        if self._cursor_position > left + self._maxwidth:
+            left = self._cursor_position - self._maxwidth
+        elif self._cursor_position < left:
+            left = self._cursor_position
+        left = max(0, min(left, len_string - self._maxwidth))
+        self._renderbox[0] = left
+        self._renderbox[1] = min(len_string, left + self._maxwidth)
+        self._renderbox[2] = self._cursor_position - left
+        self._update_maxlimit_renderbox()
+
     def _update_maxlimit_renderbox(self):
         """
         Update renderbox based on how many characters have been written on input.
@@ -811,29 +939,34 @@ class TextInput(Widget):
         string = self._get_input_string()
         if string == '':  # If string is empty cursor is not updated
             return
-
-        # Calculate size of each character
-        string_size = []
-        string_total_size = 0
-        for i in range(len(string)):
-            cs = self._font.size(string[i])[0]  # Char size
-            string_size.append(cs)
-            string_total_size += cs
-
-        # Find the accumulated char size that gives the position of cursor
-        size_sum = 0
-        cursor_pos = len(string)
-        for i in range(len(string)):
-            size_sum += string_size[i] / 2
-            if self._label_size + size_sum >= mousex:
-                cursor_pos = i
-                break
-            size_sum += string_size[i] / 2
+        overflow = self._maxwidth != 0 and len(self._buffer) > self._maxwidth
+
+        # Position within the visible chars, after the left ellipsis
+        chars = len(self._get_input_string(False))
+        if overflow and self._ellipsis_left():
+            mousex -= self._ellipsis_size
+
+        # Find the first char whose middle is at the right of the mouse, the
+        # widths of the label and the string are composed once per edit
+        self._update_input_widths()
+        label_length = len(self._label)
+        chars = min(chars, self._input_widths_length)
+        get_width = self._input_widths.get_width
+        low, high = 0, chars
+        while low < high:
+            middle = (low + high) // 2
+            if get_width(label_length + middle) + get_width(label_length + middle + 1) >= 2 * mousex:
+                high = middle
+            else:
+                low = middle + 1
+        cursor_pos = low
 
         # If text have ellipsis
-        if self._maxwidth != 0 and len(self._input_string) > self._maxwidth:
-            if self._ellipsis_left():
-                cursor_pos -= 3
+        if overflow:
+            if mousex < self._label_size and self._ellipsis_left():
+                cursor_pos = -1
+            elif mousex > self._get_input_width(chars) and self._ellipsis_right():
+                cursor_pos = self._maxwidth + 1
 
             # Check if user clicked on ellipsis
             if cursor_pos < 0 or cursor_pos > self._maxwidth:
@@ -859,6 +992,14 @@ class TextInput(Widget):
                 self._renderbox[2] = cursor_pos
                 self._update_maxlimit_renderbox()
 
+        self._update_selection_mouse()
+
+    def _update_selection_mouse(self):
+        """
+        Update the selection after the cursor was moved by the mouse.
+
+        :return: None
+        """
         if self._selection_mouse_first_position == -1:
             if self._selection_active:  # Unselect and select again
                 self._unselect_text()
@@ -902,22 +1043,17 @@ class TextInput(Widget):
 
             # Filter valid chars
             if self._valid_chars is not None:
-                _default_valid = ''
-                for ch in _default:
-                    if ch in self._valid_chars:
-                        _default_valid += ch
-                _default = _default_valid
+                _default = ''.join([ch for ch in _default if ch in self._valid_chars_set])
 
             # Apply maxchar
             _ls = len(_default)
             if 0 < self._maxchar < _ls:
                 _default = _default[_ls - self._maxchar:_ls]
 
-            self._input_string = _default
+            self._update_input_string(_default)
             for i in range(len(_default) + 1):
                 self._move_cursor_right()
                 self._update_renderbox(right=1, addition=True)
-            self._update_input_string(_default)
         else:
             raise ValueError('value "{0}" type is not correct according to input_type'.format(text))
         self._update_renderbox()  # Updates cursor
@@ -932,7 +1068,7 @@ class TextInput(Widget):
         """
         if self._maxchar == 0:
             return False
-        return self._maxchar <= len(self._input_string)
+        return self._maxchar <= len(self._buffer)
 
     def _check_input_type(self, string):
         """
@@ -984,7 +1120,7 @@ class TextInput(Widget):
         :return: None
         """
         # Add one to cursor_pos, but do not exceed len(input_string)
-        self._cursor_position = min(self._cursor_position + 1, len(self._input_string))
+        self._cursor_position = min(self._cursor_position + 1, len(self._buffer))
         self._update_renderbox(right=1)
 
     def _blur(self):
@@ -993,12 +1129,86 @@ class TextInput(Widget):
         self._keyrepeat_mouse_ms = 0
         self._cursor_visible = False
         self._unselect_text()
-        # self._history_index = len(self._history) - 1
+        self._keyrepeat_counters = {}
+        scheduler = self._get_scheduler()
+        if scheduler is not None:
+            scheduler.cancel_owner(self)  # Cursor blink and key repeats
 
     def _focus(self):
-        self._cursor_ms_counter = 0
         self._cursor_visible = True
         self._cursor_render = True
+        self._schedule_cursor_blink()
+
+    def _get_scheduler(self):
+        """
+        Return the scheduler of the Menu.
+
+        :return: Scheduler, None if the widget has no Menu
+        :rtype: :py:class:`pygameMenu.scheduler.Scheduler`, NoneType
+        """
+        if self._menu is None:
+            return None
+        return self._menu.get_scheduler()
+
+    def _schedule_cursor_blink(self):
+        """
+        Register the next switch of the cursor visibility.
+
+        :return: None
+        """
+        scheduler = self._get_scheduler()
+        if scheduler is not None:
+            scheduler.schedule((self, 'cursor'), self._cursor_switch_ms, self._blink_cursor)
+
+    def _blink_cursor(self):
+        """
+        Switch the cursor visibility, called by the scheduler.
+
+        :return: None
+        """
+        if not self.selected:
+            return
+        self._cursor_visible = not self._cursor_visible
+        self._schedule_cursor_blink()
+
+    def _start_key_repeat(self, event):
+        """
+        Register the repeat of a pressed key, if the key is not ignored and
+        not repeated yet.
+
+        :param event: Pygame keydown event
+        :type event: pygame.event.EventType
+        :return: None
+        """
+        if event.key in self._keyrepeat_counters or event.key in self._ignore_keys or 'unicode' not in event.dict:
+            return
+        self._keyrepeat_counters[event.key] = event.unicode
+        scheduler = self._get_scheduler()
+        if scheduler is not None:
+            key = event.key
+            scheduler.schedule((self, 'key', key), self._keyrepeat_initial_interval_ms,
+                               lambda: self._repeat_key(key))
+
+    def _repeat_key(self, key):
+        """
+        Generate a new key event while the key is pressed, called by the scheduler.
+
+        :param key: Pygame key
+        :type key: int
+        :return: None
+        """
+        if key not in self._keyrepeat_counters:
+            return
+        try:
+            # noinspection PyArgumentList
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN,
+                                                 key=key,
+                                                 unicode=self._keyrepeat_counters[key])
+                              )
+        except pygame.error:  # If the keys are too fast pygame can raise a Sound Exception
+            pass
+        self._get_scheduler().schedule((self, 'key', key), self._keyrepeat_interval_ms,
+                                       lambda: self._repeat_key(key))
 
     def _unselect_text(self):
         """
@@ -1025,7 +1235,7 @@ class TextInput(Widget):
         :return: Text
         :rtype: basestring
         """
-        return self._input_string[self._selection_box[0]:self._selection_box[1]]
+        return self._buffer.get_text(self._selection_box[0], self._selection_box[1])
 
     def _update_input_string(self, new_string):
         """
@@ -1035,31 +1245,27 @@ class TextInput(Widget):
         :type new_string: basestring
         :return: None
         """
-        l_history = len(self._history)
-
-        # If last edition is different than the new one -> updates the history
-        if ((l_history > 0 and self._history[l_history - 1] != new_string) or l_history == 0) and self._max_history > 0:
-
-            # If index is not at last add the current status as new
-            if self._history_index != l_history:
-                last_string = self._history[self._history_index]
-                self._history_index = len(self._history)
-                self._update_input_string(last_string)
-
-            # Add new status to history
-            self._history.insert(self._history_index, new_string)
-            self._history_cursor.insert(self._history_index, self._cursor_position)
-            self._history_renderbox.insert(self._history_index,
-                                           [self._renderbox[0], self._renderbox[1], self._renderbox[2]])
+        if new_string != self._input_string:
+            self._edit(0, len(self._buffer), new_string)
 
-            if len(self._history) > self._max_history:
-                self._history.pop(0)
-                self._history_cursor.pop(0)
-                self._history_renderbox.pop(0)
-            self._history_index = len(self._history)  # This can be changed with undo/redo
+    def _edit(self, position, count, text, merge=False):
+        """
+        Replace characters of the input string and store the edition into
+        history, before the cursor and the renderbox are updated.
 
-        # Updates string
-        self._input_string = new_string
+        :param position: Position of the first replaced character
+        :type position: int
+        :param count: Number of replaced characters
+        :type count: int
+        :param text: Inserted text
+        :type text: basestring
+        :param merge: Merge with the previous edition if consecutive (typing)
+        :type merge: bool
+        :return: None
+        """
+        removed = self._buffer.delete(position, count)
+        self._buffer.insert(position, text)
+        self._history.push(position, removed, text, (self._cursor_position, tuple(self._renderbox)), merge)
 
     def _copy(self):
         """
@@ -1072,12 +1278,13 @@ class TextInput(Widget):
         if self._password:  # Password cannot be copied
             return False
 
+        copy, _, exception = _get_clipboard()
         try:
             if self._selection_surface:  # If text is selected
                 copy(self._get_selected_text())
             else:  # Copy all text
                 copy(self._input_string)
-        except PyperclipException:
+        except exception:
             pass
 
         self._block_copy_paste = True
@@ -1107,11 +1314,11 @@ class TextInput(Widget):
         Return char size in pixels.
 
         :param char: Char
+        :type char: basestring
+        :return: Width
+        :rtype: int
         """
-        if char in self._keychar_size.keys():
-            return self._keychar_size[char]
-        self._keychar_size[char] = self.font_render_string(char).get_size()[0]
-        return self._keychar_size[char]
+        return self._metrics.get_advance(char)
 
     def _paste(self):
         """
@@ -1127,59 +1334,44 @@ class TextInput(Widget):
             self._remove_selection()
 
         # Paste text in cursor
+        _, paste, exception = _get_clipboard()
         try:
             text = paste()
-        except PyperclipException:
+        except exception:
             return False
 
-        text = text.strip()
-        for i in ['\n', '\r']:
-            text = text.replace(i, '')
-
-        # Delete escape chars
-        escapes = ''.join([chr(char) for char in range(1, 32)])
-        text = text.translate(escapes)
+        # Delete line breaks and escape chars
+        text = text.strip().translate(self._paste_escapes)
         if text == '':
             return False
 
         # Remove invalid chars
         if self._valid_chars is not None:
-            valid_text = ''
-            for ch in text:
-                if ch in self._valid_chars:
-                    valid_text += ch
-            text = valid_text
+            text = ''.join([ch for ch in text if ch in self._valid_chars_set])
             if text == '':
                 return False
 
         # Cut string (if limit does exists)
         text_end = len(text)
         if self._maxchar != 0:
-            char_limit = self._maxchar - len(self._input_string)
+            char_limit = self._maxchar - len(self._buffer)
             text_end = min(char_limit, text_end)
             if text_end <= 0:  # If there's not more space, returns
                 self.sound.play_event_error()
                 return False
 
-        new_string = self._input_string[0:self._cursor_position] + \
-                     text[0:text_end] + \
-                     self._input_string[self._cursor_position:len(self._input_string)]
+        text = text[0:text_end]
 
-        # If string is valid
-        if self._check_input_type(new_string):
-
-            # Update char size
-            for char in new_string:
-                if char not in self._keychar_size:
-                    self._get_char_size(char)  # This updates the self._keychar_size variable
+        # If string is valid, the new string is only needed by numeric inputs
+        if self._input_type == _locals.INPUT_TEXT or self._check_input_type(
+                self._input_string[:self._cursor_position] + text + self._input_string[self._cursor_position:]):
 
             self.sound.play_key_add()
-            self._input_string = new_string  # For a purpose of computing render_box
-            for i in range(len(text)):  # Move cursor
-                self._move_cursor_right()
-            self._update_input_string(new_string)
+            self._metrics.measure(text)  # Measure the new chars at once
+            self._edit(self._cursor_position, 0, text)  # Before computing render_box
+            self._cursor_position += len(text)
+            self._update_renderbox_cursor()
             self.change()
-            self._update_maxlimit_renderbox()
             self._block_copy_paste = True
         else:
             self.sound.play_event_error()
@@ -1187,17 +1379,25 @@ class TextInput(Widget):
 
         return True
 
-    def _update_from_history(self):
+    def _update_from_history(self, edition, undo):
         """
-        Update all from history.
+        Undo or redo an edition, and swap the cursor and the renderbox with
+        the ones stored by the edition.
 
+        :param edition: Edition, list [position, removed, inserted, state]
+        :type edition: list
+        :param undo: Undo the edition, else redo it
+        :type undo: bool
         :return: None
         """
-        self._input_string = self._history[self._history_index]
-        self._renderbox[0] = self._history_renderbox[self._history_index][0]
-        self._renderbox[1] = self._history_renderbox[self._history_index][1]
-        self._renderbox[2] = self._history_renderbox[self._history_index][2]
-        self._cursor_position = self._history_cursor[self._history_index]
+        position, removed, inserted, state = edition
+        if undo:
+            removed, inserted = inserted, removed
+        self._buffer.delete(position, len(removed))
+        self._buffer.insert(position, inserted)
+        edition[3] = (self._cursor_position, tuple(self._renderbox))
+        self._cursor_position = state[0]
+        self._renderbox = list(state[1])
         self._cursor_render = True
 
     def _undo(self):
@@ -1206,12 +1406,10 @@ class TextInput(Widget):
 
         :return: None
         """
-        if self._history_index == 0:  # There's no back history
+        edition = self._history.undo()
+        if edition is None:  # There's no back history
             return False
-        if self._history_index == len(self._history):  # If the actual is the last
-            self._history_index -= 1
-        self._history_index = max(0, self._history_index - 1)
-        self._update_from_history()
+        self._update_from_history(edition, True)
         return True
 
     def _redo(self):
@@ -1220,10 +1418,10 @@ class TextInput(Widget):
 
         :return: None
         """
-        if self._history_index == len(self._history) - 1:  # There's no forward history
+        edition = self._history.redo()
+        if edition is None:  # There's no forward history
             return False
-        self._history_index = min(len(self._history) - 1, self._history_index + 1)
-        self._update_from_history()
+        self._update_from_history(edition, False)
         return True
 
     def _remove_selection(self):
@@ -1252,11 +1450,8 @@ class TextInput(Widget):
 
         :return: None
         """
-        new_string = (
-                self._input_string[:max(self._cursor_position - 1, 0)]
-                + self._input_string[self._cursor_position:]
-        )
-        self._update_input_string(new_string)
+        if self._cursor_position > 0:
+            self._edit(self._cursor_position - 1, 1, '', merge=True)
         self._update_renderbox(left=-1, addition=True)
 
         # Subtract one from cursor_pos, but do not go below zero:
@@ -1268,11 +1463,8 @@ class TextInput(Widget):
 
         :return: None
         """
-        new_string = (
-                self._input_string[:self._cursor_position]
-                + self._input_string[self._cursor_position + 1:]
-        )
-        self._update_input_string(new_string)
+        if self._cursor_position < len(self._buffer):
+            self._edit(self._cursor_position, 1, '', merge=True)
         self._update_renderbox(right=-1, addition=True)
 
     def _select_all(self):
@@ -1284,9 +1476,9 @@ class TextInput(Widget):
         if not self._selection_enabled:
             return
         self._selection_box[0] = 0
-        self._selection_box[1] = len(self._input_string)
+        self._selection_box[1] = len(self._buffer)
         self._cursor_position = self._selection_box[1]
-        for i in range(len(self._input_string)):
+        for i in range(len(self._buffer)):
             self._move_cursor_right()
         self._render_selection_box(True)
         self._selection_active = False
@@ -1312,13 +1504,6 @@ class TextInput(Widget):
                 self.sound.play_event_error()
             return False
 
-        # If no special key is pressed, add unicode of key to input_string
-        new_string = (
-                self._input_string[:self._cursor_position]
-                + keychar
-                + self._input_string[self._cursor_position:]
-        )
-
         # If unwanted escape sequences
         event_escaped = repr(keychar)
         if '\\r' in event_escaped:
@@ -1330,22 +1515,19 @@ class TextInput(Widget):
                 self.sound.play_event_error()
             return False
 
-        # If data is valid
-        if self._check_input_type(new_string):
+        # If data is valid, the new string is only needed by numeric inputs
+        if self._input_type == _locals.INPUT_TEXT or self._check_input_type(
+                self._input_string[:self._cursor_position] + keychar + self._input_string[self._cursor_position:]):
             lkey = len(keychar)
             if lkey > 0:
 
-                # Update char size
-                if keychar not in self._keychar_size.keys():
-                    self._get_char_size(keychar)  # This updates keychar size data
                 self._last_char = keychar
 
                 # Update string
                 if sounds:
                     self.sound.play_key_add()
+                self._edit(self._cursor_position, 0, keychar, merge=True)  # Update the string and the history
                 self._cursor_position += 1  # Some are empty, e.g. K_UP
-                self._input_string = new_string  # Only here this is changed (due to renderbox update)
-                self._update_input_string(new_string)  # Update the string and the history
                 self._update_renderbox(right=1, addition=True)
                 self.change()
                 return True
@@ -1371,9 +1553,7 @@ class TextInput(Widget):
                 self._last_key = event.key
 
                 # If none exist, create counter for that key:
-                if event.key not in self._keyrepeat_counters and event.key not in self._ignore_keys and \
-                        'unicode' in event.dict:
-                    self._keyrepeat_counters[event.key] = [0, event.unicode]
+                self._start_key_repeat(event)
 
                 # User press ctrl+something
                 if pygame.key.get_mods() & pygame.KMOD_CTRL:
@@ -1571,6 +1751,9 @@ class TextInput(Widget):
                 # Because KEYUP doesn't include event.unicode, this dict is stored in such a weird way
                 if event.key in self._keyrepeat_counters:
                     del self._keyrepeat_counters[event.key]
+                    scheduler = self._get_scheduler()
+                    if scheduler is not None:
+                        scheduler.cancel((self, 'key', event.key))
 
                 # If selection keys are released, stop selection
                 elif event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
@@ -1592,43 +1775,23 @@ class TextInput(Widget):
                 self._selection_active = True
                 self._selection_mouse_first_position = -1
 
-        # Get time clock
-        time_clock = self._clock.get_time()
-        self._keyrepeat_mouse_ms += time_clock
-
         # Check mouse pressed
         mouse_left, mouse_middle, mouse_right = pygame.mouse.get_pressed()
         self._mouse_is_pressed = mouse_left or mouse_right or mouse_middle
 
-        if self._keyrepeat_mouse_ms > self._keyrepeat_mouse_interval_ms:
-            self._keyrepeat_mouse_ms = 0
-            if mouse_left:
-                pos = pygame.mouse.get_pos()
-                self._check_mouse_collide_input((pos[0] - self._absolute_origin[0],
-                                                 pos[1] - self._absolute_origin[1]))
-
-        # Update key counters:
-        for key in self._keyrepeat_counters:
-            self._keyrepeat_counters[key][0] += time_clock  # Update clock
-
-            # Generate new key events if enough time has passed:
-            if self._keyrepeat_counters[key][0] >= self._keyrepeat_initial_interval_ms:
-                self._keyrepeat_counters[key][0] = self._keyrepeat_initial_interval_ms - self._keyrepeat_interval_ms
-
-                event_key, event_unicode = key, self._keyrepeat_counters[key][1]
-                try:
-                    # noinspection PyArgumentList
-                    pygame.event.post(pygame.event.Event(pygame.KEYDOWN,
-                                                         key=event_key,
-                                                         unicode=event_unicode)
-                                      )
-                except pygame.error:  # If the keys are too fast pygame can raise a Sound Exception
-                    pass
-
-        # Update self._cursor_visible
-        self._cursor_ms_counter += time_clock
-        if self._cursor_ms_counter >= self._cursor_switch_ms:
-            self._cursor_ms_counter %= self._cursor_switch_ms
-            self._cursor_visible = not self._cursor_visible
+        scheduler = self._get_scheduler()
+        if scheduler is not None:
+            time = scheduler.get_time()  # Time of the frame
+            if time - self._keyrepeat_mouse_ms > self._keyrepeat_mouse_interval_ms:
+                self._keyrepeat_mouse_ms = time
+                if mouse_left:
+                    pos = pygame.mouse.get_pos()
+                    self._check_mouse_collide_input((pos[0] - self._absolute_origin[0],
+                                                     pos[1] - self._absolute_origin[1]))
+
+            # The input may have been selected before its Menu was opened, so the
+            # blink was scheduled on the scheduler of the submenu
+            if self.selected and not scheduler.is_scheduled((self, 'cursor')):
+                self._schedule_cursor_blink()
 
         return updated
@@ -32,6 +32,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 from test._utils import *
 
+import copy
+
 
 class BaseImageTest(unittest.TestCase):
 
@@ -128,3 +130,69 @@ class BaseImageTest(unittest.TestCase):
 
         # Scale should not change
         image.scale(1, 1)
+
+    def test_cache(self):
+        """
+        Test the surfaces shared by the images.
+        """
+        path = pygameMenu.baseimage.IMAGE_GRAY_LINES
+        cache = pygameMenu.baseimage._cache
+        self.assertEqual(pygameMenu.baseimage.get_image_cache_info()['entries'], 0)
+
+        # The images with the same transformations share the surface
+        images = []
+        for _ in range(3):
+            image = pygameMenu.baseimage.BaseImage(path, keep_original=False)
+            image.rotate(90)
+            image.scale(0.5, 0.5)
+            images.append(image)
+        self.assertEqual(len(cache), 0)  # Not loaded yet
+        self.assertIs(images[0].get_surface(shared=True), images[1].get_surface(shared=True))
+        self.assertEqual(images[2].get_size(), (128, 128))
+        self.assertEqual(list(cache.keys()), [(path, ('rotate', 90), ('scale', 0.5, 0.5, False))])
+
+        # Copy on write
+        shared = images[1].get_surface(shared=True)
+        surface = images[0].get_surface()
+        self.assertIsNot(surface, shared)
+        self.assertIs(images[0].get_surface(), surface)
+        surface.fill((255, 0, 0))
+        self.assertFalse(images[0].equals(images[1]))
+        self.assertTrue(images[1].equals(images[2]))
+
+        # The copies of an image share the surface
+        image = copy.copy(images[1])
+        del images[1:]
+        self.assertEqual(len(cache), 1)
+        self.assertIs(image.get_surface(shared=True), shared)
+        del shared, image
+        self.assertEqual(len(cache), 0)
+
+        # The original surface is not kept
+        self.assertRaises(AssertionError, lambda: images[0].restore())
+        images[0].checkpoint()
+        images[0].scale2x()
+        self.assertEqual(images[0].get_size(), (256, 256))
+        images[0].restore()
+        self.assertEqual(images[0].get_size(), (128, 128))
+        self.assertEqual(len(cache), 0)
+
+        # The original surface is kept by its key, and loaded when restored
+        image = pygameMenu.baseimage.BaseImage(path)
+        self.assertEqual(len(cache), 0)
+        image.flip(False, True)
+        image.get_size()
+        self.assertEqual(list(cache.keys()), [(path, ('flip', False, True))])
+        image.restore()
+        self.assertEqual(image.get_size(), (256, 256))
+        self.assertEqual(list(cache.keys()), [(path,)])
+        image.drop_original()
+        del image
+        self.assertEqual(len(cache), 0)
+
+        # Image widgets
+        images = [pygameMenu.widgets.Image(path, scale=(0.25, 0.25), scale_smooth=False) for _ in range(10)]
+        for image in images:
+            image.get_rect()  # Render
+        self.assertTrue(all(image._surface is images[0]._surface for image in images))
+        self.assertEqual(pygameMenu.baseimage.get_image_cache_info(), {'entries': 1})
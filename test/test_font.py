@@ -45,6 +45,65 @@ class FontTest(unittest.TestCase):
         self.assertRaises(ValueError, lambda: PygameMenuUtils.get_font('', 0))
         self.assertRaises(ValueError, lambda: PygameMenuUtils.get_font('sys', 0))
 
+    def test_font_cache(self):
+        """
+        Test the fonts shared by path and size.
+        """
+        font = pygameMenu.font.get_font(pygameMenu.font.FONT_8BIT, 10)
+        self.assertIs(font, pygameMenu.font.get_font(pygameMenu.font.FONT_8BIT, 10))
+        self.assertIsNot(font, pygameMenu.font.get_font(pygameMenu.font.FONT_8BIT, 11))
+
+        # Remove the fonts of a file
+        font2 = pygameMenu.font.get_font(pygameMenu.font.FONT_NEVIS, 10)
+        pygameMenu.font.clear_font_cache(pygameMenu.font.FONT_8BIT)
+        self.assertIsNot(font, pygameMenu.font.get_font(pygameMenu.font.FONT_8BIT, 10))
+        self.assertIs(font2, pygameMenu.font.get_font(pygameMenu.font.FONT_NEVIS, 10))
+
+        # Remove all the fonts
+        pygameMenu.font.clear_font_cache()
+        self.assertIsNot(font2, pygameMenu.font.get_font(pygameMenu.font.FONT_NEVIS, 10))
+
+    def test_font_metrics(self):
+        """
+        Test the metrics shared by the widgets.
+        """
+        font = pygameMenu.font.get_font(pygameMenu.font.FONT_PT_SERIF, 20)
+        metrics = pygameMenu.font.get_font_metrics(font)
+        self.assertIs(metrics, pygameMenu.font.get_font_metrics(font))
+        self.assertEqual(metrics.get_advance('W'), font.size('W')[0])
+
+        # The widths of the common prefix are kept
+        widths = pygameMenu.font.TextWidths(font)
+        widths.set_text('AVATAR To')
+        self.assertEqual(widths.get_width(9), font.size('AVATAR To')[0])
+        self.assertEqual(widths.get_width(0), 0)
+        widths.set_text('AVAIL')
+        self.assertEqual(widths._widths, [0, None, None, None, None, None])
+        widths.get_width(3)
+        widths.set_text('AVA')
+        self.assertEqual(widths._widths, [0, None, None, font.size('AVA')[0]])
+        for i in range(4):
+            self.assertEqual(widths.get_width(i), font.size('AVA'[:i])[0])
+
+        # Without kerning the widths are the sums of the advances
+        font = pygameMenu.font.get_font(pygameMenu.font.FONT_NEVIS, 20)
+        widths = pygameMenu.font.TextWidths(font)
+        widths.set_text('hello world')
+        self.assertEqual(widths.get_width(5), font.size('hello')[0])
+        self.assertFalse(widths._kerning)
+        self.assertEqual(widths._widths[0:6], [font.size('hello'[:i])[0] for i in range(6)])
+        self.assertEqual(widths._widths[6:], [None] * 6)
+        self.assertEqual(widths.get_width(11), font.size('hello world')[0])
+
+        # Text input using the font
+        menu = PygameMenuUtils.generic_menu()
+        textinput = menu.add_text_input('title: ', font_name=pygameMenu.font.FONT_PT_SERIF)
+        self.assertIs(textinput._metrics, pygameMenu.font.get_font_metrics(textinput._font))
+        textinput.set_value('AVATAR')
+        textinput.draw(surface)
+        for i in range(7):
+            self.assertEqual(textinput._get_input_width(i), textinput._font.size('title: ' + 'AVATAR'[:i])[0])
+
     def test_system_load(self):
         """
         Test fonts from system.
@@ -55,3 +114,58 @@ class FontTest(unittest.TestCase):
 
         # Modify the system font and load, this will raise an exception
         self.assertRaises(ValueError, lambda: PygameMenuUtils.get_font('invalid font', 5))
+
+    def test_glyph_atlas(self):
+        """
+        Test the text rendered from the glyph atlas.
+        """
+        font = PygameMenuUtils.get_font(pygameMenu.font.FONT_NEVIS, 20)
+        atlas = pygameMenu.glyphatlas.GlyphAtlas(font, (255, 255, 255))
+        text = atlas.render('hello world')
+        self.assertEqual(text.get_size(), font.size('hello world'))
+        self.assertEqual(atlas.get_glyph_count(), 8)
+
+        # The glyphs are copied from the rendered ones
+        glyph = font.render('h', True, (255, 255, 255))
+        for x in range(glyph.get_width()):
+            for y in range(glyph.get_height()):
+                self.assertEqual(text.get_at((x, y)), glyph.get_at((x, y)))
+
+        # A string with the same prefix reuses the last surface
+        text2 = atlas.render('hello world!')
+        self.assertEqual(text2.get_size(), font.size('hello world!'))
+        self.assertEqual(text2.get_at((5, 10)), text.get_at((5, 10)))
+        self.assertEqual(atlas.render('').get_height(), font.size('')[1])
+
+        # The atlas is cleared when the glyphs exceed the limit
+        atlas = pygameMenu.glyphatlas.GlyphAtlas(font, (255, 255, 255), max_glyphs=4)
+        atlas.render('abcd')
+        self.assertEqual(atlas.get_glyph_count(), 4)
+        self.assertEqual(atlas.render('ef').get_size(), font.size('ef'))
+        self.assertEqual(atlas.get_glyph_count(), 2)
+        self.assertEqual(atlas.render('abcdef').get_size(), font.size('abcdef'))  # Rendered by the font
+        self.assertEqual(atlas.get_glyph_count(), 2)
+
+        # The least recently used atlases are discarded
+        pygameMenu.glyphatlas.enable_glyph_atlas(pygameMenu.font.FONT_NEVIS)
+        first = pygameMenu.glyphatlas.get_glyph_atlas(font, pygameMenu.font.FONT_NEVIS, 20, (0, 0, 0), True)
+        for i in range(pygameMenu.glyphatlas._MAX_ATLASES):
+            pygameMenu.glyphatlas.get_glyph_atlas(font, pygameMenu.font.FONT_NEVIS, 20, (i, 1, 1), True)
+        self.assertEqual(len(pygameMenu.glyphatlas._ATLASES), pygameMenu.glyphatlas._MAX_ATLASES)
+        self.assertIsNot(pygameMenu.glyphatlas.get_glyph_atlas(font, pygameMenu.font.FONT_NEVIS, 20,
+                                                               (0, 0, 0), True), first)
+        pygameMenu.glyphatlas.enable_glyph_atlas(pygameMenu.font.FONT_NEVIS, False)
+
+        # Widgets using the font
+        pygameMenu.glyphatlas.enable_glyph_atlas(pygameMenu.font.FONT_NEVIS)
+        menu = PygameMenuUtils.generic_menu()
+        textinput = menu.add_text_input('text: ', font_name=pygameMenu.font.FONT_NEVIS)
+        textinput.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        textinput.draw(surface)
+        atlas = pygameMenu.glyphatlas.get_glyph_atlas(None, pygameMenu.font.FONT_NEVIS,
+                                                      textinput.get_font_info()['size'],
+                                                      textinput.get_font_info()['selected_color'], True)
+        self.assertGreater(atlas.get_glyph_count(), 0)
+        pygameMenu.glyphatlas.enable_glyph_atlas(pygameMenu.font.FONT_NEVIS, False)
+        self.assertIsNone(pygameMenu.glyphatlas.get_glyph_atlas(None, pygameMenu.font.FONT_NEVIS, 20,
+                                                                (255, 255, 255), True))
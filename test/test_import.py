@@ -0,0 +1,89 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST IMPORT
+Test the lazy import of the package.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from test._utils import *
+
+import os
+import subprocess
+import sys
+
+# Imports the package in a new interpreter, then prints the loaded modules
+# of the package
+_SCRIPT = """
+import sys
+import pygame
+import pygameMenu
+print(' '.join(sorted(m for m in sys.modules if m.startswith('pygameMenu') or m == 'pyperclip')))
+import pygameMenu.menu
+print(' '.join(sorted(m for m in sys.modules if m.startswith('pygameMenu') or m == 'pyperclip')))
+"""
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_lazy_import(self):
+        """
+        Test the modules are imported on first access.
+        """
+        if sys.version_info < (3, 7):  # Module __getattr__ is not supported
+            return
+        env = dict(os.environ)
+        env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', _SCRIPT], env=env)
+        package, menu = output.decode().strip().splitlines()[-2:]
+
+        # The package only loads a few constants
+        self.assertEqual(package.split(), ['pygameMenu', 'pygameMenu.controls', 'pygameMenu.events',
+                                           'pygameMenu.locals', 'pygameMenu.version'])
+
+        # The menu does not load the widgets it does not use, nor the clipboard
+        for module in ('pygameMenu.baseimage', 'pygameMenu.widgets.widget.textinput', 'pyperclip'):
+            self.assertNotIn(module, menu.split())
+        self.assertIn('pygameMenu.menu', menu.split())
+
+        # Attribute access loads the modules
+        self.assertEqual(pygameMenu.font.FONT_8BIT, pygameMenu.font.FONT_8BIT)
+        self.assertTrue(issubclass(pygameMenu.Menu, object))
+        self.assertRaises(AttributeError, lambda: pygameMenu.invalid)
+        self.assertRaises(AttributeError, lambda: pygameMenu.widgets.Invalid)
+
+        # The lazy names are listed and exported
+        for name in ('Menu', 'baseimage', 'sound', 'widgets'):
+            self.assertIn(name, dir(pygameMenu))
+        self.assertIn('TextInput', dir(pygameMenu.widgets))
+        namespace = {}
+        exec('from pygameMenu import *', namespace)
+        exec('from pygameMenu.widgets import *', namespace)
+        self.assertIs(namespace['Menu'], pygameMenu.Menu)
+        self.assertIs(namespace['sound'], pygameMenu.sound)
+        self.assertIs(namespace['TextInput'], pygameMenu.widgets.TextInput)
@@ -33,6 +33,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from test._utils import *
 
 from pygameMenu import events
+from pygameMenu.scheduler import FakeClock
+import sys
 import timeit
 
 # Configure the tests
@@ -187,6 +189,24 @@ class MenuTest(unittest.TestCase):
         self.assertEqual(self.menu.get_widget('deep_id', recursive=True), deep_widget)
         self.assertEqual(self.menu.get_widget('deep_selector', recursive=True), deep_selector)
 
+        # The index of IDs follows the changes of the menus
+        new_widget = prev_menu.add_button('new', events.NONE, button_id='new_id')
+        self.assertEqual(self.menu.get_widget('new_id', recursive=True), new_widget)
+        self.assertRaises(ValueError, lambda: prev_menu.add_button('new', events.NONE, button_id='new_id'))
+        prev_menu.clear()
+        self.assertEqual(self.menu.get_widget('deep_id', recursive=True), None)
+        self.assertEqual(self.menu.get_widget('some_id', recursive=True), widget)
+
+        # The changes of a Menu out of the tree keep the index
+        tree = self.menu._widgets_tree_id
+        PygameMenuUtils.generic_menu().add_button('other', events.NONE, button_id='other_id')
+        self.assertEqual(self.menu.get_widget('other_id', recursive=True), None)
+        self.assertIs(self.menu._widgets_tree_id, tree)
+
+        # A sub-menu linking to a previous Menu
+        prev_menu.add_button('back', self.menu)
+        self.assertEqual(self.menu.get_widget('new_id', recursive=True), None)
+
     # noinspection PyArgumentEqualDefault
     def test_get_selected_widget(self):
         """
@@ -347,3 +367,474 @@ class MenuTest(unittest.TestCase):
         _column_menu.disable()
         self.assertRaises(RuntimeError, lambda: _column_menu.draw(surface))
         self.assertRaises(AssertionError, lambda: _column_menu.add_button('test', pygameMenu.events.BACK))  # 9th item
+
+    def test_dirty_rects(self):
+        """
+        Test the areas returned by draw if dirty rects are enabled.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu', dirty_rects=True)
+        menu.enable()
+        self.menu.enable()
+        self.assertEqual(self.menu.draw(surface), None)  # Disabled by default
+        button = menu.add_button('button', events.NONE)
+        textinput = menu.add_text_input('text: ')
+
+        # First frame updates the whole Menu
+        self.assertEqual(menu.draw(surface), [menu.get_rect()])
+        self.assertEqual(menu.draw(surface), [])
+
+        # Changing the selection updates the old and new widgets
+        menu._select(1)
+        rects = menu.draw(surface)
+        self.assertEqual(len(rects), 2)
+        for rect in rects:
+            self.assertTrue(menu.get_rect().contains(rect))
+        real_rect = menu._scroll.to_real_position(button.get_rect())
+        self.assertTrue(rects[0].contains(real_rect) or rects[1].contains(real_rect))
+
+        # Typing changes only the text input
+        textinput.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        rects = menu.draw(surface)
+        self.assertEqual(len(rects), 2)
+        real_rect = menu._scroll.to_real_position(textinput.get_rect())
+        self.assertTrue(rects[0].contains(real_rect))
+
+        # Only the changed areas are drawn again, the frame is the same as a full draw
+        bgfun_calls = []
+
+        def bgfun():
+            bgfun_calls.append(surface.get_clip())
+            surface.fill((0, 0, 0))
+
+        menu._background_function = bgfun
+        menu._last_frame_state = None
+        self.assertEqual(menu.draw(surface), [menu.get_rect()])
+        del bgfun_calls[:]
+        self.assertEqual(menu.draw(surface), [])
+        self.assertEqual(bgfun_calls, [])  # Nothing to draw
+        textinput.update(PygameUtils.key(pygame.K_b, keydown=True, char='b'))
+        rects = menu.draw(surface)
+        self.assertTrue(bgfun_calls[0].contains(rects[0]))
+        self.assertFalse(bgfun_calls[0].contains(menu.get_rect()))
+        self.assertEqual(surface.get_clip(), surface.get_rect())
+        frame = pygame.image.tostring(surface.subsurface(menu.get_rect()), 'RGBA')
+        menu._last_frame_state = None
+        self.assertEqual(menu.draw(surface), [menu.get_rect()])
+        self.assertEqual(pygame.image.tostring(surface.subsurface(menu.get_rect()), 'RGBA'), frame)
+        menu._background_function = None
+
+        # Mainloop uses the rects
+        menu.mainloop(surface, disable_loop=True)
+
+    def test_retained_widgets(self):
+        """
+        Test that the retained widgets surface is equal to the one drawn from scratch.
+        """
+        menus = []
+        for retained in (False, True):
+            menu = PygameMenuUtils.generic_menu(title='mainmenu', retained_widgets=retained)
+            menu.enable()
+            for i in range(10):
+                menu.add_button('button {0}'.format(i), events.NONE)
+            menu.add_text_input('text: ', textinput_id='text')
+            menus.append(menu)
+
+        def draw_and_compare():
+            for m in menus:
+                m.draw(surface)
+            views = []  # Widgets out of the viewable area are not drawn
+            for m in menus:
+                rect = m._scroll.get_world_view_rect().clip(m._widgets_surface.get_rect())
+                views.append(pygame.image.tostring(m._widgets_surface.subsurface(rect), 'RGBA'))
+            self.assertEqual(views[0], views[1])
+
+        draw_and_compare()
+        self.assertEqual(menus[1]._update_widgets_draw_state(menus[1]._get_visible_widgets()), [])  # Nothing changed
+
+        # Move the selection
+        for m in menus:
+            m._select(3)
+        draw_and_compare()
+
+        # Change the width of a widget
+        for m in menus:
+            m._select(10)
+            m.get_widget('text').update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        draw_and_compare()
+
+    def test_draw_culling(self):
+        """
+        Test that only the widgets within the viewable area are drawn.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        menu.enable()
+        buttons = [menu.add_button('button {0}'.format(i), events.NONE) for i in range(100)]
+        menu.draw(surface)
+        visible = menu._get_visible_widgets()
+        self.assertLess(len(visible), 20)
+        self.assertEqual(visible, buttons[0:len(visible)])
+
+        # The overscan adds the widgets next to the viewable area
+        menu._draw_overscan = 100
+        self.assertGreater(len(menu._get_visible_widgets()), len(visible))
+        menu._draw_overscan = 0
+
+        # Scroll to the end of the Menu
+        menu._select(99)
+        menu.draw(surface)
+        visible = menu._get_visible_widgets()
+        self.assertIn(buttons[99], visible)
+        self.assertNotIn(buttons[0], visible)
+
+        # Widgets out of the viewable area are not drawn
+        drawn = []
+        buttons[0].draw = lambda *args: drawn.append(0)
+        buttons[99].draw = lambda *args: drawn.append(99)
+        menu.draw(surface)
+        self.assertEqual(drawn, [99])
+
+    def test_virtual_list(self):
+        """
+        Test the virtual list mode.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        menu.enable()
+        requested = []
+        applied = []
+
+        def row(index):
+            requested.append(index)
+            return 'Row {0}'.format(index), index * 2
+
+        menu.set_virtual_list(100000, row, list_id='list', onreturn=lambda *args: applied.append(args))
+        self.assertRaises(AssertionError, lambda: menu.set_virtual_list(10, row))  # Menu has widgets
+        self.assertEqual(menu.get_widget('list'), menu._widgets[0])
+
+        # Only the rows of the pool are created
+        pool = len(menu._widgets)
+        self.assertLess(pool, 20)
+        self.assertEqual(len(requested), pool + 1)  # First row estimates the height
+        menu.draw(surface)
+        self.assertEqual(menu.get_input_data(), {'list': 0})
+        self.assertLess(menu._widgets_surface.get_height(), 1000)
+
+        # Move through the rows
+        for _ in range(30):
+            menu.update(PygameUtils.key(pygameMenu.controls.KEY_MOVE_UP, keydown=True))
+            menu.draw(surface)
+        self.assertEqual(menu.get_input_data(), {'list': 30})
+        self.assertEqual(menu.get_selected_widget().get_title(), 'Row 30')
+        self.assertEqual(len(menu._widgets), pool)
+        menu.update(PygameUtils.key(pygameMenu.controls.KEY_APPLY, keydown=True))
+        self.assertEqual(applied, [(30, 60)])
+
+        # Go to the last row
+        menu._select(menu._index - 31)
+        menu.draw(surface)
+        self.assertEqual(menu.get_input_data(), {'list': 99999})
+        self.assertEqual(menu.get_selected_widget().get_title(), 'Row 99999')
+        widget = menu.get_selected_widget()
+        self.assertTrue(menu._scroll.get_world_view_rect().contains(widget.get_rect()))
+
+        # Scroll to the middle, the selection follows the pool
+        for sbar in menu._scroll._scrollbars:
+            if sbar.get_orientation() == pygameMenu.locals.ORIENTATION_VERTICAL:
+                sbar.set_value(sbar.get_maximum() / 2)
+        menu.draw(surface)
+        index = menu.get_input_data()['list']
+        self.assertAlmostEqual(index, 50000, delta=pool)
+        self.assertEqual(menu.get_selected_widget().get_title(), 'Row {0}'.format(index))
+
+        # Select a row with the mouse
+        widget = menu._widgets[pool // 2]
+        rect = menu._scroll.to_real_position(widget.get_rect())
+        menu.update(PygameUtils.mouse_click(rect.centerx, rect.centery, evtype=pygame.MOUSEBUTTONDOWN))
+        self.assertEqual(menu.get_selected_widget(), widget)
+        self.assertEqual(menu.get_input_data()['list'], int(widget.get_title()[4:]))
+
+        # Clear removes the list
+        menu.clear()
+        self.assertEqual(menu.get_input_data(), {})
+        self.assertEqual(menu.get_widget('list'), None)
+        menu.set_virtual_list(10, row, list_id='list')
+
+    def test_update_widget_size(self):
+        """
+        Test the update of the position of the widgets after a widget size change.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu', columns=2, rows=20)
+        menu.enable()
+        textinput = menu.add_text_input('text: ')
+        for i in range(29):
+            menu.add_button('button {0}'.format(i), events.NONE)
+        menu.draw(surface)
+        widgets_surface = menu._widgets_surface
+
+        def positions():
+            return [w.get_position() for w in menu._widgets]
+
+        # Typing changes the width of the text input, the surface is kept
+        x = textinput.get_position()[0]
+        menu.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        self.assertEqual(menu._widgets_surface, widgets_surface)
+        self.assertLess(textinput.get_position()[0], x)
+        last = positions()
+        menu._column_widths = None  # Layout from scratch
+        menu._update_widget_position()
+        self.assertEqual(positions(), last)
+
+        # A taller widget moves the following rows of its column only, as it is
+        # wider than its column the columns are moved
+        button = menu._widgets[22]
+        width = menu._column_content_widths[1]
+        button.set_font(pygameMenu.font.FONT_NEVIS, 50, (255, 255, 255), (0, 0, 0))
+        button.set_title('big button')
+        self.assertGreater(button.get_rect().width, width)
+        menu._update_widget_size(button)
+        self.assertEqual(menu._widgets_surface, widgets_surface)
+        self.assertEqual([p[1] for p in positions()[0:23]], [p[1] for p in last[0:23]])
+        self.assertNotEqual([p[0] for p in positions()[0:20]], [p[0] for p in last[0:20]])
+        self.assertGreater(positions()[23][1], last[23][1])
+        last = positions()
+        menu._column_widths = None
+        menu._update_widget_position()
+        self.assertEqual(positions(), last)
+        self.assertIn(menu._widgets[29], menu._get_widgets_in_area(menu._widgets[29].get_rect()))
+
+        # If the widgets do not fit anymore the surface is rebuilt
+        button = menu._widgets[5]
+        button.set_font(pygameMenu.font.FONT_NEVIS, 50, (255, 255, 255), (0, 0, 0))
+        button.set_title('big button')
+        menu._update_widget_size(button)
+        self.assertIsNone(menu._widgets_surface)
+
+    def test_mainloop_idle(self):
+        """
+        Test the mainloop waiting for the events.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        menu.enable()
+        button = menu.add_button('button', events.NONE)
+        textinput = menu.add_text_input('text: ')
+        self.assertIsNone(button.get_update_delay())
+        self.assertIsNone(textinput.get_update_delay())  # Not selected
+
+        # The cursor of the selected input blinks
+        menu._select(1)
+        self.assertIsNone(textinput.get_update_delay())
+        delay = menu.get_scheduler().get_delay()
+        self.assertGreaterEqual(delay, 0)
+        self.assertLessEqual(delay, 500)
+        textinput.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        self.assertTrue(menu.get_scheduler().is_scheduled((textinput, 'key', pygame.K_a)))  # Key repeat
+        textinput.update(PygameUtils.key(pygame.K_a, keyup=True, char='a'))
+        self.assertFalse(menu.get_scheduler().is_scheduled((textinput, 'key', pygame.K_a)))
+
+        # The first frame is drawn without waiting for the events
+        pygame.event.clear()
+        frames = []
+        menu.mainloop(surface, bgfun=lambda: frames.append(True), idle=True, disable_loop=True)
+        self.assertEqual(frames, [True])
+
+        # The events are consumed by the frame
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {}))
+        menu.mainloop(surface, idle=True, disable_loop=True)
+        self.assertEqual(pygame.event.get(pygame.USEREVENT), [])
+
+    def test_scheduler(self):
+        """
+        Test the animations of the widgets driven by a fake clock.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        clock = FakeClock()
+        scheduler = menu.get_scheduler()
+        scheduler.set_clock(clock)
+        textinput = menu.add_text_input('text: ')
+        menu.add_button('button', events.NONE)
+        menu.add_button('button', events.NONE)
+        self.assertTrue(textinput.selected)
+        self.assertTrue(textinput._cursor_visible)
+        menu.update([])  # The blink is scheduled on the first update
+        self.assertEqual(scheduler.get_delay(), 500)
+
+        # The cursor blinks with the frame time
+        clock.advance(499)
+        menu.update([])
+        self.assertTrue(textinput._cursor_visible)
+        clock.advance(1)
+        menu.update([])
+        self.assertFalse(textinput._cursor_visible)
+        self.assertEqual(scheduler.get_time(), 500)
+        clock.advance(500)
+        menu.update([])
+        self.assertTrue(textinput._cursor_visible)
+
+        # Key repeat
+        pygame.event.clear()
+        menu.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        self.assertEqual(textinput.get_value(), 'a')
+        clock.advance(textinput._keyrepeat_initial_interval_ms)
+        menu.update([])
+        events_repeat = pygame.event.get(pygame.KEYDOWN)
+        self.assertEqual(len(events_repeat), 1)
+        self.assertEqual(events_repeat[0].unicode, 'a')
+        menu.update(PygameUtils.key(pygame.K_a, keyup=True, char='a'))
+        clock.advance(1000)
+        menu.update([])
+        self.assertEqual(pygame.event.get(pygame.KEYDOWN), [])
+
+        # Joystick repeat, without timer events
+        menu._joystick = True
+        menu._columns = 1
+        menu.update(PygameUtils.joy_motion(0, 1))
+        self.assertEqual(menu._index, 1)
+        self.assertFalse(scheduler.is_scheduled((textinput, 'cursor')))
+        clock.advance(pygameMenu.controls.JOY_DELAY)
+        menu.update([])
+        self.assertEqual(menu._index, 2)
+        clock.advance(pygameMenu.controls.JOY_REPEAT)
+        menu.update([])
+        self.assertEqual(menu._index, 0)
+        menu.update([pygame.event.Event(pygame.JOYAXISMOTION, {'value': 0, 'axis': pygameMenu.controls.JOY_AXIS_Y,
+                                                               'test': True})])
+        clock.advance(1000)
+        menu.update([])
+        self.assertEqual(menu._index, 0)
+        self.assertTrue(scheduler.is_scheduled((textinput, 'cursor')))  # Selected again
+
+        # The deadlines are cancelled when the input loses the focus or is removed
+        menu.update(PygameUtils.key(pygame.K_b, keydown=True, char='b'))
+        self.assertTrue(scheduler.is_scheduled((textinput, 'key', pygame.K_b)))
+        textinput.set_selected(False)
+        self.assertIsNone(scheduler.get_delay())
+        textinput.set_selected()
+        menu.update(PygameUtils.key(pygame.K_b, keydown=True, char='b'))
+        self.assertIsNotNone(scheduler.get_delay())
+        menu.clear()
+        self.assertIsNone(scheduler.get_delay())
+        pygame.event.clear()
+
+    def test_mainloop_async(self):
+        """
+        Test the mainloop as a coroutine.
+        """
+        if sys.version_info < (3, 5):
+            return
+        import asyncio
+        from test._async_utils import make_coroutine_callback  # async syntax
+
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        menu.enable()
+        called = []
+
+        def action():
+            called.append(True)
+            menu.disable()
+
+        menu.add_button('button', make_coroutine_callback(action))
+
+        # A coroutine callback without running loop is run until complete
+        menu.get_selected_widget().apply()
+        self.assertEqual(called, [True])
+
+        # The coroutine callback is scheduled on the loop, it closes the Menu
+        menu.enable()
+        pygame.event.clear()
+        pygame.event.post(PygameUtils.key(pygameMenu.controls.KEY_APPLY, keydown=True, inlist=False))
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(asyncio.wait_for(menu.mainloop_async(surface, fps_limit=0), 5))
+        loop.close()
+        self.assertEqual(called, [True, True])
+        self.assertFalse(menu.is_enabled())
+        self.assertEqual(len(pygameMenu.utils._tasks), 0)  # Released when done
+
+    def test_stats(self):
+        """
+        Test the statistics of the frames.
+        """
+        self.assertRaises(AssertionError, lambda: self.menu.get_stats())
+        menu = PygameMenuUtils.generic_menu(title='mainmenu', stats=True)
+        menu.enable()
+        textinput = menu.add_text_input('text: ')
+        for i in range(5):
+            menu.add_button('button {0}'.format(i), events.NONE)
+        stats = menu.get_stats()
+        self.assertEqual(stats['frames'], 0)
+        self.assertEqual(stats['timings']['render']['max'], 0)
+
+        menu.draw(surface)
+        menu.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        menu.draw(surface)
+        stats = menu.get_stats()
+        self.assertEqual(stats['frames'], 2)
+        self.assertEqual(stats['counters']['layouts'], 1)
+        self.assertEqual(stats['counters']['surfaces'], 1)
+        self.assertEqual(stats['counters']['layout_updates'], 1)  # The text input is wider
+        self.assertGreaterEqual(stats['counters']['widgets_skipped'], 5)  # Buttons did not change
+        self.assertGreater(stats['counters']['widgets_rendered'], 0)
+        for phase in ('compositing', 'events', 'layout', 'render', 'scroll'):
+            self.assertGreaterEqual(stats['timings'][phase]['max'], stats['timings'][phase]['mean'])
+        self.assertGreater(stats['timings']['render']['mean'], 0)
+        self.assertEqual(textinput.get_value(), 'a')
+
+        menu.reset_stats()
+        self.assertEqual(menu.get_stats()['frames'], 0)
+        self.assertEqual(menu.get_stats()['counters']['layouts'], 0)
+
+    def test_filter_events(self):
+        """
+        Test the filter of the events before the update of the Menu.
+        """
+        events_list = [pygame.event.Event(pygame.MOUSEMOTION, {'pos': (1, 1), 'rel': (1, 1), 'buttons': (1, 0, 0)}),
+                       pygame.event.Event(pygame.ACTIVEEVENT, {'gain': 1, 'state': 1}),
+                       pygame.event.Event(pygame.MOUSEMOTION, {'pos': (3, 4), 'rel': (2, 3), 'buttons': (1, 0, 0)}),
+                       pygame.event.Event(pygame.MOUSEMOTION, {'pos': (6, 4), 'rel': (3, 0), 'buttons': (1, 0, 0)}),
+                       PygameUtils.mouse_click(6, 4, inlist=False, evtype=pygame.MOUSEBUTTONUP),
+                       pygame.event.Event(pygame.MOUSEMOTION, {'pos': (7, 4), 'rel': (1, 0), 'buttons': (0, 0, 0)})]
+        events_list = pygameMenu.Menu._filter_events(events_list)
+        self.assertEqual([e.type for e in events_list],
+                         [pygame.MOUSEMOTION, pygame.ACTIVEEVENT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP,
+                          pygame.MOUSEMOTION])
+        self.assertEqual(tuple(events_list[2].pos), (6, 4))
+        self.assertEqual(tuple(events_list[2].rel), (5, 3))
+        self.assertEqual(tuple(events_list[4].rel), (1, 0))
+
+        # The events not used by the Menu are given to the selected widget
+        menu = PygameMenuUtils.generic_menu()
+        button = menu.add_button('button', events.NONE)
+        received = []
+        button.update = lambda e: received.extend(e)
+        menu.update([pygame.event.Event(pygame.USEREVENT, {'code': 1})])
+        self.assertEqual([e.type for e in received], [pygame.USEREVENT])
+
+    def test_mouse_hit_test(self):
+        """
+        Test the selection of the widgets with the mouse.
+        """
+        menu = PygameMenuUtils.generic_menu(title='mainmenu', columns=2, rows=20, mouse_motion_selection=True)
+        menu.enable()
+        for i in range(39):
+            menu.add_button('button {0}'.format(i), events.NONE)
+        label = menu.add_label('label')
+        menu.draw(surface)
+
+        # Click on each widget within the viewable area
+        for index in range(39):
+            widget = menu._widgets[index]
+            menu._scroll.scroll_to_rect(widget.get_rect())
+            pos = PygameUtils.get_middle_rect(menu._scroll.to_real_position(widget.get_rect()))
+            menu.update(PygameUtils.mouse_click(pos[0], pos[1], evtype=pygame.MOUSEBUTTONDOWN))
+            self.assertEqual(menu.get_index(), index)
+            self.assertEqual(menu._get_widget_index_at(widget.get_rect().center), index)
+        self.assertEqual(menu._get_widget_index_at((-10, -10)), -1)
+
+        # Hover a widget, labels are not selectable
+        widget = menu._widgets[3]
+        menu._scroll.scroll_to_rect(widget.get_rect())
+        pos = PygameUtils.get_middle_rect(menu._scroll.to_real_position(widget.get_rect()))
+        menu.update(PygameUtils.mouse_click(pos[0], pos[1], evtype=pygame.MOUSEMOTION))
+        self.assertEqual(menu.get_index(), 3)
+        menu._scroll.scroll_to_rect(label.get_rect())
+        pos = PygameUtils.get_middle_rect(menu._scroll.to_real_position(label.get_rect()))
+        menu.update(PygameUtils.mouse_click(pos[0], pos[1], evtype=pygame.MOUSEMOTION))
+        self.assertEqual(menu.get_index(), 3)
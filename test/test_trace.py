@@ -0,0 +1,113 @@
+# coding=utf-8
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST TRACE
+Test the trace of the Menu frames.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2020 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+from test._utils import *
+
+import json
+import os
+import tempfile
+
+import pygameMenu.trace
+
+
+class TraceTest(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Stop the tracer.
+        """
+        pygameMenu.trace.stop_trace()
+
+    def test_trace(self):
+        """
+        Test the spans recorded while drawing a Menu.
+        """
+        path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        tracer = pygameMenu.trace.start_trace(path)
+        menu = PygameMenuUtils.generic_menu(title='mainmenu')
+        menu.enable()
+        menu.add_button('button', pygameMenu.events.NONE, button_id='button')
+        menu.update([])
+        menu.draw(surface)
+        names = [e['name'] for e in tracer.get_events()]
+        for name in ('Menu.update', 'Menu.draw', 'Menu._build_widget_surface', 'Button.draw', 'frame'):
+            self.assertIn(name, names)
+
+        # The spans are nested within the frame
+        events = dict((e['name'], e) for e in tracer.get_events())
+        self.assertLessEqual(events['frame']['ts'], events['Button.draw']['ts'])
+        self.assertLessEqual(events['Button.draw']['ts'] + events['Button.draw']['dur'],
+                             events['frame']['ts'] + events['frame']['dur'])
+        self.assertEqual(events['Button.draw']['args']['id'], 'button')
+
+        # The file is written when the trace stops
+        self.assertEqual(pygameMenu.trace.stop_trace(), tracer)
+        self.assertIsNone(pygameMenu.trace.tracer)
+        with open(path) as f:
+            self.assertEqual(len(json.load(f)['traceEvents']), len(names))
+
+    def test_slow_frame(self):
+        """
+        Test the slow-frame capture and the ring buffer.
+        """
+        tracer = pygameMenu.trace.start_trace(slow_frame_ms=50)
+        tracer.begin('fast', 'test')
+        tracer.end()
+        tracer.end_frame()
+        self.assertEqual(tracer.get_events(), [])
+        tracer.begin('slow', 'test')
+        pygame.time.wait(60)
+        tracer.end()
+        tracer.end_frame()
+        self.assertEqual([e['name'] for e in tracer.get_events()], ['slow', 'frame'])
+
+        tracer = pygameMenu.trace.start_trace(buffer_size=3)
+        for i in range(5):
+            tracer.begin(str(i), 'test')
+            tracer.end()
+        self.assertEqual([e['name'] for e in tracer.get_events()], ['2', '3', '4'])
+
+    def test_callback_stops_trace(self):
+        """
+        Test a callback that stops or restarts the trace.
+        """
+        tracer = pygameMenu.trace.start_trace()
+        button = PygameMenuUtils.generic_menu().add_button('stop', pygameMenu.trace.stop_trace)
+        button.apply()
+        self.assertIsNone(pygameMenu.trace.tracer)
+        self.assertEqual([e['name'] for e in tracer.get_events()], ['stop_trace'])
+
+        # The new tracer does not end the span of the callback
+        pygameMenu.trace.start_trace()
+        button = PygameMenuUtils.generic_menu().add_button('start', pygameMenu.trace.start_trace)
+        button.apply()
+        self.assertEqual(pygameMenu.trace.tracer.get_events(), [])
@@ -33,6 +33,10 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 from test._utils import *
 
 from pygameMenu import locals as _locals
+from pygameMenu.glyphatlas import enable_glyph_atlas
+from pygameMenu.widgets.widget import textinput as _textinput
+from pygameMenu.textbuffer import GapBuffer
+from pygameMenu.textcache import TEXT_CACHE
 from pygameMenu.widgets import ScrollBar, Label
 
 
@@ -85,6 +89,60 @@ class WidgetsTest(unittest.TestCase):
         self.assertEqual(selector.get_value()[1], 1)
         self.assertEqual(selector.get_value()[0], '5 - Medium')
 
+        # Elements appended in place are reachable
+        new_elements.append(('7 - Expert', 'EXPERT'))
+        selector.set_value('7 - Expert')
+        self.assertEqual(selector.get_value(), ('7 - Expert', 3))
+        selector.right()
+        self.assertEqual(selector.get_value()[1], 0)
+        selector.left()
+        self.assertEqual(selector.get_value()[1], 3)
+
+        # Elements with only a title are accepted by the update
+        selector.update_elements([('title only',)])
+        self.assertEqual(selector.get_value(), ('title only', 0))
+
+    def test_selector_provider(self):
+        """
+        Test the selector with elements given by a function.
+        """
+        requested = []
+        changes = []
+
+        def element(index):
+            requested.append(index)
+            return 'mode {0}'.format(index), index
+
+        def onchange(value, index):
+            changes.append(index)
+
+        selector = self.menu.add_selector('selector', (100000, element), default=500, onchange=onchange)
+        self.assertEqual(selector.get_value(), ('mode 500', 500))
+        self.assertEqual(changes, [])  # The default does not call onchange
+        self.assertEqual(set(requested), {500})  # Only the default element is requested
+        selector.right()
+        self.assertEqual(changes, [501])
+
+        # The rendered labels are kept
+        selector.draw(surface)
+        label = selector._surface
+        selector.left()
+        selector.right()
+        selector.draw(surface)
+        self.assertIs(selector._surface, label)
+
+        # Search by title
+        selector.set_value('mode 99999')
+        self.assertEqual(selector.get_value()[1], 99999)
+        self.assertRaises(ValueError, lambda: selector.set_value('mode'))
+
+        # The selected element is kept by the new elements
+        selector.set_value(3)
+        selector.update_elements([('mode {0}'.format(i), i) for i in range(10)])
+        self.assertEqual(selector.get_value(), ('mode 3', 3))
+        selector.update_elements([('mode 7', 7), ('mode 3', 3)])
+        self.assertEqual(selector.get_value(), ('mode 3', 1))
+
     # noinspection PyArgumentEqualDefault
     def test_colorinput(self):
         """
@@ -284,6 +342,46 @@ class WidgetsTest(unittest.TestCase):
         _w.draw(surface)
         self.assertFalse(_w.update([]))
 
+    def test_text_cache(self):
+        """
+        Test the cache of rendered texts.
+        """
+        cache = TEXT_CACHE
+        cache.clear()
+        label1 = self.menu.add_label('On')
+        label2 = self.menu.add_label('On')
+        label3 = self.menu.add_label('Off')
+        for label in (label1, label2, label3):
+            label.get_rect()  # Render
+        self.assertIs(label1._surface, label2._surface)
+        self.assertIsNot(label1._surface, label3._surface)
+        info = cache.get_info()
+        self.assertEqual(info['entries'], 2)
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['bytes'], sum(w._surface.get_pitch() * w._surface.get_height() for w in (label1, label3)))
+
+        # The least recently used surfaces are discarded
+        cache.set_max_bytes(info['bytes'] - 1)
+        self.assertEqual(cache.get_info()['entries'], 1)
+        self.assertIsNone(cache.get(('missing',)))
+        self.assertAlmostEqual(cache.get_info()['hit_ratio'], 1.0 / 4)
+        cache.set_max_bytes(8 * 1024 * 1024)
+        cache.clear()
+        self.assertEqual(cache.get_info()['bytes'], 0)
+
+    def test_render_empty_string(self):
+        """
+        Test the rendering of an empty text, with and without glyph atlas.
+        """
+        label = self.menu.add_label('')
+        font_name = label.get_font_info()['name']
+        for enabled in (False, True):
+            enable_glyph_atlas(font_name, enabled)
+            text = label._render_string('', (0, 0, 0))
+            self.assertGreater(text.get_width(), 0)
+            self.assertGreater(text.get_height(), 0)
+        enable_glyph_atlas(font_name, False)
+
     def test_textinput(self):
         """
         Test TextInput widget.
@@ -387,7 +485,7 @@ class WidgetsTest(unittest.TestCase):
         textinput.update(PygameUtils.keydown_mod_ctrl(pygame.K_c))  # copy
         textinput.update(PygameUtils.keydown_mod_ctrl(pygame.K_v))  # paste
         textinput.update(PygameUtils.keydown_mod_ctrl(pygame.K_z))  # undo
-        self.assertEqual(textinput.get_value(), 'tes')
+        self.assertEqual(textinput.get_value(), '')  # The typed chars are merged
         textinput.update(PygameUtils.keydown_mod_ctrl(pygame.K_y))  # redo
         self.assertEqual(textinput.get_value(), 'test')
         textinput.update(PygameUtils.keydown_mod_ctrl(pygame.K_x))  # cut
@@ -424,6 +522,230 @@ class WidgetsTest(unittest.TestCase):
         textinput._cursor_render = True
         textinput._render_cursor()
 
+    def test_textinput_history(self):
+        """
+        Test the text buffer and the history of editions of the text input.
+        """
+        buffer = GapBuffer('hello', gap=2)
+        buffer.insert(5, ' world')
+        buffer.insert(0, '>')
+        self.assertEqual(buffer.delete(1, 5), 'hello')
+        buffer.insert(1, 'bye')
+        self.assertEqual(buffer.get_text(), '>bye world')
+        self.assertEqual(buffer.get_text(2, 6), 'ye w')
+        self.assertEqual(len(buffer), 10)
+
+        # Consecutive keystrokes are merged, other editions are not
+        textinput = self.menu.add_text_input('title', history=3)
+        for char in 'abc':
+            textinput.update(PygameUtils.key(pygame.K_a, keydown=True, char=char))
+        textinput.update(PygameUtils.key(pygame.K_LEFT, keydown=True))
+        textinput.update(PygameUtils.key(pygame.K_BACKSPACE, keydown=True))
+        textinput.update(PygameUtils.key(pygame.K_BACKSPACE, keydown=True))
+        self.assertEqual(textinput.get_value(), 'c')
+        self.assertEqual(len(textinput._history), 2)
+        self.assertTrue(textinput._undo())
+        self.assertEqual(textinput.get_value(), 'abc')
+        self.assertEqual(textinput._cursor_position, 2)
+        self.assertTrue(textinput._undo())
+        self.assertEqual(textinput.get_value(), '')
+        self.assertFalse(textinput._undo())
+        self.assertTrue(textinput._redo())
+        self.assertTrue(textinput._redo())
+        self.assertEqual(textinput.get_value(), 'c')
+        self.assertEqual(textinput._cursor_position, 0)
+        self.assertFalse(textinput._redo())
+
+        # The history is bounded
+        for value in ('d', 'e', 'f', 'g'):
+            textinput.set_value(value)
+        self.assertEqual(len(textinput._history), 3)
+        while textinput._undo():
+            pass
+        self.assertEqual(textinput.get_value(), 'd')
+
+    def test_textinput_paste(self):
+        """
+        Test the paste of a long text.
+        """
+        clipboard = _textinput._get_clipboard()
+        clipboard_functions = list(clipboard)
+        text = '\t{"token": "' + 'ab1\n' * 1250 + '"}\r\n'
+        clipboard[1] = lambda: text
+        try:
+            textinput = self.menu.add_text_input('title', maxwidth=10)
+            textinput.set_value('[]')
+            textinput._cursor_position = 1
+            self.assertTrue(textinput._paste())
+            self.assertEqual(textinput.get_value(), '[{"token": "' + 'ab1' * 1250 + '"}]')
+            self.assertEqual(textinput._cursor_position, len(textinput.get_value()) - 1)
+            self.assertEqual(textinput._renderbox[0] + textinput._renderbox[2], textinput._cursor_position)
+            self.assertGreaterEqual(textinput._renderbox[1], textinput._cursor_position)
+            textinput.draw(surface)
+            textinput._undo()
+            self.assertEqual(textinput.get_value(), '[]')
+
+            # Invalid chars are removed
+            textinput = self.menu.add_text_input('title', valid_chars=['a', 'b'])
+            self.assertTrue(textinput._paste())
+            self.assertEqual(textinput.get_value(), 'ab' * 1250)
+            self.assertEqual(textinput._cursor_position, 2500)
+        finally:
+            clipboard[:] = clipboard_functions
+
+    def test_textinput_layers(self):
+        """
+        Test that only the changed layers of the text input are rendered again.
+        """
+        textinput = self.menu.add_text_input('title: ', input_underline='_')
+        textinput.set_value('hello')
+        textinput.set_selected()
+        textinput.draw(surface)
+        label = textinput._layers['label'][1]
+        text = textinput._layers['text'][1]
+        underline = textinput._layers['underline'][1]
+        composed = textinput._surface
+
+        # A keystroke renders only the text
+        textinput.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        textinput.draw(surface)
+        self.assertEqual(textinput.get_value(), 'helloa')
+        self.assertIs(textinput._layers['label'][1], label)
+        self.assertIs(textinput._layers['underline'][1], underline)
+        self.assertIsNot(textinput._layers['text'][1], text)
+        self.assertIs(textinput._surface, composed)
+
+        # A cursor move renders no layer
+        text = textinput._layers['text'][1]
+        version = textinput._layers_version
+        textinput.update(PygameUtils.key(pygame.K_LEFT, keydown=True))
+        textinput.draw(surface)
+        self.assertIs(textinput._layers['text'][1], text)
+        self.assertEqual(textinput._layers_version, version)
+
+    def test_textinput_mouse(self):
+        """
+        Test the cursor position of a click in the text.
+        """
+        textinput = self.menu.add_text_input('title: ')
+        textinput.set_value('hello world')
+        textinput.draw(surface)
+        font = textinput._font
+        for i in range(len('hello world')):
+            left = font.size('title: ' + 'hello world'[:i])[0]
+            right = font.size('title: ' + 'hello world'[:i + 1])[0]
+            textinput._update_cursor_mouse(left + 1)
+            self.assertEqual(textinput._cursor_position, i)
+            textinput._update_cursor_mouse(right - 1)
+            self.assertEqual(textinput._cursor_position, i + 1)
+        textinput._update_cursor_mouse(0)
+        self.assertEqual(textinput._cursor_position, 0)
+        textinput._update_cursor_mouse(1000)
+        self.assertEqual(textinput._cursor_position, 11)
+
+        # Scrolled text with ellipsis, the position is relative to the renderbox
+        textinput = self.menu.add_text_input('title: ', maxwidth=10)
+        textinput.set_value('the size of this textinput is way greater than the limit')
+        textinput.draw(surface)
+        start = textinput._renderbox[0]
+        self.assertGreater(start, 0)
+        x = textinput._ellipsis_size + textinput._get_input_width(2) + 1
+        textinput._update_cursor_mouse(x)
+        self.assertEqual(textinput._cursor_position, start + 2)
+
+        # Click on the left ellipsis moves the cursor to the left
+        textinput._update_cursor_mouse(textinput._label_size + 1)
+        self.assertEqual(textinput._cursor_position, start + 1)
+
+        # The widths are composed once per edit, not on each probe of the search
+        textinput._update_cursor_mouse(x)
+        calls = []
+        set_text = textinput._input_widths.set_text
+        textinput._input_widths.set_text = lambda text: calls.append(text) or set_text(text)
+        textinput._update_cursor_mouse(x)
+        textinput._update_cursor_mouse(x + 10)
+        self.assertEqual(calls, [])
+        textinput._buffer.insert(0, 'a')
+        textinput._update_cursor_mouse(x)
+        self.assertEqual(len(calls), 1)
+
+    def test_textarea(self):
+        """
+        Test the multi-line text input.
+        """
+        textarea = self.menu.add_text_area('notes: ', default='hello world, this text is wrapped\nsecond',
+                                           width=100, lines=3)
+
+        def lines():
+            return [textarea._get_line_text(i) for i in range(len(textarea._line_starts))]
+
+        def check_wrap():
+            starts, ends = textarea._wrap_text(0, len(textarea._buffer))
+            self.assertEqual(textarea._line_starts, starts)
+            self.assertEqual(textarea._line_ends, ends)
+
+        self.assertGreater(len(lines()), 3)
+        self.assertEqual(''.join(lines()), 'hello world, this text is wrappedsecond')
+        self.assertEqual(lines()[0], 'hello ')
+        for line in lines():
+            self.assertLessEqual(textarea._font.size(line.rstrip())[0], 100)
+
+        # Only the lines of the viewport are rendered, around the cursor
+        textarea.draw(surface)
+        self.assertEqual(textarea._top_line, len(lines()) - 3)
+        self.assertLessEqual(len(textarea._line_surfaces), 3)
+        self.assertEqual(textarea.get_rect().height, 3 * textarea._font.get_linesize())
+
+        # Return inserts a line break, and the edited paragraph is wrapped again
+        textarea.update(PygameUtils.key(pygame.K_RETURN, keydown=True, char='\r'))
+        textarea.update(PygameUtils.key(pygame.K_a, keydown=True, char='a'))
+        self.assertEqual(textarea.get_value(), 'hello world, this text is wrapped\nsecond\na')
+        check_wrap()
+        textarea._cursor_position = 3
+        textarea._push_key_input('x' * 30, sounds=False)
+        check_wrap()
+        textarea._undo()
+        check_wrap()
+        self.assertEqual(textarea.get_value(), 'hello world, this text is wrapped\nsecond\na')
+
+        # Up and down keep the position in the line
+        textarea._cursor_position = len(textarea.get_value())
+        textarea.update(PygameUtils.key(pygame.K_UP, keydown=True))
+        self.assertEqual(textarea._get_line(textarea._cursor_position), len(lines()) - 2)
+        self.assertEqual(textarea._cursor_position, textarea._line_starts[-2] + 1)  # Width of 'a'
+        textarea.update(PygameUtils.key(pygame.K_HOME, keydown=True))
+        self.assertEqual(textarea._cursor_position, textarea._line_starts[-2])
+        textarea.update(PygameUtils.key(pygame.K_END, keydown=True))
+        textarea.update(PygameUtils.key(pygame.K_DOWN, keydown=True))
+        self.assertEqual(textarea._cursor_position, len('hello world, this text is wrapped\nsecond\na'))
+        self.assertFalse(textarea.update(PygameUtils.key(pygame.K_DOWN, keydown=True)))  # Last line
+
+        # The selection is removed in one edition
+        textarea._select_all()
+        textarea.draw(surface)
+        self.assertIsNotNone(textarea._selection_surface)
+        textarea.update(PygameUtils.key(pygame.K_BACKSPACE, keydown=True))
+        self.assertEqual(textarea.get_value(), '')
+        self.assertEqual(lines(), [''])
+
+        # Ctrl+Return applies the widget
+        values = []
+        textarea._on_return = values.append
+        textarea.set_value('text')
+        textarea.update(PygameUtils.keydown_mod_ctrl(pygame.K_RETURN))
+        self.assertEqual(values, ['text'])
+
+        # Long documents
+        text = ('lorem ipsum dolor sit amet ' * 40 + '\n') * 100
+        textarea.set_value(text)
+        check_wrap()
+        textarea._cursor_position = 5000
+        textarea._push_key_input('x', sounds=False)
+        textarea._backspace()
+        check_wrap()
+        textarea.draw(surface)
+        self.assertLessEqual(len(textarea._line_surfaces), 3)
+
     def test_vmargin(self):
         """
         Test vertical margin widget.